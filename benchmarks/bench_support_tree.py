@@ -0,0 +1,63 @@
+"""Support tree construction: connected_parts per hyperedge vs. maximum cardinality search.
+
+Usage: python benchmarks/bench_support_tree.py
+"""
+
+import random
+import time
+
+from tbs.binary_hypergraph import HyperGraph
+from tbs.graph import Graph, connected_parts, random_tree
+
+
+def legacy_support_tree(hypergraph):
+    """Former HyperGraph.support_tree: connected parts of the growing tree for each hyperedge."""
+
+    h_edges = sorted(hypergraph.hyper_edges, key=len)
+    support_tree = Graph(hypergraph.vertices)
+
+    for h_edge in h_edges:
+        kruskal = list(connected_parts(support_tree, vertex_subset=h_edge))
+        for i in range(len(kruskal) - 1):
+            support_tree.update([(next(iter(kruskal[i])), next(iter(kruskal[i + 1])))], node_creation=False)
+
+    return support_tree
+
+
+def random_hypertree(n, nb_edges, rng):
+    """Hypertree whose hyperedges are random subtrees (paths of a random depth first walk) of a random tree."""
+
+    tree = random_tree(list(range(n)))
+    hypergraph = HyperGraph(range(n), [frozenset(range(n))])
+
+    for i in range(nb_edges):
+        subtree = [rng.randrange(n)]
+        seen = set(subtree)
+        for j in range(rng.randint(0, 20)):
+            neighbors = [y for y in tree(subtree[rng.randrange(len(subtree))]) if y not in seen]
+            if neighbors:
+                y = neighbors[rng.randrange(len(neighbors))]
+                seen.add(y)
+                subtree.append(y)
+        if frozenset(subtree) not in hypergraph.hyper_edges:
+            hypergraph.add_edge(frozenset(subtree))
+
+    return hypergraph
+
+
+def timing(f, *args):
+    start = time.perf_counter()
+    f(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    random.seed(0)
+
+    print("%8s %10s %12s %12s" % ("vertices", "hyperedges", "legacy (s)", "mcs (s)"))
+    for n in (250, 500, 1000, 2000, 4000):
+        hypergraph = random_hypertree(n, 2 * n, rng)
+        print("%8d %10d %12.3f %12.3f" % (n, len(hypergraph.hyper_edges),
+                                          timing(legacy_support_tree, hypergraph),
+                                          timing(HyperGraph.support_tree, hypergraph)))
@@ -10,15 +10,21 @@ Module content
 
 """
 
+from ._bitset import Bitset, GroundSet
+from ._merge_forest import MergeForest
 from ._mixed_tree import BinaryMixedTree, MixedGraph, DIRECTED_EDGE, UNDIRECTED_EDGE
 from ._hypergraph import HyperGraph
 from ._algo1_functions import s_0
-from ._basic_tree_construction import BasicTreeConstruction
+from ._construction_sequence import ConstructionSequence
+from ._basic_tree_construction import BasicTreeConstruction, StepDelta
 from ._strategy_algo1 import StratAlgo1
 from ._strategy_algo3 import StratAlgo3
+from ._monte_carlo import run_many
 
 __author__ = "maxime"
 
 __all__ = ['BinaryMixedTree', 'HyperGraph', 'BasicTreeConstruction',
            'MixedGraph', 'UNDIRECTED_EDGE', 'DIRECTED_EDGE',
-           's_0', 'StratAlgo1', 'StratAlgo3']
+           's_0', 'StratAlgo1', 'StratAlgo3',
+           'Bitset', 'GroundSet', 'MergeForest', 'StepDelta',
+           'ConstructionSequence', 'run_many']
@@ -1,11 +1,15 @@
-from random import randint
+import random
 
 from tbs.graph import random_tree
 
+from ._bitset import Bitset
+
 
 def s_0(mixed_tree):
     """The map for the initial mixed tree, which is the identity function.
 
+    A vertex encoded as a :class:`Bitset` is its own image.
+
     Args:
         mixed_tree (BinaryMixedTree): a consistent mixed tree
 
@@ -15,43 +19,46 @@ def s_0(mixed_tree):
     identity_func = dict()
 
     for vertex in mixed_tree:
-        identity_func[vertex] = {vertex}
+        if isinstance(vertex, Bitset):
+            identity_func[vertex] = vertex
+        else:
+            identity_func[vertex] = {vertex}
 
     return identity_func
 
 
-def random_subset(intial_set):
-    subset = set()
+def random_subset(intial_set, rng=random):
+    """Uniform random subset, each element is kept with probability 1/2.
 
-    for element in intial_set:
-        if randint(0, 1) == 1:
-            subset.add(element)
+    The membership of all the elements is drawn in a single call to *rng*.
+
+    Args:
+        intial_set (iterable): the set.
+        rng: random number generator (:class:`random.Random` or the :mod:`random` module).
+
+    Returns:
+        subset (set)
+    """
+    elements = list(intial_set)
+    bits = rng.getrandbits(len(elements)) if elements else 0
 
-    return subset
+    return {element for i, element in enumerate(elements) if bits >> i & 1}
 
 
-def edge_choice_for_algo1(algo3):
+def edge_choice_for_algo1(algo3, rng=random):
     mixed_tree = algo3.mixed_tree
 
-    verify_line2 = []
-    undirected, directed = mixed_tree.edges
-    for edge in undirected:
-        xy = list(edge)
-        if mixed_tree(xy[0], undirected=False, begin=False, end=True) == frozenset() and mixed_tree(xy[1],
-                                                                                                    undirected=False,
-                                                                                                    begin=False,
-                                                                                                    end=True) == frozenset():
-            verify_line2.append(frozenset(xy))
+    verify_line2 = mixed_tree.free_undirected_edges
 
     if len(verify_line2) == 0:
         raise ValueError("Non consistent mixed tree")
     else:
-        k = randint(0, len(verify_line2) - 1)
+        k = rng.randrange(len(verify_line2))
         return verify_line2[k]
 
 
-def directed_neighborhood_random_tree_edges(algo3, vertex):
+def directed_neighborhood_random_tree_edges(algo3, vertex, rng=random):
     mixed_tree = algo3.mixed_tree
     delta_plus = mixed_tree(vertex, undirected=False, begin=True, end=False, closed=False)
-    tree = random_tree(list(delta_plus))
+    tree = random_tree(list(delta_plus), rng)
     return tree.edges
@@ -40,12 +40,11 @@ def edge_choice_for_algo3(algo3):
     maps = algo3.maps
     tb_hypergraph = algo3.tb_hypergraph
 
-    homogeneous_set = mixed_tree.homogeneous_subset()
-    edges_list = edges_in_homogeneous_subset(mixed_tree, homogeneous_set)
+    edges_list = mixed_tree.homogeneous_edges()
 
     sups = dict()
     for i, (x, y) in enumerate(edges_list):
-        sup = supremum(maps[x], maps[y], tb_hypergraph.hyper_edges)
+        sup = tb_hypergraph.supremum(maps[x], maps[y])
 
         if sup not in sups.keys():
             sups[sup] = {i}
@@ -63,7 +62,7 @@ def delta_z_subset_algo3(algo3, delta_z, v_xy, z):
 
     delta_z_2 = set()
     for t in delta_z:
-        if next_map[v_xy].issubset(supremum(next_map[z], next_map[t], tb_hypergraph.hyper_edges)):
+        if next_map[v_xy].issubset(tb_hypergraph.supremum(next_map[z], next_map[t])):
             delta_z_2.add(t)
 
     return delta_z_2
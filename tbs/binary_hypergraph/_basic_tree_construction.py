@@ -1,5 +1,37 @@
+from collections import namedtuple
+
 from tbs.binary_hypergraph import BinaryMixedTree, HyperGraph, UNDIRECTED_EDGE, s_0, MixedGraph
 
+from ._construction_sequence import ConstructionSequence
+
+
+class StepDelta(namedtuple("StepDelta", ["x", "y", "v_xy", "moves"])):
+    """Modifications made by a step of :class:`BasicTreeConstruction`.
+
+    *x* and *y* are merged into *v_xy*. Then for each *z* in {x, y}, *moves* contains a triple
+    (z, moved, tree_edges): the undirected neighbors *moved* of *z* are moved to *v_xy* and, if *tree_edges* is not
+    None, these undirected edges are added and *z* is removed.
+    """
+
+    __slots__ = ()
+
+    def apply(self, mixed_tree, maps):
+        """Redo the step on *mixed_tree* and *maps* (both are modified).
+
+        Args:
+            mixed_tree (BinaryMixedTree): the mixed tree before the step.
+            maps (dict): its associated map.
+        """
+
+        mixed_tree.add_union(self.x, self.y, new_name=self.v_xy)
+        maps[self.v_xy] = maps[self.x].union(maps[self.y])
+
+        for z, moved, tree_edges in self.moves:
+            mixed_tree.move_undirected_from_to(z, self.v_xy, moved)
+            if tree_edges is not None:
+                mixed_tree.update(UNDIRECTED_EDGE, tree_edges, node_creation=False)
+                mixed_tree.remove(z)
+
 
 class BasicTreeConstruction(object):
     """Class for the algorithms 1-4.
@@ -36,53 +68,115 @@ class BasicTreeConstruction(object):
                 Raises:
                     ValueError: if the condition of line 2 of algorithm 1 can't be satisfied (which means the mixed tree isn't consistent)
                 """
+        next_algo3 = BasicTreeConstruction(self.mixed_tree.copy(), dict(self.maps), self.tb_hypergraph)
+        next_algo3.step_in_place(strategy)
+
+        return next_algo3.mixed_tree, next_algo3.maps
+
+    def step_in_place(self, strategy):
+        """Same as :meth:`step` but `self.mixed_tree` and `self.maps` are modified instead of copied.
+
+        Args:
+            strategy: a list of the functions needed, depending on which algorithm we want to execute (1 or 3)
+
+        Returns:
+            delta (StepDelta): the modifications made.
+
+        Raises:
+            ValueError: if the condition of line 2 of algorithm 1 can't be satisfied (which means the mixed tree isn't consistent)
+        """
         strategy.algo = self
-        next_mixed_tree = self.mixed_tree.copy()
-        next_map = dict(self.maps)
+        mixed_tree = self.mixed_tree
 
         x, y = strategy.edge_choice()
-        v_xy = next_mixed_tree.add_union(x, y)
-        next_map[v_xy] = next_map[x].union(next_map[y])
-
-        next_algo3 = BasicTreeConstruction(next_mixed_tree, next_map, self.tb_hypergraph)
-        strategy.algo = next_algo3
+        v_xy = mixed_tree.add_union(x, y)
+        self.maps[v_xy] = self.maps[x].union(self.maps[y])
 
+        moves = []
         for z in {x, y}:
-            delta_z = next_mixed_tree(z, undirected=True, begin=False, end=False, closed=False)
+            delta_z = mixed_tree(z, undirected=True, begin=False, end=False, closed=False)
             delta_z_random_subset = strategy.delta_z_subset(delta_z, v_xy, z)
 
-            next_mixed_tree.move_undirected_from_to(z, v_xy, delta_z_random_subset)
+            mixed_tree.move_undirected_from_to(z, v_xy, delta_z_random_subset)
 
+            random_delta_z_tree_edges = None
             if delta_z == delta_z_random_subset:
-                random_delta_z_tree_edges = strategy.neighborhood_tree(z)
+                random_delta_z_tree_edges = frozenset(strategy.neighborhood_tree(z))
+
+                mixed_tree.update(UNDIRECTED_EDGE, random_delta_z_tree_edges, node_creation=False)
+                mixed_tree.remove(z)
+
+            moves.append((z, frozenset(delta_z_random_subset), random_delta_z_tree_edges))
 
-                next_mixed_tree.update(UNDIRECTED_EDGE, random_delta_z_tree_edges, node_creation=False)
-                next_mixed_tree.remove(z)
+        return StepDelta(x, y, v_xy, tuple(moves))
 
-        return next_mixed_tree, next_map
+    def iter_tree_sequence(self, strategy, deltas=False):
+        """Iterate over the sequence of :meth:`tree_sequence`, each step being yielded as soon as it is computed.
+
+        In *deltas* mode, only the modifications of each step are yielded: the mixed tree is modified in place
+        (`self.mixed_tree` is left unchanged, a copy is used) and the maps of removed vertices are discarded, so
+        memory stays proportional to a single mixed tree. The sequence can be rebuilt from `self.mixed_tree` and
+        :func:`s_0` with :meth:`StepDelta.apply`.
+
+        Args:
+            strategy: a list of the functions needed, depending on which algorithm we want to execute (2 or 4)
+            deltas (bool): if True yield a :class:`StepDelta` for each step, otherwise yield (T_i, S_i) starting
+                with (T_0, S_0).
+        """
+        strategy.algo = self
+
+        current_tree = self.mixed_tree
+        current_map = s_0(current_tree)
+
+        self.maps = current_map
+
+        if deltas:
+            algo = BasicTreeConstruction(current_tree.copy(), dict(current_map), self.tb_hypergraph)
+            while len(algo.mixed_tree) > 1:
+                delta = algo.step_in_place(strategy)
+                for z, moved, tree_edges in delta.moves:
+                    if tree_edges is not None:
+                        del algo.maps[z]
+                yield delta
+            return
+
+        yield current_tree, current_map
+
+        algo = self
+        while len(current_tree) > 1:
+            current_tree, current_map = algo.step(strategy)
+            yield current_tree, current_map
+            algo = BasicTreeConstruction(current_tree, current_map, self.tb_hypergraph)
 
     def tree_sequence(self, strategy):
         """Create a sequence of mixed trees with associated maps. Depending on the given strategy,
             the algorithm 2 or 4 will be computed. The given tree `self.mixed_tree` must be *consistent*
             and have only *undirected* edges.
 
+            Each step copies the top-level maps of the previous tree (see :meth:`BinaryMixedTree.copy`), so the
+            whole sequence takes time quadratic in the number of vertices. The *deltas* mode of
+            :meth:`iter_tree_sequence` modifies a single tree in place and is the linear option
+            (:meth:`construction_sequence` only adds a copy every *checkpoint_interval* steps).
+
             Args:
                 strategy: a list of the functions needed, depending on which algorithm we want to execute (2 or 4)
 
             Returns:
                 seq (list): a sequence ((T_0, S_0), ..., (T_i, S_i)...) of mixed trees and there maps
             """
-        strategy.algo = self
 
-        current_tree = self.mixed_tree
-        current_map = s_0(current_tree)
+        return list(self.iter_tree_sequence(strategy))
 
-        self.maps = current_map
+    def construction_sequence(self, strategy, checkpoint_interval=32):
+        """Same sequence as :meth:`tree_sequence`, stored as a :class:`ConstructionSequence`.
 
-        seq = [(current_tree, current_map)]
+        Args:
+            strategy: a list of the functions needed, depending on which algorithm we want to execute (2 or 4)
+            checkpoint_interval (int): number of steps between two stored snapshots.
 
-        while len(current_tree) > 1:
-            current_tree, current_map = self.step(strategy)
-            seq.append((current_tree, current_map))
+        Returns:
+            seq (ConstructionSequence): a sequence ((T_0, S_0), ..., (T_i, S_i)...) of mixed trees and there maps
+        """
 
-        return seq
+        return ConstructionSequence(self.mixed_tree, s_0(self.mixed_tree),
+                                    self.iter_tree_sequence(strategy, deltas=True), checkpoint_interval)
@@ -0,0 +1,186 @@
+class Bitset(int):
+    """Set of numbered elements encoded as the bits of an integer.
+
+    Element number *i* is the singleton ``Bitset(1 << i)``, and a set is the union (bitwise or) of its singletons.
+    Bitsets have the set methods used throughout the module (:meth:`issubset`, :meth:`union`,
+    :meth:`intersection`, :meth:`difference`, iteration, `in` and `len`), so they can replace frozensets of
+    singletons: set operations are single integer operations.
+
+    Comparison operators are those of :class:`int`, use :meth:`issubset` for inclusion.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def _bits(other):
+        if isinstance(other, int):
+            return other
+
+        bits = 0
+        for x in other:
+            bits |= x
+        return bits
+
+    def __repr__(self):
+        return "Bitset(%s)" % bin(self)
+
+    def __iter__(self):
+        """Iteration over the singletons."""
+
+        bits = int(self)
+        while bits:
+            low = bits & -bits
+            yield Bitset(low)
+            bits ^= low
+
+    def __len__(self):
+        """Number of elements."""
+
+        return bin(self).count("1")
+
+    def __contains__(self, x):
+        """is *x* a singleton (or a subset) of the set"""
+
+        return x & self == x
+
+    def __or__(self, other):
+        return Bitset(int(self) | other)
+
+    __ror__ = __or__
+
+    def __and__(self, other):
+        return Bitset(int(self) & other)
+
+    __rand__ = __and__
+
+    def __xor__(self, other):
+        return Bitset(int(self) ^ other)
+
+    __rxor__ = __xor__
+
+    def __sub__(self, other):
+        """Set difference."""
+
+        return Bitset(int(self) & ~other)
+
+    def issubset(self, other):
+        return int(self) & ~self._bits(other) == 0
+
+    def issuperset(self, other):
+        other = self._bits(other)
+        return other & ~int(self) == 0
+
+    def isdisjoint(self, other):
+        return int(self) & self._bits(other) == 0
+
+    def union(self, *others):
+        bits = int(self)
+        for other in others:
+            bits |= self._bits(other)
+        return Bitset(bits)
+
+    def intersection(self, *others):
+        bits = int(self)
+        for other in others:
+            bits &= self._bits(other)
+        return Bitset(bits)
+
+    def difference(self, *others):
+        bits = int(self)
+        for other in others:
+            bits &= ~self._bits(other)
+        return Bitset(bits)
+
+
+class GroundSet(object):
+    """Numbering of ground elements, to encode their subsets as :class:`Bitset`.
+    """
+
+    def __init__(self, elements=tuple()):
+        """A ground set.
+
+        Args:
+            elements (iterable): each element must be *hashable*. They are numbered in iteration order.
+        """
+
+        self._elements = []
+        self._index = dict()
+
+        for x in elements:
+            self.add(x)
+
+    def __len__(self):
+        """Number of elements."""
+
+        return len(self._elements)
+
+    def __iter__(self):
+        """Iteration over the elements, by number."""
+
+        return iter(self._elements)
+
+    def __contains__(self, x):
+        """is an element"""
+
+        return x in self._index
+
+    def add(self, x):
+        """Add element *x*.
+
+        Args:
+            x(hashable): new element to add.
+        Raises:
+            ValueError: if *x* is already an element.
+
+        Returns(Bitset): the singleton of *x*.
+        """
+
+        if x in self._index:
+            raise ValueError("Already an element")
+
+        self._index[x] = len(self._elements)
+        self._elements.append(x)
+
+        return self.singleton(x)
+
+    def singleton(self, x):
+        """Bitset of {x}.
+
+        Raises:
+            ValueError: if *x* is not an element.
+        """
+
+        if x not in self._index:
+            raise ValueError("Not an element")
+
+        return Bitset(1 << self._index[x])
+
+    def encode(self, subset):
+        """Bitset of *subset*.
+
+        Args:
+            subset(iterable): elements of the ground set.
+        Raises:
+            ValueError: if an element of *subset* is not an element of the ground set.
+        """
+
+        bits = 0
+        for x in subset:
+            bits |= self.singleton(x)
+
+        return Bitset(bits)
+
+    def decode(self, bitset):
+        """Elements of *bitset*.
+
+        Returns(frozenset): the elements of the ground set whose bits are set.
+        """
+
+        bits = int(bitset)
+        subset = []
+        while bits:
+            low = bits & -bits
+            subset.append(self._elements[low.bit_length() - 1])
+            bits ^= low
+
+        return frozenset(subset)
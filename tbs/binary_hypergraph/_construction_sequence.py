@@ -0,0 +1,98 @@
+class ConstructionSequence(object):
+    """Sequence ((T_0, S_0), ..., (T_i, S_i), ...) of a tree construction stored as step deltas.
+
+    Only (T_0, S_0), the :class:`StepDelta` of each step and a snapshot every *checkpoint_interval* steps are
+    kept. (T_i, S_i) is rebuilt on demand by replaying the deltas from the nearest checkpoint before *i*, so at
+    most *checkpoint_interval* - 1 steps are replayed.
+    """
+
+    def __init__(self, mixed_tree, maps, deltas=tuple(), checkpoint_interval=32):
+        """A sequence starting at (mixed_tree, maps).
+
+        Args:
+            mixed_tree (BinaryMixedTree): T_0, it is copied.
+            maps (dict): S_0, it is copied.
+            deltas (iterable): the :class:`StepDelta` of the steps.
+            checkpoint_interval (int): number of steps between two snapshots. None for no other snapshot than T_0.
+
+        Raises:
+            ValueError: if *checkpoint_interval* is not positive.
+        """
+
+        if checkpoint_interval is not None and checkpoint_interval <= 0:
+            raise ValueError("Checkpoint interval must be positive")
+
+        self._checkpoint_interval = checkpoint_interval
+        self._deltas = []
+        self._checkpoints = [(mixed_tree.copy(), dict(maps))]
+
+        self._last_tree = mixed_tree.copy()
+        self._last_maps = dict(maps)
+
+        for delta in deltas:
+            self.append(delta)
+
+    @property
+    def checkpoint_interval(self):
+        return self._checkpoint_interval
+
+    @property
+    def deltas(self):
+        """The deltas of the steps (read-only)."""
+
+        return tuple(self._deltas)
+
+    def append(self, delta):
+        """Add the next step.
+
+        Args:
+            delta (StepDelta): the modifications of the step.
+        """
+
+        delta.apply(self._last_tree, self._last_maps)
+        self._deltas.append(delta)
+
+        if self._checkpoint_interval is not None and len(self._deltas) % self._checkpoint_interval == 0:
+            self._checkpoints.append((self._last_tree.copy(), dict(self._last_maps)))
+
+    def __len__(self):
+        """Number of mixed trees."""
+
+        return len(self._deltas) + 1
+
+    def __getitem__(self, i):
+        """(T_i, S_i), a new copy at each call.
+
+        Raises:
+            IndexError: if *i* is out of range.
+        """
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Sequence index out of range")
+
+        if self._checkpoint_interval is None:
+            checkpoint = 0
+        else:
+            checkpoint = i // self._checkpoint_interval
+
+        tree, maps = self._checkpoints[checkpoint]
+        tree, maps = tree.copy(), dict(maps)
+
+        start = 0 if self._checkpoint_interval is None else checkpoint * self._checkpoint_interval
+        for delta in self._deltas[start:i]:
+            delta.apply(tree, maps)
+
+        return tree, maps
+
+    def __iter__(self):
+        """Iteration over the (T_i, S_i), each step is replayed once."""
+
+        tree, maps = self._checkpoints[0]
+        tree, maps = tree.copy(), dict(maps)
+
+        yield tree.copy(), dict(maps)
+        for delta in self._deltas:
+            delta.apply(tree, maps)
+            yield tree.copy(), dict(maps)
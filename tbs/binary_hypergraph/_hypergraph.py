@@ -1,13 +1,36 @@
-from tbs.graph import Graph, connected_parts
+from bisect import insort
+from collections import OrderedDict, namedtuple
+
+from tbs.graph import Graph
+
+from ._bitset import Bitset
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
 
 class HyperGraph:
     """Class for hypergraphs where a hyperedge is a subset of the vertices set.
     """
 
-    def __init__(self, vertices=frozenset(), hyper_edges=frozenset()):
-        self._vertices = frozenset()
-        self._hyper_edges = frozenset()
+    def __init__(self, vertices=frozenset(), hyper_edges=frozenset(), supremum_cache_size=4096):
+        """A hypergraph.
+
+        Args:
+            vertices(iterable): each vertex must be *hashable*.
+            hyper_edges(iterable): each hyperedge is a *hashable* set of vertices.
+            supremum_cache_size(int): maximal number of suprema kept by :meth:`supremum` (least recently used are
+                discarded first). None for an unbounded cache, 0 to disable it.
+        """
+
+        self._vertices = dict()  # vertex index, keys are the vertices
+        self._hyper_edges = dict()  # hyperedge index, keys are the hyperedges
+        self._by_size = []  # (size, rank, hyperedge) sorted list of all the hyperedges
+        self._containing = dict()  # element -> (size, rank, hyperedge) sorted list of the hyperedges containing it
+
+        self._supremum_cache = OrderedDict()  # union of the two sets -> supremum, most recently used last
+        self._supremum_cache_size = supremum_cache_size
+        self._hits = 0
+        self._misses = 0
 
         for x in vertices:
             self.add(x)
@@ -17,13 +40,15 @@ class HyperGraph:
 
     @property
     def vertices(self):
-        """Vertex set."""
+        """Vertex set (read-only view, see :attr:`MixedGraph.vertices`)."""
 
-        return self._vertices
+        return self._vertices.keys()
 
     @property
     def hyper_edges(self):
-        return self._hyper_edges
+        """Hyperedge set (read-only view)."""
+
+        return self._hyper_edges.keys()
 
     def add(self, x):
         """Add vertex *x*.
@@ -37,7 +62,23 @@ class HyperGraph:
         if x in self.vertices:
             raise ValueError("Already a vertex")
 
-        self._vertices = self._vertices.union([x])
+        self._vertices[x] = None
+
+    def add_vertices(self, vertices):
+        """Add vertices.
+
+        Args:
+            vertices(iterable): new vertices to add.
+        Raises:
+            ValueError: if a vertex is already in the hypergraph or is given twice. No vertex is added.
+        """
+
+        vertices = list(vertices)
+        if len(set(vertices)) != len(vertices) or any(x in self._vertices for x in vertices):
+            raise ValueError("Already a vertex")
+
+        for x in vertices:
+            self._vertices[x] = None
 
     def add_edge(self, edge):
         """Add hyperedge *edge*.
@@ -49,7 +90,87 @@ class HyperGraph:
         """
         if edge in self.hyper_edges:
             raise ValueError("Already a hyperedge")
-        self._hyper_edges = self._hyper_edges.union([edge])
+        self._hyper_edges[edge] = None
+
+        self._supremum_cache.clear()
+
+        entry = (len(edge), len(self._by_size), edge)
+        insort(self._by_size, entry)
+        for x in edge:
+            insort(self._containing.setdefault(x, []), entry)
+
+    def smallest_containing(self, subset):
+        """Smallest hyperedge containing *subset*.
+
+        Only the hyperedges containing the rarest element of *subset* are scanned, by increasing size. Ties
+        are broken by insertion order.
+
+        Args:
+            subset(iterable): a set of vertices.
+        Raises:
+            ValueError: if no hyperedge contains *subset*.
+
+        Returns:
+            the smallest hyperedge containing *subset*.
+        """
+
+        candidates = self._by_size
+        for x in subset:
+            postings = self._containing.get(x, [])
+            if len(postings) < len(candidates) or candidates is self._by_size:
+                candidates = postings
+
+        for size, rank, edge in candidates:
+            if subset.issubset(edge):
+                return edge
+
+        raise ValueError("No hyperedge contains the subset")
+
+    def supremum(self, map_x, map_y):
+        """Smallest hyperedge containing *map_x* and *map_y*.
+
+        Results are cached (see :meth:`cache_info`), the cache is cleared when a hyperedge is added.
+
+        Args:
+            map_x(set): a set of vertices.
+            map_y(set): a set of vertices.
+        Raises:
+            ValueError: if no hyperedge contains both sets.
+        """
+
+        union = map_x.union(map_y)
+        if isinstance(union, set):
+            union = frozenset(union)
+
+        cache = self._supremum_cache
+        if union in cache:
+            self._hits += 1
+            cache.move_to_end(union)
+            return cache[union]
+
+        self._misses += 1
+        sup = self.smallest_containing(union)
+        if self._supremum_cache_size != 0:
+            cache[union] = sup
+            if self._supremum_cache_size is not None and len(cache) > self._supremum_cache_size:
+                cache.popitem(last=False)
+
+        return sup
+
+    def cache_info(self):
+        """Statistics of the :meth:`supremum` cache.
+
+        Returns(CacheInfo): named tuple (hits, misses, maxsize, currsize).
+        """
+
+        return CacheInfo(self._hits, self._misses, self._supremum_cache_size, len(self._supremum_cache))
+
+    def cache_clear(self):
+        """Clear the :meth:`supremum` cache and its statistics."""
+
+        self._supremum_cache.clear()
+        self._hits = 0
+        self._misses = 0
 
     def __eq__(self, g):
         return self.vertices == g.vertices and self.hyper_edges == g.hyper_edges
@@ -69,36 +190,95 @@ class HyperGraph:
         tb_graph_restrict_to_set = HyperGraph(vertices_set)
 
         for hyper_edge in self.hyper_edges:
-            if frozenset(hyper_edge.intersection(vertices_set)) in tb_graph_restrict_to_set.hyper_edges:
-                continue
-            elif frozenset() == frozenset(hyper_edge.intersection(vertices_set)):
+            restricted_edge = hyper_edge.intersection(vertices_set)
+            if not restricted_edge or restricted_edge in tb_graph_restrict_to_set.hyper_edges:
                 continue
             else:
-                tb_graph_restrict_to_set.add_edge(frozenset(hyper_edge.intersection(vertices_set)))
+                tb_graph_restrict_to_set.add_edge(restricted_edge)
 
         return tb_graph_restrict_to_set
 
+    def relabeled(self, label):
+        """Copy of the hypergraph with vertex *x* renamed *label(x)*.
+
+        Args:
+            label (vertex -> hashable): one to one renaming of the vertices.
+
+        Returns:
+            HyperGraph: the renamed hypergraph, whose hyperedges are frozensets.
+        """
+
+        return HyperGraph([label(x) for x in self.vertices],
+                          [frozenset(label(x) for x in hyper_edge) for hyper_edge in self.hyper_edges],
+                          self._supremum_cache_size)
+
+    def encoded(self, ground_set):
+        """Bitset version of the hypergraph.
+
+        Each vertex is a set of elements of *ground_set* (for instance a vertex ``frozenset({x})`` of a
+        :class:`BinaryMixedTree`) and is encoded as a :class:`Bitset`. A hyperedge is encoded as the union of its
+        vertices.
+
+        Args:
+            ground_set (GroundSet): numbering of the elements.
+
+        Returns:
+            HyperGraph: the encoded hypergraph.
+        """
+
+        return HyperGraph([ground_set.encode(x) for x in self.vertices],
+                          [Bitset(0).union(*[ground_set.encode(x) for x in hyper_edge])
+                           for hyper_edge in self.hyper_edges])
+
     def support_tree(self):
         """Construct the support tree of the hypergraph `self` (assume `self` is a *hypertree*)
 
+        Maximum cardinality search on the dual hypergraph (Tarjan and Yannakakis): vertices are chosen one at a
+        time, each one belonging to the largest number of already reached hyperedges, and are linked to the
+        vertex which reached the last of them. Time is linear in the sum of the hyperedge sizes.
+
         Returns (Graph): a graph which is a *support tree* of `self`
         """
-        v = self.vertices
-        h_edges = list(self.hyper_edges)
+        vertex_edges = {x: [] for x in self.vertices}
+        members = []
+        for h_edge in self.hyper_edges:
+            h_edge = [x for x in h_edge if x in vertex_edges]
+            for x in h_edge:
+                vertex_edges[x].append(len(members))
+            members.append(h_edge)
 
-        h_edges.sort(key=lambda x: len(x))
-        support_tree = Graph()
+        reached_by = [None] * len(members)  # position in order of the vertex that first reached the hyperedge
+        nb_reached = {x: 0 for x in self.vertices}  # number of reached hyperedges containing x, for x not in order
+        buckets = [dict.fromkeys(self.vertices)]  # buckets[k]: vertices not in order with nb_reached == k
+        top = 0
+        order = []
 
-        for x in v:
-            support_tree.add(x)
+        support_tree = Graph(self.vertices)
+        while nb_reached:
+            while not buckets[top]:
+                top -= 1
+            x = next(iter(buckets[top]))
+            del buckets[top][x]
+            del nb_reached[x]
 
-        for h_edge in h_edges:
-            kruskal = list(connected_parts(support_tree, vertex_subset=h_edge))
-            if len(kruskal) == 1:
-                continue
-            else:
-                for i in range(len(kruskal) - 1):
-                    support_tree.update([(next(iter(kruskal[i])), next(iter(kruskal[i + 1])))],
-                                        node_creation=False)
+            positions = [reached_by[i] for i in vertex_edges[x] if reached_by[i] is not None]
+            if positions:
+                support_tree.update([(x, order[max(positions)])], node_creation=False)
+
+            for i in vertex_edges[x]:
+                if reached_by[i] is not None:
+                    continue
+                reached_by[i] = len(order)
+                for y in members[i]:
+                    if y not in nb_reached:
+                        continue
+                    del buckets[nb_reached[y]][y]
+                    nb_reached[y] += 1
+                    if nb_reached[y] == len(buckets):
+                        buckets.append(dict())
+                    buckets[nb_reached[y]][y] = None
+                    top = max(top, nb_reached[y])
+
+            order.append(x)
 
         return support_tree
@@ -0,0 +1,198 @@
+from array import array
+
+
+class MergeForest(object):
+    """Merges of a tree construction.
+
+    Vertices are integer ids given in creation order: a leaf for each element, and a new id for each merge whose
+    children are the two merged ids. An id can be merged several times (a vertex stays in the mixed tree when only
+    part of its neighbors are moved to the union), the parents of an id are chained through the merges. Children
+    and parent links are stored in arrays, so a merge costs constant memory whatever the size of the merged sets;
+    the set of elements under an id is only built by :meth:`elements`.
+    """
+
+    def __init__(self, elements=tuple()):
+        """A forest of leaves.
+
+        Args:
+            elements(iterable): each element must be *hashable*. Element number *i* is leaf *i*.
+        """
+
+        self._elements = []  # element of each leaf id, None for merges
+        self._leaf = dict()
+        self._left = array("q")
+        self._right = array("q")
+        self._last_parent = array("q")  # last merge of each id, -1 if none
+        self._next_left = array("q")  # previous merge of the left child of each merge, -1 if none
+        self._next_right = array("q")  # previous merge of the right child of each merge, -1 if none
+
+        for x in elements:
+            self.add(x)
+
+    def __len__(self):
+        """Number of ids (leaves and merges)."""
+
+        return len(self._left)
+
+    def copy(self, size=None):
+        """Copy of the forest restricted to its first *size* ids.
+
+        Args:
+            size(int): number of ids to keep, all of them if None. Merges created after them are dropped.
+
+        Returns(MergeForest): a new forest.
+        """
+
+        if size is None:
+            size = len(self)
+
+        forest = MergeForest()
+        forest._elements = self._elements[:size]
+        forest._leaf = {x: i for x, i in self._leaf.items() if i < size}
+        forest._left = self._left[:size]
+        forest._right = self._right[:size]
+        forest._last_parent = self._last_parent[:size]
+        forest._next_left = self._next_left[:size]
+        forest._next_right = self._next_right[:size]
+
+        for i in range(size, len(self)):
+            for child in (self._left[i], self._right[i]):
+                if 0 <= child < size:
+                    parent = forest._last_parent[child]
+                    while parent >= size:
+                        parent = self._previous_parent(parent, child)
+                    forest._last_parent[child] = parent
+
+        return forest
+
+    def truncate(self, size):
+        """Drop the ids from *size* on.
+
+        Args:
+            size(int): number of ids to keep.
+        """
+
+        for i in reversed(range(size, len(self))):
+            if self.is_leaf(i):
+                del self._leaf[self._elements[i]]
+            else:
+                self._last_parent[self._left[i]] = self._next_left[i]
+                self._last_parent[self._right[i]] = self._next_right[i]
+
+        for column in (self._elements, self._left, self._right, self._last_parent, self._next_left,
+                       self._next_right):
+            del column[size:]
+
+    def add(self, x):
+        """Add a leaf for element *x*.
+
+        Args:
+            x(hashable): new element.
+        Raises:
+            ValueError: if *x* is already an element.
+
+        Returns(int): the id of the leaf.
+        """
+
+        if x in self._leaf:
+            raise ValueError("Already an element")
+
+        i = len(self)
+        self._leaf[x] = i
+        self._elements.append(x)
+        for column in (self._left, self._right, self._last_parent, self._next_left, self._next_right):
+            column.append(-1)
+
+        return i
+
+    def leaf(self, x):
+        """Id of the leaf of element *x*.
+
+        Raises:
+            ValueError: if *x* is not an element.
+        """
+
+        if x not in self._leaf:
+            raise ValueError("Not an element")
+
+        return self._leaf[x]
+
+    def is_leaf(self, i):
+        return self._left[i] == -1
+
+    def parents(self, i):
+        """Ids of the merges of *i*, in creation order."""
+
+        parents = []
+        parent = self._last_parent[i]
+        while parent != -1:
+            parents.append(parent)
+            parent = self._previous_parent(parent, i)
+        parents.reverse()
+
+        return parents
+
+    def _previous_parent(self, parent, i):
+        """Merge of *i* before its merge *parent*, -1 if none."""
+
+        return self._next_left[parent] if self._left[parent] == i else self._next_right[parent]
+
+    def children(self, i):
+        """The two merged ids of *i*, an empty tuple for a leaf."""
+
+        if self.is_leaf(i):
+            return tuple()
+        return self._left[i], self._right[i]
+
+    def merge(self, x, y):
+        """Merge ids *x* and *y*.
+
+        Args:
+            x(int): an id.
+            y(int): an id.
+        Raises:
+            ValueError: if *x* or *y* is not an id or if they are equal.
+
+        Returns(int): the new id.
+        """
+
+        for i in (x, y):
+            if not 0 <= i < len(self):
+                raise ValueError("Not an id")
+        if x == y:
+            raise ValueError("Cannot merge an id with itself")
+
+        xy = len(self)
+        self._elements.append(None)
+        self._left.append(x)
+        self._right.append(y)
+        self._last_parent.append(-1)
+        self._next_left.append(self._last_parent[x])
+        self._next_right.append(self._last_parent[y])
+        self._last_parent[x] = xy
+        self._last_parent[y] = xy
+
+        return xy
+
+    def leaves(self, i):
+        """Iteration over the leaf ids under *i*, each of them once."""
+
+        seen = {i}
+        stack = [i]
+        while stack:
+            i = stack.pop()
+            if self.is_leaf(i):
+                yield i
+            else:
+                for child in (self._right[i], self._left[i]):
+                    if child not in seen:
+                        seen.add(child)
+                        stack.append(child)
+
+    def elements(self, i):
+        """Elements under id *i*.
+
+        Returns(frozenset): the elements of the leaves under *i*.
+        """
+
+        return frozenset(self._elements[leaf] for leaf in self.leaves(i))
@@ -1,29 +1,357 @@
 __author__ = 'cchatel', 'fbrucker', 'mmoutet'
 
-from tbs.graph import MixedGraph, UNDIRECTED_EDGE, DIRECTED_EDGE, Graph, connected_parts
+from tbs.graph import MixedGraph, UNDIRECTED_EDGE, DIRECTED_EDGE, Graph
+from tbs.graph._mixed_graph import _ADJACENCY, _ADD_VERTEX, _REMOVE_VERTEX
+
+
+class _IndexedSet(object):
+    """Set whose elements are also indexed by position: add, discard and access by index in O(1)."""
+
+    def __init__(self, elements=tuple()):
+        self._elements = []
+        self._position = dict()
+
+        for x in elements:
+            self.add(x)
+
+    def copy(self):
+        indexed_set = _IndexedSet()
+        indexed_set._elements = list(self._elements)
+        indexed_set._position = dict(self._position)
+
+        return indexed_set
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __iter__(self):
+        return iter(self._elements)
+
+    def __contains__(self, x):
+        return x in self._position
+
+    def __getitem__(self, i):
+        return self._elements[i]
+
+    def add(self, x):
+        if x not in self._position:
+            self._position[x] = len(self._elements)
+            self._elements.append(x)
+
+    def discard(self, x):
+        if x in self._position:
+            i = self._position.pop(x)
+            last = self._elements.pop()
+            if i < len(self._elements):
+                self._elements[i] = last
+                self._position[last] = i
+
+
+class _HomogeneousParts(object):
+    """Connected parts of the undirected edges of a mixed tree, with their number of entered vertices.
+
+    A vertex is entered if it has an entering directed edge, and the parts with no entered vertex and at least
+    one edge are the candidates of :meth:`BinaryMixedTree.homogeneous_subset`. Entering edges only change the
+    counters. Parts touched by an undirected edge or a vertex modification are recomputed at the next query, so
+    a query costs the size of the parts modified since the previous one.
+    """
+
+    def __init__(self, vertices=tuple()):
+        self._part = dict()  # vertex -> id of its part, for the vertices not touched since the last update
+        self._vertices = dict()  # id -> vertices of the part
+        self._nb_entered = dict()  # id -> number of entered vertices of the part
+        self._entered = set()  # entered vertices, as last seen
+        self._candidates = _IndexedSet()  # ids of the homogeneous parts with at least one edge
+        self._touched = set(vertices)
+        self._next_id = 0
+
+    def copy(self):
+        parts = _HomogeneousParts()
+        parts._part = dict(self._part)
+        parts._vertices = {i: set(vertices) for i, vertices in self._vertices.items()}
+        parts._nb_entered = dict(self._nb_entered)
+        parts._entered = set(self._entered)
+        parts._candidates = self._candidates.copy()
+        parts._touched = set(self._touched)
+        parts._next_id = self._next_id
+
+        return parts
+
+    def touch(self, x):
+        """The undirected edges of *x* or *x* itself have been modified."""
+
+        self._touched.add(x)
+
+    def refresh_entered(self, tree, x):
+        """The entering edges of *x* have been modified."""
+
+        if x not in tree:
+            return
+
+        is_entered = bool(tree._directed_dual[x])
+        if is_entered == (x in self._entered):
+            return
+
+        if is_entered:
+            self._entered.add(x)
+        else:
+            self._entered.discard(x)
+
+        if x in self._part:
+            i = self._part[x]
+            self._nb_entered[i] += 1 if is_entered else -1
+            self._refresh_candidate(i)
+
+    def _refresh_candidate(self, i):
+        if self._nb_entered[i] == 0 and len(self._vertices[i]) > 1:
+            self._candidates.add(i)
+        else:
+            self._candidates.discard(i)
+
+    def candidates(self, tree):
+        """Ids of the homogeneous parts with at least one edge (indexed set), after the update of the touched
+        parts."""
+
+        if self._touched:
+            self._update(tree)
+
+        return self._candidates
+
+    def vertices(self, i):
+        return self._vertices[i]
+
+    def _update(self, tree):
+        touched, self._touched = self._touched, set()
+
+        for i in {self._part[x] for x in touched if x in self._part}:
+            for x in self._vertices.pop(i):
+                del self._part[x]
+                touched.add(x)
+            del self._nb_entered[i]
+            self._candidates.discard(i)
+
+        for x in touched:
+            if x not in tree:
+                self._entered.discard(x)
+                continue
+            if x in self._part:
+                continue
+
+            i = self._next_id
+            self._next_id += 1
+            part = {x}
+            stack = [x]
+            while stack:
+                u = stack.pop()
+                for v in tree._undirected[u]:
+                    if v not in part:
+                        part.add(v)
+                        stack.append(v)
+
+            nb_entered = 0
+            for u in part:
+                self._part[u] = i
+                if tree._directed_dual[u]:
+                    self._entered.add(u)
+                    nb_entered += 1
+                else:
+                    self._entered.discard(u)
+
+            self._vertices[i] = part
+            self._nb_entered[i] = nb_entered
+            self._refresh_candidate(i)
 
 
 class BinaryMixedTree(MixedGraph):
     """Class for mixed trees (trees with directed and undirected edges).
+
+    The undirected edges whose both ends have no entering directed edge (the edges satisfying line 2 of
+    algorithm 1) are maintained along modifications of the tree, see :attr:`free_undirected_edges`, and so are
+    the candidate homogeneous parts of algorithm 3, see :meth:`homogeneous_subset`. Both indexes are shared with
+    the copies of the tree until one of them is modified, and are updated from the journal on :meth:`rollback`.
     """
 
-    def __init__(self, tree):
+    def __init__(self, tree, ground_set=None, merge_forest=None):
+        """Mixed tree with only undirected edges whose vertices are the singletons of the vertices of *tree*.
+
+        Args:
+            tree (MixedGraph): a tree.
+            ground_set (GroundSet): if set, singletons are the :class:`Bitset` of the vertices of *tree* in
+                *ground_set* instead of frozensets.
+            merge_forest (MergeForest): if set, vertices are integer ids of *merge_forest*: singletons are the
+                leaves of the vertices of *tree* and :meth:`add_union` names the union with a new merge id. The
+                tree and its copies share *merge_forest* and merge in place while the forest has no merge beyond
+                their history; a tree forks the forest when another tree has already merged past it, so that each
+                construction allocates its own ids.
+        """
+
+        self._free_undirected_edges = _IndexedSet()
+        self._homogeneous_parts = None  # created by the first homogeneous subset query
+        self._shared_indexes = set()  # names of the index attributes shared with a copy
+        self._merge_forest = merge_forest
+        self._merge_forest_size = 0 if merge_forest is None else len(merge_forest)  # ids of the tree history
+        self._merge_forest_transactions = []  # (forest, size) at the beginning of each transaction
         super().__init__()
+
+        if merge_forest is not None:
+            singleton = merge_forest.leaf
+        elif ground_set is None:
+            singleton = lambda x: frozenset({x})
+        else:
+            singleton = ground_set.singleton
+
         for vertex in tree:
-            self.add(frozenset({vertex}))
+            self.add(singleton(vertex))
         for vertex in tree:
             for neighbour in tree(vertex):
-                self.update(UNDIRECTED_EDGE, [(frozenset({vertex}), frozenset({neighbour}))])
+                self.update(UNDIRECTED_EDGE, [(singleton(vertex), singleton(neighbour))])
 
-    def copy(self):
-        copy = BinaryMixedTree({})
-        for vertex in self.vertices:
-            copy.add(vertex)
+    def relabeled(self, label):
+        """Copy of the tree with vertex *x* renamed *label(x)*.
+
+        Args:
+            label (vertex -> hashable): one to one renaming of the vertices.
+
+        Returns:
+            BinaryMixedTree: the renamed tree.
+        """
+
+        relabeled_tree = BinaryMixedTree(MixedGraph(), merge_forest=self._merge_forest)
+        self._share_merge_forest(relabeled_tree)
+        relabeled_tree.add_vertices(label(x) for x in self)
 
         undirected, directed = self.edges
-        copy.update(UNDIRECTED_EDGE, undirected)
-        copy.update(DIRECTED_EDGE, directed)
-        return copy
+        relabeled_tree.update(UNDIRECTED_EDGE, [(label(x), label(y)) for x, y in undirected])
+        relabeled_tree.update(DIRECTED_EDGE, [(label(x), label(y)) for x, y in directed])
+
+        return relabeled_tree
+
+    def copy(self):
+        """Copy of the tree (see :meth:`MixedGraph.copy`).
+
+        Only the top-level maps of the graph are copied. The indexes are shared and copied whole by the first tree
+        which modifies them, so a copy followed by a step is linear in the number of vertices.
+        """
+
+        tree = super().copy()
+
+        self._shared_indexes = {"_free_undirected_edges", "_homogeneous_parts", "_merge_forest"}
+        tree._shared_indexes = set(self._shared_indexes)
+        tree._merge_forest_transactions = []
+
+        return tree
+
+    def _share_merge_forest(self, tree):
+        """*tree* uses the merge forest of the tree, which becomes shared."""
+
+        self._shared_indexes.add("_merge_forest")
+        tree._shared_indexes.add("_merge_forest")
+        tree._merge_forest_size = self._merge_forest_size
+
+    def _own_index(self, name):
+        """Index attribute *name*, copied first if it is shared with a copy of the tree."""
+
+        if name in self._shared_indexes:
+            self._shared_indexes.discard(name)
+            index = getattr(self, name)
+            if index is not None:
+                setattr(self, name, index.copy())
+
+        return getattr(self, name)
+
+    @property
+    def free_undirected_edges(self):
+        """Undirected edges {x, y} such that neither *x* nor *y* has an entering directed edge.
+
+        The returned indexed set must not be modified: it supports `len`, `in`, iteration and access by index,
+        so that a random edge can be drawn in constant time.
+        """
+
+        if self._free_undirected_edges is None:
+            self._free_undirected_edges = _IndexedSet()
+            for x in self:
+                for y in self._undirected[x]:
+                    self._refresh_free_undirected_edge(self._free_undirected_edges, x, y)
+
+        return self._free_undirected_edges
+
+    def _refresh_free_undirected_edge(self, free_undirected_edges, x, y):
+        edge = frozenset([x, y])
+        if x in self._undirected and y in self._undirected[x] \
+                and not self._directed_dual[x] and not self._directed_dual[y]:
+            free_undirected_edges.add(edge)
+        else:
+            free_undirected_edges.discard(edge)
+
+    def add(self, x):
+        super().add(x)
+        self._update_indexes(None, x, None)
+
+    def remove(self, x):
+        super().remove(x)
+        self._update_indexes(None, x, None)
+
+    def _set_adjacency(self, adjacency, x, y, attribute):
+        super()._set_adjacency(adjacency, x, y, attribute)
+        self._update_indexes(adjacency, x, y)
+
+    def _del_adjacency(self, adjacency, x, y):
+        super()._del_adjacency(adjacency, x, y)
+        self._update_indexes(adjacency, x, y)
+
+    def _update_indexes(self, adjacency, x, y, rollback=False):
+        """Update the indexes after a modification of adjacency[x][y] (of vertex *x* if *adjacency* is None)."""
+
+        if adjacency is None:
+            if self._homogeneous_parts is not None:
+                self._own_index("_homogeneous_parts").touch(x)
+        elif adjacency is self._undirected:
+            if self._free_undirected_edges is not None:
+                self._refresh_free_undirected_edge(self._own_index("_free_undirected_edges"), x, y)
+            if self._homogeneous_parts is not None:
+                homogeneous_parts = self._own_index("_homogeneous_parts")
+                homogeneous_parts.touch(x)
+                homogeneous_parts.touch(y)
+        elif adjacency is self._directed_dual and x in self:
+            if self._free_undirected_edges is not None and (rollback or len(adjacency[x]) <= 1):
+                free_undirected_edges = self._own_index("_free_undirected_edges")
+                for z in self._undirected[x]:
+                    self._refresh_free_undirected_edge(free_undirected_edges, x, z)
+            if self._homogeneous_parts is not None:
+                self._own_index("_homogeneous_parts").refresh_entered(self, x)
+
+    def begin(self):
+        super().begin()
+        self._merge_forest_transactions.append((self._merge_forest, self._merge_forest_size))
+
+    def commit(self):
+        super().commit()
+        self._merge_forest_transactions.pop()
+
+    def rollback(self):
+        """Undo the modifications of the current transaction (see :meth:`MixedGraph.rollback`).
+
+        The indexes are updated for the undone modifications only and the merges of the transaction are dropped
+        from the merge forest.
+        """
+
+        operations = self._journal[self._transactions[-1]:] if self._transactions else []
+        super().rollback()
+
+        forest, self._merge_forest_size = self._merge_forest_transactions.pop()
+        if forest is None:
+            pass
+        elif forest is self._merge_forest and "_merge_forest" not in self._shared_indexes:
+            forest.truncate(self._merge_forest_size)
+        else:
+            self._merge_forest = forest
+            self._shared_indexes.add("_merge_forest")
+
+        for operation in reversed(operations):
+            if operation[0] == _ADJACENCY:
+                self._update_indexes(operation[1], operation[2], operation[3], rollback=True)
+            elif operation[0] in (_ADD_VERTEX, _REMOVE_VERTEX):
+                self._update_indexes(None, operation[1], None)
 
     def add_undirected(self, x, y):
         self.update(UNDIRECTED_EDGE, [(x, y)])
@@ -31,8 +359,44 @@ class BinaryMixedTree(MixedGraph):
     def add_directed(self, x, y):
         self.update(DIRECTED_EDGE, [(x, y)])
 
-    def add_union(self, x, y):
-        xy = x.union(y)
+    @property
+    def merge_forest(self):
+        """The :class:`MergeForest` of the vertex ids, None if vertices are sets.
+
+        The forest may be shared with other trees of the construction: ids from the number of ids of the tree
+        history on are merges of these trees.
+        """
+
+        return self._merge_forest
+
+    def add_union(self, x, y, new_name=None):
+        """Add the union of *x* and *y*, with directed edges from *x* and *y* to it.
+
+        Args:
+            x: a vertex.
+            y: a vertex.
+            new_name: the name of the union. If None, a new id of the merge forest if any, *x.union(y)*
+                otherwise. With a merge forest, it must be the new id (when a step is replayed).
+
+        Raises:
+            ValueError: if *x* or *y* is already merged in the merge forest, or if *new_name* is not its new id.
+
+        Returns:
+            the new vertex.
+        """
+
+        if self._merge_forest is not None:
+            if len(self._merge_forest) != self._merge_forest_size:
+                self._shared_indexes.discard("_merge_forest")
+                self._merge_forest = self._merge_forest.copy(self._merge_forest_size)
+            xy = self._merge_forest.merge(x, y)
+            self._merge_forest_size = len(self._merge_forest)
+            if new_name is not None and new_name != xy:
+                raise ValueError("Name is not the merge id")
+        elif new_name is not None:
+            xy = new_name
+        else:
+            xy = x.union(y)
 
         self.difference([(x, y)])
         self.add(xy)
@@ -50,10 +414,12 @@ class BinaryMixedTree(MixedGraph):
             self.update(UNDIRECTED_EDGE, [(y, z)])
 
     def restriction(self, vertices_set):
-        if not vertices_set.issubset(self.vertices):
+        vertices_set = set(vertices_set)
+        if not vertices_set <= self.vertices:
             raise ValueError("Can't restrict the tree to a set which isn't included in the vertices set")
 
-        restricted_tree = BinaryMixedTree(MixedGraph())
+        restricted_tree = BinaryMixedTree(MixedGraph(), merge_forest=self._merge_forest)
+        self._share_merge_forest(restricted_tree)
         for x in vertices_set:
             restricted_tree.add(x)
 
@@ -76,26 +442,99 @@ class BinaryMixedTree(MixedGraph):
         return g
 
     def homogeneous_subset(self):
-        def homogeneous_subset_rec(h):
-            undirected, directed = h.edges
+        """A homogeneous subset of the tree.
 
-            if len(directed) == 0:
-                return h.vertices
+        Its vertices form a connected part of the undirected edges with no entering directed edge. The parts with
+        at least one edge and no entered vertex are maintained along the modifications of the tree, so a query
+        only costs the size of the parts modified since the previous one. If there is no such part, the subset is
+        found by a walk from the first vertex: the undirected part is grown and, while a directed edge enters it,
+        the walk continues in the part of the tail of this edge. The tree is left unchanged.
 
-            else:
-                xy = next(iter(directed))
-                x, y = xy
-                h.difference([xy])
-                connected_1, connected_2 = connected_parts(h.underlying_undirected_graph())
+        Raises:
+            ValueError: if the walk comes back to a visited part (the directed edges between parts form a cycle).
 
-                if connected_1.intersection([y]) != frozenset():
-                    for v in connected_1:
-                        h.remove(v)
-                else:
-                    for v in connected_2:
-                        h.remove(v)
+        Returns(frozenset): the vertices of the homogeneous subset.
+        """
+
+        candidates = self._homogeneous_candidates()
+        if candidates:
+            return frozenset(self._homogeneous_parts.vertices(candidates[0]))
+
+        part, edges = self._homogeneous_part()
+
+        return frozenset(part)
+
+    def homogeneous_edges(self):
+        """Undirected edges of :meth:`homogeneous_subset`.
+
+        Same time as :meth:`homogeneous_subset` plus the size of the subset, edges are listed in traversal order.
+
+        Raises:
+            ValueError: as :meth:`homogeneous_subset`.
+
+        Returns(list): a list of frozenset {x, y}.
+        """
+
+        candidates = self._homogeneous_candidates()
+        if candidates:
+            part = self._homogeneous_parts.vertices(candidates[0])
+            return self._part_edges(next(iter(part)))
+
+        part, edges = self._homogeneous_part()
+
+        return edges
+
+    def _homogeneous_candidates(self):
+        if self._homogeneous_parts is None:
+            self._homogeneous_parts = _HomogeneousParts(self)
+            self._shared_indexes.discard("_homogeneous_parts")
+
+        if self._homogeneous_parts._touched:
+            self._own_index("_homogeneous_parts")
+
+        return self._homogeneous_parts.candidates(self)
+
+    def _part_edges(self, x):
+        """Undirected edges of the part of *x*, in traversal order."""
+
+        part = {x}
+        edges = []
+        stack = [x]
+        while stack:
+            u = stack.pop()
+            for v in self.iter_neighbors(u, undirected=True, begin=False, end=False):
+                if v not in part:
+                    part.add(v)
+                    edges.append(frozenset([u, v]))
+                    stack.append(v)
+
+        return edges
+
+    def _homogeneous_part(self):
+        if len(self) == 0:
+            return set(), []
+
+        x = next(iter(self))
+        visited = set()
+        while True:
+            if x in visited:
+                raise ValueError("Directed edges form a cycle, no homogeneous subset")
 
-                return h.homogeneous_subset()
+            part = {x}
+            edges = []
+            stack = [x]
+            entering = None
+            while stack:
+                u = stack.pop()
+                if entering is None:
+                    entering = next(self.iter_neighbors(u, undirected=False, begin=False, end=True), None)
+                for v in self.iter_neighbors(u, undirected=True, begin=False, end=False):
+                    if v not in part:
+                        part.add(v)
+                        edges.append(frozenset([u, v]))
+                        stack.append(v)
 
-        h = self.copy()
-        return homogeneous_subset_rec(h)
+            if entering is None:
+                return part, edges
+            visited.update(part)
+            x = entering
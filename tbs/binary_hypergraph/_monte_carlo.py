@@ -0,0 +1,78 @@
+import multiprocessing
+import random
+from collections import Counter
+
+from ._algo1_functions import s_0
+from ._basic_tree_construction import BasicTreeConstruction
+from ._hypergraph import HyperGraph
+
+_worker_state = None  # (mixed_tree, strategy_cls, tb_hypergraph) of a worker process
+
+
+def _init_worker(mixed_tree, strategy_cls, tb_hypergraph):
+    global _worker_state
+    _worker_state = (mixed_tree, strategy_cls, tb_hypergraph)
+
+
+def _worker_run_seed(seed):
+    return _run_seed(*_worker_state, seed)
+
+
+def _frozen(subset):
+    return frozenset(subset) if isinstance(subset, set) else subset
+
+
+def _run_seed(mixed_tree, strategy_cls, tb_hypergraph, seed):
+    """Binary set system of one run of the construction, random generator seeded with *seed*."""
+
+    maps = s_0(mixed_tree)
+    set_system = {_frozen(subset) for subset in maps.values()}
+
+    algo = BasicTreeConstruction(mixed_tree.copy(), maps, tb_hypergraph)
+    strategy = strategy_cls(rng=random.Random(seed))
+    while len(algo.mixed_tree) > 1:
+        delta = algo.step_in_place(strategy)
+        set_system.add(_frozen(algo.maps[delta.v_xy]))
+
+    return frozenset(set_system)
+
+
+def run_many(mixed_tree, strategy_cls, n_runs, workers=None, seed=None, tb_hypergraph=None, chunksize=16):
+    """Distribution of the binary set systems built by *n_runs* runs of the construction from *mixed_tree*.
+
+    Run *i* draws its random choices from its own `random.Random` generator, seeded with the *i*-th number drawn
+    from `random.Random(seed)`, so results do not depend on *workers* (as long as the hash of the vertices does
+    not depend on the process, which holds for sets of numbers). The tree and the hypergraph are sent once to
+    each worker process and results are counted as they arrive.
+
+    Args:
+        mixed_tree (BinaryMixedTree): a consistent mixed tree with only undirected edges.
+        strategy_cls: class of the strategy (:class:`StratAlgo1` or :class:`StratAlgo3`), instantiated for each run
+            with an *rng* keyword argument.
+        n_runs (int): number of runs.
+        workers (int): number of processes. None for the number of CPUs, 1 to run in the current process.
+        seed: seed of the per-run seeds.
+        tb_hypergraph (HyperGraph): hypergraph of :class:`StratAlgo3`.
+        chunksize (int): number of runs sent to a worker at once.
+
+    Returns(Counter): number of runs for each binary set system (a frozenset of vertex sets).
+    """
+
+    if tb_hypergraph is None:
+        tb_hypergraph = HyperGraph()
+
+    seed_generator = random.Random(seed)
+    seeds = (seed_generator.getrandbits(64) for i in range(n_runs))
+    distribution = Counter()
+
+    if workers == 1:
+        for seed in seeds:
+            distribution[_run_seed(mixed_tree, strategy_cls, tb_hypergraph, seed)] += 1
+        return distribution
+
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(mixed_tree, strategy_cls, tb_hypergraph)) as pool:
+        for set_system in pool.imap_unordered(_worker_run_seed, seeds, chunksize):
+            distribution[set_system] += 1
+
+    return distribution
@@ -5,13 +5,16 @@ from ._basic_tree_construction import BasicTreeConstruction
 class StratAlgo3(object):
     """Strategy for algorithm 3.
         This object is used as a strategy in ._basic_tree_construction.step to compute algorithm 3 and 4.
+        Algorithm 3 is deterministic, *rng* is only accepted for compatibility with :class:`StratAlgo1`.
         """
-    def __init__(self, algo=None):
+    def __init__(self, algo=None, rng=None):
         if algo is None:
             self.algo = BasicTreeConstruction()
         else:
             self.algo = algo
 
+        self.rng = rng
+
     def edge_choice(self):
         return edge_choice_for_algo3(self.algo)
 
@@ -42,22 +42,32 @@ Module content
 
 """
 
-from ._mixed_graph import MixedGraph, UNDIRECTED_EDGE, DIRECTED_EDGE
+from ._mixed_graph import MixedGraph, NeighborhoodView, UNDIRECTED_EDGE, DIRECTED_EDGE
 from ._graph import Graph
 from ._directed_graph import DirectedGraph
+from ._frozen_graph import FrozenMixedGraph
 
+from ._shortest_path import EDGE_ATTRIBUTE, shortest_path_forest, path_from_fathers, ShortestPathTree, \
+    DistanceMatrix, all_pairs_distances
+from ._connectivity import Connectivity
+from ._reachability import ReachabilityMatrix
 from ._connected_parts import mst_from_set, connected_parts
 from ._order import dfs, bfs, topological_sort, dfs_from_vertex, bfs_from_vertex, \
     direct_acyclic_graph_to_direct_comparability_graph, direct_comparability_graph_to_hase_diagram
-from ._creation import random_tree, tree_from_prufer, prufer_from_tree
+from ._topological_order import IncrementalTopologicalOrder
+from ._creation import random_tree, random_trees, tree_from_prufer, prufer_from_tree
 
 __author__ = 'francois, célia'
 
 __all__ = ["Graph",
            "DirectedGraph",
-           "mst_from_set", "connected_parts",
-           "MixedGraph", "UNDIRECTED_EDGE", "DIRECTED_EDGE",
-           "mst_from_set", "dfs", "bfs", "topological_sort", "dfs_from_vertex", "bfs_from_vertex",
+           "FrozenMixedGraph",
+           "ReachabilityMatrix",
+           "mst_from_set", "connected_parts", "Connectivity",
+           "MixedGraph", "NeighborhoodView", "UNDIRECTED_EDGE", "DIRECTED_EDGE",
+           "EDGE_ATTRIBUTE", "shortest_path_forest", "path_from_fathers",
+           "ShortestPathTree", "DistanceMatrix", "all_pairs_distances",
+           "mst_from_set", "dfs", "bfs", "topological_sort", "IncrementalTopologicalOrder", "dfs_from_vertex", "bfs_from_vertex",
            "direct_acyclic_graph_to_direct_comparability_graph", "direct_comparability_graph_to_hase_diagram",
-           "random_tree", "tree_from_prufer", "prufer_from_tree"]
+           "random_tree", "random_trees", "tree_from_prufer", "prufer_from_tree"]
 
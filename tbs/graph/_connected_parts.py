@@ -1,11 +1,27 @@
 # -*- coding: utf-8 -*-
 from ._graph import Graph
+from ._connectivity import Connectivity
 
 
-def mst_from_set(elements, f=lambda x, y: 1, root=None):
+def mst_from_set(elements, f=lambda x, y: 1, root=None, graph=None):
     """Minimal spanning tree (according to f).
+
+    Args:
+        elements(iterable): vertices of the tree.
+        f: function (x, y) -> weight, or the name of an edge column of *graph*. Pairs of elements which are not
+            edges of *graph* then have an infinite weight.
+        root: first vertex of the tree.
+        graph(MixedGraph): graph of the edge column *f*.
+
+    Raises:
+        ValueError: if *f* is the name of an edge column and *graph* is None.
     """
 
+    if isinstance(f, str):
+        if graph is None:
+            raise ValueError("An edge column needs its graph")
+        f = graph._edge_column_weight(f, default=float("inf"))
+
     mst = Graph(elements)
 
     if root is None:
@@ -40,6 +56,8 @@ def mst_from_set(elements, f=lambda x, y: 1, root=None):
 def connected_parts(graph, vertex_subset=None):
     """Partition the vertex according to its connected parts.
 
+    Directed edges are considered as undirected ones.
+
     Args:
         graph(Graph): undirected graph
         vertex_subset(iterable): set of vertices. If ``None``, the whole vertex set
@@ -51,23 +69,13 @@ def connected_parts(graph, vertex_subset=None):
     if vertex_subset is None:
         vertex_subset = list(graph)
 
-    connected_part = dict()
-    for x in vertex_subset:
-        connected_part[x] = x
-    for x, y in graph.edges:
-        if x not in vertex_subset or y not in vertex_subset:
+    connectivity = Connectivity(set(vertex_subset))
+    for x in connectivity:
+        if x not in graph:
             continue
 
-        if connected_part[x] != connected_part[y]:
-            xx = connected_part[x]
-            yy = connected_part[y]
-            for u in connected_part:
-                if connected_part[u] == yy:
-                    connected_part[u] = xx
-    p = set()
-
-    for x in vertex_subset:
-        if connected_part[x] == x:
-            elems = frozenset([y for y in vertex_subset if connected_part[y] == x])
-            p.add(elems)
-    return frozenset(p)
+        for y in graph.iter_neighbors(x, undirected=True, begin=True, end=True):
+            if y in connectivity:
+                connectivity.add_edge(x, y)
+
+    return connectivity.components()
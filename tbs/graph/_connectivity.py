@@ -0,0 +1,133 @@
+class Connectivity(object):
+    """Incremental connected parts.
+
+    Disjoint-set forest with path compression and union by rank: adding an edge and testing whether two
+    vertices are connected take almost constant amortized time.
+    """
+
+    def __init__(self, vertices=tuple(), edges=tuple()):
+        """Connected parts of the graph (vertices, edges).
+
+        Args:
+            vertices(iterable): each vertex must be *hashable*.
+            edges(iterable): list of pair (x, y) where *x* and *y* are vertices.
+
+        Raises:
+            ValueError: if a vertex is given twice or if an edge uses a non vertex.
+        """
+
+        self._parent = dict()
+        self._rank = dict()
+        self._nb_components = 0
+
+        for x in vertices:
+            self.add(x)
+
+        for x, y in edges:
+            self.add_edge(x, y)
+
+    def __len__(self):
+        """Number of vertices."""
+
+        return len(self._parent)
+
+    def __iter__(self):
+        """Iteration over the vertices."""
+
+        return iter(self._parent)
+
+    def __contains__(self, x):
+        """is a vertex"""
+
+        return x in self._parent
+
+    @property
+    def nb_components(self):
+        """Number of connected parts."""
+
+        return self._nb_components
+
+    def add(self, x):
+        """Add vertex *x* as a new connected part.
+
+        Args:
+            x(hashable): new vertex to add.
+        Raises:
+            ValueError: if *x* is already a vertex.
+        """
+
+        if x in self._parent:
+            raise ValueError("Already a vertex")
+
+        self._parent[x] = x
+        self._rank[x] = 0
+        self._nb_components += 1
+
+    def find(self, x):
+        """Representative of the connected part of *x*.
+
+        Args:
+            x: a vertex.
+        Raises:
+            ValueError: if *x* is not a vertex.
+        """
+
+        if x not in self._parent:
+            raise ValueError("Not a vertex")
+
+        parent = self._parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+
+        return root
+
+    def add_edge(self, x, y):
+        """Merge the connected parts of *x* and *y*.
+
+        Args:
+            x: a vertex.
+            y: a vertex.
+        Raises:
+            ValueError: if *x* or *y* is not a vertex.
+
+        Returns(bool):
+            True if *x* and *y* were in different connected parts, False otherwise.
+        """
+
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+
+        if self._rank[x] < self._rank[y]:
+            x, y = y, x
+        self._parent[y] = x
+        if self._rank[x] == self._rank[y]:
+            self._rank[x] += 1
+        self._nb_components -= 1
+
+        return True
+
+    def same_component(self, x, y):
+        """Test if *x* and *y* are in the same connected part.
+
+        Raises:
+            ValueError: if *x* or *y* is not a vertex.
+        """
+
+        return self.find(x) == self.find(y)
+
+    def components(self):
+        """Connected parts.
+
+        returns(frozenset): a frozenset of frozenset of connected parts.
+        """
+
+        parts = dict()
+        for x in self._parent:
+            parts.setdefault(self.find(x), []).append(x)
+
+        return frozenset(frozenset(part) for part in parts.values())
@@ -1,12 +1,17 @@
 import random
+from array import array
+
 from ._graph import Graph
 
 
-def random_tree(vertices):
+def random_tree(vertices, rng=random):
     """ Random tree.
 
+    The Prüfer sequence is drawn in a single call to *rng*.
+
     Args:
         vertices(list): list of vertices.
+        rng: random number generator (:class:`random.Random` or the :mod:`random` module).
 
     Returns(Graph): A tree on the set of vertices.
     """
@@ -15,13 +20,13 @@ def random_tree(vertices):
         return tree_from_prufer([], vertices)
     else:
 
-        return tree_from_prufer([random.randint(0, len(vertices) - 1) for x in range(len(vertices) - 2)], vertices)
+        return tree_from_prufer(rng.choices(range(len(vertices)), k=len(vertices) - 2), vertices)
 
 
 def tree_from_prufer(prufer_list, vertices):
     """Tree from Prüfer sequence.
 
-    Return a Tree according to the prüfer sequences associated with the vertex list.
+    Return a Tree according to the prüfer sequences associated with the vertex list. Takes O(n) time.
     Args:
         prufer_list(list): a len(vertices) - 2 length list of indices from 0 to len(vertices) - 1
         vertices(list): the vertices of the graph.
@@ -31,45 +36,118 @@ def tree_from_prufer(prufer_list, vertices):
 
     tree = Graph(vertices)
 
-    vertices_degree = [1] * len(vertices)
+    leaves, parent = _prufer_decode(prufer_list, len(vertices))
+    tree.update([(vertices[parent[leaf]], vertices[leaf]) for leaf in leaves])
+
+    return tree
+
+
+def _prufer_decode(prufer_list, n):
+    """Tree of a Prüfer sequence on vertices 0, ..., n - 1, rooted at n - 1.
+
+    The smallest leaf is removed at each step: it is either the new leaf made by the removal (if smaller than
+    the scanning pointer) or the next leaf found by the pointer, which only moves forward.
+
+    Returns:
+        (leaves, parent): the removed leaves in order (the last one is the neighbor of the root) and the
+        :class:`array.array` of the parent of each index (-1 for the root).
+    """
+
+    parent = array("q", [-1]) * n
+    if n <= 1:
+        return [], parent
+
+    degree = [1] * n
     for vertex_index in prufer_list:
-        vertices_degree[vertex_index] += 1
+        degree[vertex_index] += 1
 
+    pointer = degree.index(1)
+    leaf = pointer
+    leaves = []
     for prufer in prufer_list:
-        leaf, degree = None, None
-        for leaf, degree in enumerate(vertices_degree):
-            if degree == 1:
-                break
-        tree.update([(vertices[prufer], vertices[leaf])])
-        vertices_degree[prufer] -= 1
-        vertices_degree[leaf] -= 1
-
-    last_edge = [vertices[i] for i, degree in enumerate(vertices_degree) if degree == 1]
-    if len(last_edge) == 2:
-        tree.update([last_edge])
+        leaves.append(leaf)
+        parent[leaf] = prufer
+        degree[prufer] -= 1
 
-    return tree
+        if degree[prufer] == 1 and prufer < pointer:
+            leaf = prufer
+        else:
+            pointer += 1
+            while degree[pointer] != 1:
+                pointer += 1
+            leaf = pointer
+
+    leaves.append(leaf)
+    parent[leaf] = n - 1
+
+    return leaves, parent
 
 
 def prufer_from_tree(tree, vertices_list):
-    vertices_degree = [set(tree(x)) for x in vertices_list]
+    """Prüfer sequence of a tree.
+
+    Inverse of :func:`tree_from_prufer`. Takes O(n) time.
+
+    Args:
+        tree(Graph): a tree.
+        vertices_list(list): the vertices of the tree.
+
+    Returns(list): a len(vertices_list) - 2 length list of indices from 0 to len(vertices_list) - 1.
+    """
 
-    number_edges_remaining = max(0, len(vertices_list) - 2)
+    n = len(vertices_list)
+    if n <= 2:
+        return []
+
+    index = {x: i for i, x in enumerate(vertices_list)}
+    degree = [tree.degree(x) for x in vertices_list]
+
+    parent = [-1] * n
+    stack = [n - 1]
+    while stack:
+        i = stack.pop()
+        for y in tree.iter_neighbors(vertices_list[i]):
+            j = index[y]
+            if j != n - 1 and parent[j] == -1:
+                parent[j] = i
+                stack.append(j)
+
+    pointer = degree.index(1)
+    leaf = pointer
     prufer = []
+    for k in range(n - 2):
+        y = parent[leaf]
+        prufer.append(y)
+        degree[y] -= 1
+
+        if degree[y] == 1 and y < pointer:
+            leaf = y
+        else:
+            pointer += 1
+            while degree[pointer] != 1:
+                pointer += 1
+            leaf = pointer
+
+    return prufer
 
-    while number_edges_remaining:
-        leaf, neighbors = None, None
-        for leaf, neighbors in enumerate(vertices_degree):
-            if len(neighbors) == 1:
-                break
 
-        x = vertices_list[leaf]
-        y = list(neighbors)[0]
+def random_trees(vertices, k, rng=random, parent_arrays=False):
+    """Random trees.
 
-        vertices_degree[leaf] = set()
-        vertices_degree[vertices_list.index(y)].remove(x)
+    Args:
+        vertices(list): list of vertices.
+        k(int): number of trees.
+        rng: random number generator (:class:`random.Random` or the :mod:`random` module).
+        parent_arrays(bool): if True, yield for each tree the :class:`array.array` of the index of the parent
+            of each vertex index (rooted at the last vertex, whose parent is -1) instead of a graph.
 
-        prufer.append(vertices_list.index(y))
-        number_edges_remaining -= 1
+    Returns(generator): the *k* trees, as in :func:`random_tree`.
+    """
 
-    return prufer
+    n = len(vertices)
+    for i in range(k):
+        prufer_list = rng.choices(range(n), k=n - 2) if n > 2 else []
+        if parent_arrays:
+            yield _prufer_decode(prufer_list, n)[1]
+        else:
+            yield tree_from_prufer(prufer_list, vertices)
@@ -80,7 +80,7 @@ class DirectedGraph(MixedGraph):
     def __repr__(self):
         undirected, directed = self._edges
         return "".join(["DirectedGraph(",
-                        repr(self.vertices),
+                        repr(frozenset(self.vertices)),
                         ", ", repr(directed),
                         ")"])
 
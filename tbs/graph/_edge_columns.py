@@ -0,0 +1,225 @@
+from array import array
+from types import MappingProxyType
+
+
+def _default_value(typecode):
+    return float("nan") if typecode in "fd" else 0
+
+
+class EdgeColumns(object):
+    """Typed attribute columns of the edges of a graph.
+
+    Each edge has an integer id, kept as long as the edge is in the graph, and each column is an `array` whose item
+    *i* is the value of the edge of id *i*. Ids of removed edges are reused by new edges, except during a
+    transaction of the graph: they are retired until the transaction ends, so that a rollback can give them back
+    (with their values) to the restored edges. Edges are given by their key: `frozenset([x, y])` for an undirected
+    edge and `(x, y)` for a directed one.
+    """
+
+    def __init__(self, keys=tuple()):
+        """Columns of the edges *keys*.
+
+        Args:
+            keys(iterable): keys of the edges.
+        """
+
+        self._id = dict()  # key -> id
+        self._free = []  # ids not used by an edge
+        self._retired = set()  # ids of the edges removed during a transaction, kept for a rollback
+        self._size = 0  # length of the columns
+        self._columns = dict()  # name -> array
+        self._defaults = dict()  # name -> value of the ids not used by an edge
+
+        for key in keys:
+            self.add_edge(key)
+
+    def copy(self):
+        """Copy of the ids and columns."""
+
+        edge_columns = EdgeColumns()
+        edge_columns._id = dict(self._id)
+        edge_columns._free = list(self._free)
+        edge_columns._retired = set(self._retired)
+        edge_columns._size = self._size
+        edge_columns._columns = {name: array(column.typecode, column) for name, column in self._columns.items()}
+        edge_columns._defaults = dict(self._defaults)
+
+        return edge_columns
+
+    def __len__(self):
+        """Number of edges."""
+
+        return len(self._id)
+
+    def __contains__(self, key):
+        """Test if *key* is the key of an edge."""
+
+        return key in self._id
+
+    @property
+    def names(self):
+        """Names of the columns (tuple)."""
+
+        return tuple(self._columns)
+
+    @property
+    def ids(self):
+        """Read-only mapping key -> id of the edges, updated with the edges."""
+
+        return MappingProxyType(self._id)
+
+    def edge_id(self, key):
+        """Id of the edge *key*.
+
+        Raises:
+            ValueError: if *key* is not an edge.
+        """
+
+        if key not in self._id:
+            raise ValueError("Not an edge")
+
+        return self._id[key]
+
+    def add_edge(self, key):
+        """Give an id to the new edge *key*, its values are the defaults of the columns.
+
+        Returns(int): the id, None if *key* already has one.
+        """
+
+        if key in self._id:
+            return None
+
+        if self._free:
+            edge_id = self._free.pop()
+        else:
+            edge_id = self._size
+            self._size += 1
+            for name, column in self._columns.items():
+                column.append(self._defaults[name])
+
+        self._id[key] = edge_id
+
+        return edge_id
+
+    def remove_edge(self, key, keep=False):
+        """Release the id of edge *key*.
+
+        Args:
+            key: key of the edge.
+            keep(bool): if True, the id and its values are kept until :meth:`release` or :meth:`undo_remove`.
+
+        Returns(int): the id, None if *key* has no id.
+        """
+
+        if key not in self._id:
+            return None
+
+        edge_id = self._id.pop(key)
+        if keep:
+            self._retired.add(edge_id)
+        else:
+            self._free_id(edge_id)
+
+        return edge_id
+
+    def undo_add(self, key, edge_id):
+        """Undo the :meth:`add_edge` of *key* which gave *edge_id*."""
+
+        del self._id[key]
+        self._free_id(edge_id)
+
+    def undo_remove(self, key, edge_id):
+        """Undo the :meth:`remove_edge` of *key*, kept with *edge_id*: the edge gets its id and values back."""
+
+        self._retired.remove(edge_id)
+        self._id[key] = edge_id
+
+    def _free_id(self, edge_id):
+        for name, column in self._columns.items():
+            column[edge_id] = self._defaults[name]
+        self._free.append(edge_id)
+
+    def release(self):
+        """Free the ids of the edges removed during the transactions."""
+
+        for edge_id in self._retired:
+            self._free_id(edge_id)
+        self._retired = set()
+
+    def add_column(self, name, typecode="d", default=None):
+        """Add a column.
+
+        Args:
+            name(str): name of the column.
+            typecode(str): typecode of the array (see :mod:`array`).
+            default: value of the edges, nan for floats and 0 for integers if None.
+
+        Raises:
+            ValueError: if the column already exists.
+        """
+
+        if name in self._columns:
+            raise ValueError("Already a column")
+
+        if default is None:
+            default = _default_value(typecode)
+        self._columns[name] = array(typecode, [default]) * self._size
+        self._defaults[name] = default
+
+    def remove_column(self, name):
+        """Remove column *name*.
+
+        Raises:
+            ValueError: if *name* is not a column.
+        """
+
+        self.column(name)
+        del self._columns[name]
+        del self._defaults[name]
+
+    def column(self, name):
+        """Column *name* (array indexed by the edge ids).
+
+        Raises:
+            ValueError: if *name* is not a column.
+        """
+
+        if name not in self._columns:
+            raise ValueError("Unknown edge column %s" % (str(name)))
+
+        return self._columns[name]
+
+    def get(self, name, keys):
+        """Values of the edges *keys* in column *name* (array)."""
+
+        column = self.column(name)
+        return array(column.typecode, (column[self.edge_id(key)] for key in keys))
+
+    def set(self, name, keys, values):
+        """Set the values of the edges *keys* in column *name*.
+
+        Raises:
+            ValueError: if *name* is not a column, if a key is not an edge or if there are not as many values as keys.
+
+        Returns(list): the couples (id, previous value) of the edges.
+        """
+
+        column = self.column(name)
+        ids = [self.edge_id(key) for key in keys]
+        values = list(values)
+        if len(values) != len(ids):
+            raise ValueError("One value per edge")
+
+        previous = [(edge_id, column[edge_id]) for edge_id in ids]
+        for edge_id, value in zip(ids, values):
+            column[edge_id] = value
+
+        return previous
+
+    def restore(self, name, previous):
+        """Undo a :meth:`set` of column *name* which returned *previous*, nothing if the column was removed."""
+
+        if name in self._columns:
+            column = self._columns[name]
+            for edge_id, value in reversed(previous):
+                column[edge_id] = value
@@ -0,0 +1,334 @@
+from array import array
+from bisect import bisect_left
+
+from ._mixed_graph import UNDIRECTED_EDGE, DIRECTED_EDGE, NeighborhoodView
+
+__author__ = 'fbrucker'
+
+_UNDIRECTED, _DIRECTED, _DIRECTED_DUAL = range(3)
+
+
+def _index_array(values, bound):
+    """Compact array of non negative integers lower than *bound*."""
+
+    return array("i" if bound < 2 ** 31 else "q", values)
+
+
+class _NeighborSlice(object):
+    """Read-only container of the vertices whose ids are in a sorted slice of CSR indices."""
+
+    __slots__ = ("_graph", "_indices", "_start", "_stop")
+
+    def __init__(self, graph, indices, start, stop):
+        self._graph = graph
+        self._indices = indices
+        self._start = start
+        self._stop = stop
+
+    def __contains__(self, x):
+        j = self._graph._vertex_to_index.get(x)
+        if j is None:
+            return False
+
+        k = bisect_left(self._indices, j, self._start, self._stop)
+        return k < self._stop and self._indices[k] == j
+
+    def __iter__(self):
+        vertices = self._graph._index_to_vertex
+        for k in range(self._start, self._stop):
+            yield vertices[self._indices[k]]
+
+    def __len__(self):
+        return self._stop - self._start
+
+
+class FrozenMixedGraph(object):
+    """Immutable compressed sparse row (CSR) view of a mixed graph.
+
+    Vertices are numbered from 0 to n - 1. For each kind of adjacency (undirected, directed and reverse-directed),
+    the sorted neighbor ids of the vertex of id *i* are ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+
+    def __init__(self, graph):
+        """Freeze *graph*.
+
+        Args:
+            graph(MixedGraph): the graph to freeze. Edge attributes are not kept.
+        """
+
+        self._index_to_vertex = list(graph.vertices)
+        self._vertex_to_index = {x: i for i, x in enumerate(self._index_to_vertex)}
+
+        n = len(self._index_to_vertex)
+        self._indptr = []
+        self._indices = []
+        for adjacency in (graph._undirected, graph._directed, graph._directed_dual):
+            indptr = [0]
+            indices = []
+            for x in self._index_to_vertex:
+                indices.extend(sorted(self._vertex_to_index[y] for y in adjacency[x]))
+                indptr.append(len(indices))
+
+            self._indptr.append(_index_array(indptr, len(indices) + 1))
+            self._indices.append(_index_array(indices, n))
+
+        self._vertices = frozenset(self._index_to_vertex)
+
+    @property
+    def vertices(self):
+        """Vertex set."""
+
+        return self._vertices
+
+    def vertex_id(self, x):
+        """Integer id of vertex *x*.
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+        """
+
+        return self._id(x)
+
+    def vertex(self, i):
+        """Vertex of integer id *i*."""
+
+        return self._index_to_vertex[i]
+
+    def csr(self, kind, dual=False):
+        """Raw CSR arrays.
+
+        Args:
+            kind(str): either ``UNDIRECTED_EDGE`` or ``DIRECTED_EDGE``.
+            dual(bool): for directed edges, if True returns the reverse-directed adjacency.
+
+        Raises:
+            ValueError: if kind is unknown.
+
+        Returns:
+            A couple (indptr, indices) of :class:`array.array`.
+        """
+
+        position = self._position(kind, dual)
+        return self._indptr[position], self._indices[position]
+
+    @property
+    def edges(self):
+        """Undirected and directed edges.
+
+        returns:
+            A couple (U, D) where U is a :class:`frozenset` of 2-element frozenset (the undirected edges) and D is a
+            frozenset of 2-element tuple (the directed edges).
+        """
+
+        return (frozenset(frozenset([x, y]) for x, y in self._pairs(_UNDIRECTED)),
+                frozenset(self._pairs(_DIRECTED)))
+
+    _edges = edges
+
+    def _pairs(self, position):
+        indptr, indices = self._indptr[position], self._indices[position]
+        vertices = self._index_to_vertex
+        for i, x in enumerate(vertices):
+            for j in indices[indptr[i]:indptr[i + 1]]:
+                yield x, vertices[j]
+
+    def _position(self, kind, dual=False):
+        if kind == UNDIRECTED_EDGE:
+            return _UNDIRECTED
+        elif kind == DIRECTED_EDGE:
+            return dual and _DIRECTED_DUAL or _DIRECTED
+        else:
+            raise ValueError("Unknown edge type kind=%s" % (str(kind)))
+
+    def _neighbor_ids(self, i, position):
+        indptr = self._indptr[position]
+        return self._indices[position][indptr[i]:indptr[i + 1]]
+
+    def _is_neighbor_id(self, i, j, position):
+        indptr, indices = self._indptr[position], self._indices[position]
+        k = bisect_left(indices, j, indptr[i], indptr[i + 1])
+        return k < indptr[i + 1] and indices[k] == j
+
+    def _id(self, x):
+        if x not in self._vertex_to_index:
+            raise ValueError("Not a vertex")
+
+        return self._vertex_to_index[x]
+
+    def __repr__(self):
+        undirected, directed = self.edges
+        return "".join(["FrozenMixedGraph(",
+                        repr(self.vertices),
+                        ", ", repr(undirected),
+                        ", ", repr(directed),
+                        ")"])
+
+    def __eq__(self, g):
+        """Same vertices and same edges."""
+
+        return self.vertices == g.vertices and self.edges == g.edges
+
+    def __ne__(self, g):
+        """not ==."""
+
+        return not self == g
+
+    def __len__(self):
+        """Number of vertices."""
+
+        return len(self._index_to_vertex)
+
+    def __iter__(self):
+        """Iteration over the vertices."""
+
+        return iter(self._index_to_vertex)
+
+    def __contains__(self, vertex):
+        """is a vertex"""
+
+        return vertex in self._vertex_to_index
+
+    def isa_vertex(self, x):
+        """Test if a vertex exists
+
+        Args:
+            x: a vertex to test.
+
+        Returns(bool):
+            True if *x* is a vertex, False otherwise.
+        """
+
+        return x in self._vertex_to_index
+
+    def isa_edge(self, x, y, kind=None):
+        """test if {x, y} or (x, y) is a edge.
+
+        Args:
+            x: a vertex.
+            y: a vertex.
+            kind: ``UNDIRECTED_EDGE``, ``UNDIRECTED_EDGE`` or `None` by default. Type of edge, both by default.
+
+        Returns(bool):
+            By default, returns True if {x, y} is or (x, y) is an edge, False otherwise. Kind of edge can be precised.
+        """
+
+        i, j = self._id(x), self._id(y)
+
+        if kind is None:
+            return self._is_neighbor_id(i, j, _UNDIRECTED) or self._is_neighbor_id(i, j, _DIRECTED)
+
+        return self._is_neighbor_id(i, j, self._position(kind))
+
+    @property
+    def nb_edges(self):
+
+        return len(self._indices[_DIRECTED]) + .5 * len(self._indices[_UNDIRECTED])
+
+    def degree(self, x):
+        """number of undirected, and directed edge ending or begining in x.
+        """
+
+        i = self._id(x)
+        return sum(indptr[i + 1] - indptr[i] for indptr in self._indptr)
+
+    def __call__(self, x, undirected=True, begin=True, end=False, closed=False):
+        """Neighborhood of vertex x.
+
+        Args:
+            x: a vertex.
+            undirected(bool): if True add undirected edges containing *x*
+            begin(bool): if True add directed edges beginning with *x*
+            end(bool): if True add directed edges ending with *x*
+            closed(bool): if true adds *x* in the returns (closed neighborhood).
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+
+        Returns(frozenset):
+            the neighbors of *x* according to the boolean specifications.
+
+        """
+
+        i = self._id(x)
+        vertices = self._index_to_vertex
+
+        neighborhood = set()
+
+        if closed:
+            neighborhood.add(x)
+        for position, is_used in ((_UNDIRECTED, undirected), (_DIRECTED, begin), (_DIRECTED_DUAL, end)):
+            if is_used:
+                neighborhood.update(vertices[j] for j in self._neighbor_ids(i, position))
+
+        return frozenset(neighborhood)
+
+    def neighbors_view(self, x, undirected=True, begin=True, end=False, closed=False):
+        """Neighborhood of vertex x, without copy.
+
+        Args:
+            x: a vertex.
+            undirected(bool): if True add undirected edges containing *x*
+            begin(bool): if True add directed edges beginning with *x*
+            end(bool): if True add directed edges ending with *x*
+            closed(bool): if true adds *x* in the returns (closed neighborhood).
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+
+        Returns(NeighborhoodView):
+            A read-only view of the neighbors of *x* according to the boolean specifications, backed by the CSR
+            arrays. Membership tests are binary searches in the sorted neighbor ids.
+        """
+
+        i = self._id(x)
+
+        parts = []
+        if closed:
+            parts.append((x,))
+        for position, is_used in ((_UNDIRECTED, undirected), (_DIRECTED, begin), (_DIRECTED_DUAL, end)):
+            if is_used:
+                indptr = self._indptr[position]
+                parts.append(_NeighborSlice(self, self._indices[position], indptr[i], indptr[i + 1]))
+
+        return NeighborhoodView(tuple(parts))
+
+    def iter_neighbors(self, x, undirected=True, begin=True, end=False, closed=False):
+        """Iterator over the neighborhood of vertex x.
+
+        Args:
+            x: a vertex.
+            undirected(bool): if True add undirected edges containing *x*
+            begin(bool): if True add directed edges beginning with *x*
+            end(bool): if True add directed edges ending with *x*
+            closed(bool): if true adds *x* in the returns (closed neighborhood).
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+
+        Returns(iterator):
+            the neighbors of *x* according to the boolean specifications.
+        """
+
+        i = self._id(x)
+        positions = [position for position, is_used in
+                     ((_UNDIRECTED, undirected), (_DIRECTED, begin), (_DIRECTED_DUAL, end)) if is_used]
+
+        return self._iter_neighbors(x, i, positions, closed)
+
+    def _iter_neighbors(self, x, i, positions, closed):
+        vertices = self._index_to_vertex
+
+        if len(positions) == 1 and not closed:
+            for j in self._neighbor_ids(i, positions[0]):
+                yield vertices[j]
+            return
+
+        seen = set()
+        if closed:
+            seen.add(i)
+            yield x
+        for position in positions:
+            for j in self._neighbor_ids(i, position):
+                if j not in seen:
+                    seen.add(j)
+                    yield vertices[j]
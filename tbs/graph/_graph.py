@@ -78,7 +78,7 @@ class Graph(MixedGraph):
         return cls().update(edges)
 
     @classmethod
-    def from_dissimilarity(cls, dissimilarity, threshold=None):
+    def from_dissimilarity(cls, dissimilarity, threshold=None, column=None):
         """Threshold graph of *dissimilarity* at height *threshold*.
 
         :param dissimilarity: to be converted in graph.
@@ -87,6 +87,9 @@ class Graph(MixedGraph):
         :param threshold: If :const:`None`, the maximal value of *dissimilarity* is used.
         :type threshold: must be `comparable` with *dissimilarity*'s values
 
+        :param column: If not :const:`None`, the values are also stored in the float edge column of this name.
+        :type column: str
+
         :return: a graph with vertex set equal to the elements of *dissimilarity* and *xy*
                  is an edge iff *dissimilarity*\ (x, y) <= *threshold*.
         :rtype: :class:`Graph`
@@ -95,18 +98,24 @@ class Graph(MixedGraph):
         elems = list(dissimilarity)
 
         self = cls(elems)
+        edges = []
         for i, x in enumerate(elems):
             for y in elems[i+1:]:
                 if threshold is None or dissimilarity(x, y) <= threshold:
                     self.update([(x, y)])
                     self[x, y] = dissimilarity(x, y)
+                    edges.append((x, y))
+
+        if column is not None:
+            self.add_edge_column(column)
+            self.set_edge_values(column, edges, (self[x, y] for x, y in edges))
 
         return self
 
     def __repr__(self):
         undirected, directed = self._edges
         return "".join(["Graph(",
-                        repr(self.vertices),
+                        repr(frozenset(self.vertices)),
                         ", ", repr(undirected),
                         ")"])
 
@@ -1,10 +1,69 @@
+import copy
 import json
+from collections.abc import Set
+
+from ._edge_columns import EdgeColumns
+from ._shortest_path import EDGE_ATTRIBUTE, shortest_path_forest, path_from_fathers, ShortestPathTree, all_pairs_distances
 
 __author__ = 'fbrucker'
 
 UNDIRECTED_EDGE = "UNDIRECTED_EDGE"
 DIRECTED_EDGE = "DIRECTED_EDGE"
 
+_ADJACENCY, _ADD_VERTEX, _REMOVE_VERTEX, _EDGE_ID, _EDGE_VALUES, _EDGE_COLUMNS = range(6)  # journal operations
+
+
+class NeighborhoodView(Set):
+    """Read-only set view of a neighborhood.
+
+    The view is backed by the adjacency dicts of the graph: nothing is copied and it reflects further
+    modifications of the graph.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, parts):
+        """A neighborhood view.
+
+        Args:
+            parts(tuple): containers (dict key views) whose union is the neighborhood.
+        """
+
+        self._parts = parts
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return frozenset(iterable)
+
+    def __contains__(self, x):
+        for part in self._parts:
+            if x in part:
+                return True
+        return False
+
+    def __iter__(self):
+        parts = self._parts
+        if len(parts) == 1:
+            yield from parts[0]
+            return
+
+        for i, part in enumerate(parts):
+            for x in part:
+                for previous in parts[:i]:
+                    if x in previous:
+                        break
+                else:
+                    yield x
+
+    def __len__(self):
+        if len(self._parts) == 1:
+            return len(self._parts[0])
+
+        return sum(1 for x in self)
+
+    def __repr__(self):
+        return "".join(["NeighborhoodView(", repr(frozenset(self)), ")"])
+
 
 class MixedGraph(object):
     """Generic Mixed Graph class.
@@ -23,10 +82,21 @@ class MixedGraph(object):
         One Cannot have both (x, y) as undirected and directed edge.
         """
 
-        self._vertices = frozenset()
+        self._vertices = dict()  # vertex index, keys are the vertices
         self._undirected = dict()  # x - y means y in dict[x] and x in dict[y]
         self._directed = dict()  # x -> y means y in dict[x]
         self._directed_dual = dict()  # x -> y means x in dict[y]
+        self._owned = set()  # vertices whose adjacency dicts are not shared with a copy
+
+        self._journal = None  # undo journal, only kept during transactions
+        self._transactions = []  # journal length at the beginning of each transaction
+
+        self._version = 0  # incremented at each modification
+        self._edges_cache = None
+        self._edges_cache_version = None
+        self._path_cache = dict()  # shortest path results of the current version
+        self._path_cache_version = None
+        self._edge_columns = None  # typed edge attributes, created with the first column
 
         for x in vertices:
             self.add(x)
@@ -92,10 +162,60 @@ class MixedGraph(object):
         vertices, undirected, directed = cls._graph_parts_from_json(json_graph, id_to_vertex_conversion)
         return cls(vertices, undirected, directed)
 
+    def copy(self):
+        """Copy of the graph.
+
+        The adjacency of each vertex is shared (copy-on-write) between the graph and its copy: it is duplicated
+        only when one of them first modifies it. Only the top-level vertex maps are copied, which is still linear in
+        the number of vertices (as shallow dict copies); modifying a copy then only costs the vertices whose
+        neighborhood changes.
+
+        Returns(MixedGraph): A new graph of the same class.
+        """
+
+        graph = copy.copy(self)
+        graph._vertices = dict(self._vertices)
+        graph._undirected = dict(self._undirected)
+        graph._directed = dict(self._directed)
+        graph._directed_dual = dict(self._directed_dual)
+
+        graph._owned = set()
+        self._owned = set()
+
+        graph._journal = None
+        graph._transactions = []
+
+        graph._path_cache = dict()
+        graph._path_cache_version = None
+
+        if self._edge_columns is not None:
+            graph._edge_columns = self._edge_columns.copy()
+            graph._edge_columns.release()
+
+        return graph
+
+    def __getstate__(self):
+        """State for pickling, without the shortest path cache (which may hold unpicklable valuations)."""
+
+        state = dict(self.__dict__)
+        state["_path_cache"] = dict()
+        state["_path_cache_version"] = None
+
+        return state
+
+    def _own(self, x):
+        """Make the adjacency dicts of *x* private to the graph before modifying them."""
+
+        if x not in self._owned:
+            self._undirected[x] = dict(self._undirected[x])
+            self._directed[x] = dict(self._directed[x])
+            self._directed_dual[x] = dict(self._directed_dual[x])
+            self._owned.add(x)
+
     def __repr__(self):
         undirected, directed = self.edges
         return "".join(["MixedGraph(",
-                        repr(self.vertices),
+                        repr(frozenset(self.vertices)),
                         ", ", repr(undirected),
                         ", ", repr(directed),
                         ")"])
@@ -143,23 +263,55 @@ class MixedGraph(object):
 
         return {"graph": json_graph}
 
+    def freeze(self):
+        """Immutable compressed sparse row view of the graph.
+
+        Edge attributes are not kept.
+
+        Returns(FrozenMixedGraph): a frozen copy of the graph.
+        """
+
+        from ._frozen_graph import FrozenMixedGraph
+
+        return FrozenMixedGraph(self)
+
     @property
     def vertices(self):
-        """Vertex set."""
+        """Vertex set.
+
+        A read-only set view (`dict.keys()`), updated with the graph. It supports `in`, `len`, iteration, the
+        comparisons and the operators `&`, `|`, `-` and `^` of sets, but not the set methods such as `union` or
+        `issubset`, and it is not hashable: use `frozenset(graph.vertices)` for a frozen copy.
+        """
 
-        return self._vertices
+        return self._vertices.keys()
+
+    @property
+    def version(self):
+        """Modification counter.
+
+        Incremented each time vertices, edges or edge attributes are modified.
+        """
+
+        return self._version
 
     @property
     def _edges(self):
         """Undirected and directed edges.
 
+        Edges are computed once and cached until the next modification of the graph.
+
         returns:
             A couple (U, D) where U is a :class:`frozenset` of 2-element frozenset (the undirected edges) and D is a
             frozenset of 2-element tuple (the directed edges).
         """
 
-        return [frozenset(frozenset([x, y]) for x, Y in self._undirected.items() for y in Y),
-                frozenset((x, y) for x, Y in self._directed.items() for y in Y)]
+        if self._edges_cache_version != self._version:
+            self._edges_cache = (frozenset(frozenset([x, y]) for x, Y in self._undirected.items() for y in Y),
+                                 frozenset((x, y) for x, Y in self._directed.items() for y in Y))
+            self._edges_cache_version = self._version
+
+        return self._edges_cache
 
     @property
     def edges(self):
@@ -206,10 +358,15 @@ class MixedGraph(object):
         if x in self.vertices:
             raise ValueError("Already a vertex")
 
-        self._vertices = self._vertices.union([x])
+        self._version += 1
+        self._vertices[x] = None
         self._undirected[x] = dict()
         self._directed[x] = dict()
         self._directed_dual[x] = dict()
+        self._owned.add(x)
+
+        if self._journal is not None:
+            self._journal.append((_ADD_VERTEX, x))
 
     def remove(self, x):
         """Remove vertex *x*.
@@ -224,18 +381,55 @@ class MixedGraph(object):
         if x not in self.vertices:
             raise ValueError("Not a vertex")
 
-        self._vertices = self._vertices.difference([x])
+        self._version += 1
         for y in self._directed[x]:
-            del self._directed_dual[y][x]
-        del self._directed[x]
-
+            self._del_adjacency(self._directed_dual, y, x)
         for y in self._directed_dual[x]:
-            del self._directed[y][x]
-        del self._directed_dual[x]
-
+            self._del_adjacency(self._directed, y, x)
         for y in self._undirected[x]:
-            del self._undirected[y][x]
+            self._del_adjacency(self._undirected, y, x)
+
+        if self._journal is not None:
+            self._journal.append((_REMOVE_VERTEX, x,
+                                  self._undirected[x], self._directed[x], self._directed_dual[x]))
+
+        del self._vertices[x]
         del self._undirected[x]
+        del self._directed[x]
+        del self._directed_dual[x]
+        self._owned.discard(x)
+
+    def add_vertices(self, vertices):
+        """Add vertices.
+
+        Args:
+            vertices(iterable): new vertices to add.
+        Raises:
+            ValueError: if a vertex is already in the graph or is given twice. No vertex is added.
+        """
+
+        vertices = list(vertices)
+        if len(set(vertices)) != len(vertices) or any(x in self._vertices for x in vertices):
+            raise ValueError("Already a vertex")
+
+        for x in vertices:
+            self.add(x)
+
+    def remove_vertices(self, vertices):
+        """Remove vertices.
+
+        Args:
+            vertices(iterable): vertices to remove.
+        Raises:
+            ValueError: if one of them is not a vertex. No vertex is removed.
+        """
+
+        vertices = set(vertices)
+        if any(x not in self._vertices for x in vertices):
+            raise ValueError("Not a vertex")
+
+        for x in vertices:
+            self.remove(x)
 
     def difference(self, edges):
         """Remove edges.
@@ -249,16 +443,17 @@ class MixedGraph(object):
             self (for possible chaining).
         """
 
+        self._version += 1
         for x, y in edges:
             if x not in self.vertices or y not in self.vertices:
                 continue
 
             if y in self._undirected[x]:
-                del self._undirected[x][y]
-                del self._undirected[y][x]
+                self._del_adjacency(self._undirected, x, y)
+                self._del_adjacency(self._undirected, y, x)
             elif y in self._directed[x]:
-                del self._directed[x][y]
-                del self._directed_dual[y][x]
+                self._del_adjacency(self._directed, x, y)
+                self._del_adjacency(self._directed_dual, y, x)
 
         return self
 
@@ -291,6 +486,7 @@ class MixedGraph(object):
         return self
 
     def __update_undirected(self, edges, node_creation=True):
+        self._version += 1
         for x, y in edges:
             if (x not in self.vertices or y not in self.vertices) and not node_creation:
                 continue
@@ -304,17 +500,19 @@ class MixedGraph(object):
                 continue
 
             if y in self._directed[x]:
-                del self._directed[x][y]
-                del self._directed_dual[y][x]
+                self._del_adjacency(self._directed, x, y)
+                self._del_adjacency(self._directed_dual, y, x)
             elif x in self._directed[y]:
-                del self._directed[y][x]
-                del self._directed_dual[x][y]
+                self._del_adjacency(self._directed, y, x)
+                self._del_adjacency(self._directed_dual, x, y)
 
-            self._undirected[x][y] = self._undirected[y][x] = None
+            self._set_adjacency(self._undirected, x, y, None)
+            self._set_adjacency(self._undirected, y, x, None)
 
         return self
 
     def __update_directed(self, edges, node_creation=True):
+        self._version += 1
         for x, y in edges:
             if (x not in self.vertices or y not in self.vertices) and not node_creation:
                 continue
@@ -328,13 +526,150 @@ class MixedGraph(object):
                 continue
 
             if y in self._undirected[x]:
-                del self._undirected[x][y]
-                del self._undirected[y][x]
+                self._del_adjacency(self._undirected, x, y)
+                self._del_adjacency(self._undirected, y, x)
 
-            self._directed[x][y] = self._directed_dual[y][x] = None
+            self._set_adjacency(self._directed, x, y, None)
+            self._set_adjacency(self._directed_dual, y, x, None)
 
         return self
 
+    def _set_adjacency(self, adjacency, x, y, attribute):
+        """adjacency[x][y] = attribute, journaled."""
+
+        self._own(x)
+        if self._journal is not None:
+            self._journal.append((_ADJACENCY, adjacency, x, y, y in adjacency[x], adjacency[x].get(y)))
+        if self._edge_columns is not None and y not in adjacency[x]:
+            key = self._adjacency_key(adjacency, x, y)
+            edge_id = self._edge_columns.add_edge(key)
+            if edge_id is not None and self._journal is not None:
+                self._journal.append((_EDGE_ID, key, edge_id, True))
+        adjacency[x][y] = attribute
+
+    def _del_adjacency(self, adjacency, x, y):
+        """del adjacency[x][y], journaled."""
+
+        self._own(x)
+        if self._journal is not None:
+            self._journal.append((_ADJACENCY, adjacency, x, y, True, adjacency[x][y]))
+        if self._edge_columns is not None:
+            key = self._adjacency_key(adjacency, x, y)
+            edge_id = self._edge_columns.remove_edge(key, keep=self._journal is not None)
+            if edge_id is not None and self._journal is not None:
+                self._journal.append((_EDGE_ID, key, edge_id, False))
+        del adjacency[x][y]
+
+    def _adjacency_key(self, adjacency, x, y):
+        """Key (see :class:`EdgeColumns`) of the edge of adjacency[x][y]."""
+
+        if adjacency is self._undirected:
+            return frozenset([x, y])
+        elif adjacency is self._directed:
+            return x, y
+        else:
+            return y, x
+
+    def _is_edge_key(self, key):
+        if isinstance(key, frozenset):
+            x, y = (list(key) * 2)[:2]
+            return x in self._undirected and y in self._undirected[x]
+        x, y = key
+        return x in self._directed and y in self._directed[x]
+
+    def begin(self):
+        """Start a transaction.
+
+        Each further modification of the graph is journaled until the matching :meth:`commit` or :meth:`rollback`.
+        Transactions can be nested.
+        """
+
+        if self._journal is None:
+            self._journal = []
+        self._transactions.append(len(self._journal))
+
+    def commit(self):
+        """Keep the modifications of the current transaction.
+
+        Raises:
+            ValueError: if no transaction is in progress.
+        """
+
+        if not self._transactions:
+            raise ValueError("No transaction in progress")
+
+        self._transactions.pop()
+        if not self._transactions:
+            self._journal = None
+            if self._edge_columns is not None:
+                self._edge_columns.release()
+
+    def rollback(self):
+        """Undo the modifications of the current transaction.
+
+        Time is proportional to the number of modifications, not to the size of the graph.
+
+        Raises:
+            ValueError: if no transaction is in progress.
+        """
+
+        if not self._transactions:
+            raise ValueError("No transaction in progress")
+
+        start = self._transactions.pop()
+        journal, self._journal = self._journal, None
+        keys = None  # edges modified before the creation of the edge columns
+
+        while len(journal) > start:
+            operation = journal.pop()
+            if operation[0] == _ADJACENCY:
+                adjacency, x, y, is_present, attribute = operation[1:]
+                if keys is not None:
+                    keys.add(self._adjacency_key(adjacency, x, y))
+                self._own(x)
+                if is_present:
+                    adjacency[x][y] = attribute
+                else:
+                    del adjacency[x][y]
+            elif operation[0] == _ADD_VERTEX:
+                x = operation[1]
+                del self._vertices[x]
+                del self._undirected[x]
+                del self._directed[x]
+                del self._directed_dual[x]
+                self._owned.discard(x)
+            elif operation[0] == _REMOVE_VERTEX:
+                x, undirected, directed, directed_dual = operation[1:]
+                self._vertices[x] = None
+                self._undirected[x] = undirected
+                self._directed[x] = directed
+                self._directed_dual[x] = directed_dual
+            elif operation[0] == _EDGE_ID:
+                key, edge_id, is_added = operation[1:]
+                if is_added:
+                    self._edge_columns.undo_add(key, edge_id)
+                else:
+                    self._edge_columns.undo_remove(key, edge_id)
+            elif operation[0] == _EDGE_VALUES:
+                self._edge_columns.restore(*operation[1:])
+            else:
+                keys = set()
+
+        if keys is not None:
+            for key in keys:
+                if self._is_edge_key(key):
+                    self._edge_columns.add_edge(key)
+                else:
+                    self._edge_columns.remove_edge(key)
+
+        if self._transactions:
+            self._journal = journal
+            if keys is not None:
+                self._journal.append((_EDGE_COLUMNS,))
+        elif self._edge_columns is not None:
+            self._edge_columns.release()
+        self._version += 1
+
     def __len__(self):
         """Number of vertices."""
 
@@ -389,13 +724,167 @@ class MixedGraph(object):
             ValueError: if edge is not an edge.
         """
         x, y = edge
+        self._version += 1
         if y in self._undirected[x]:
-            self._undirected[x][y] = self._undirected[y][x] = attribute
+            self._set_adjacency(self._undirected, x, y, attribute)
+            self._set_adjacency(self._undirected, y, x, attribute)
         elif y in self._directed[x]:
-            self._directed[x][y] = self._directed_dual[y][x] = attribute
+            self._set_adjacency(self._directed, x, y, attribute)
+            self._set_adjacency(self._directed_dual, y, x, attribute)
+        else:
+            raise ValueError("Not an edge")
+
+    def _edge_key(self, x, y):
+        """Key (see :class:`EdgeColumns`) of edge (x, y).
+
+        Raises:
+            ValueError: if (x, y) is not an edge.
+        """
+
+        if x in self._undirected and y in self._undirected[x]:
+            return frozenset([x, y])
+        elif x in self._directed and y in self._directed[x]:
+            return x, y
         else:
             raise ValueError("Not an edge")
 
+    def _columns(self):
+        """The edge columns, created with the ids of the current edges if needed."""
+
+        if self._edge_columns is None:
+            self._edge_columns = EdgeColumns([frozenset([x, y]) for x in self for y in self._undirected[x]] +
+                                             [(x, y) for x in self for y in self._directed[x]])
+            if self._journal is not None:
+                self._journal.append((_EDGE_COLUMNS,))  # the ids of the previous modifications are not journaled
+
+        return self._edge_columns
+
+    @property
+    def edge_columns(self):
+        """Names of the edge columns (tuple)."""
+
+        return tuple() if self._edge_columns is None else self._edge_columns.names
+
+    def add_edge_column(self, name, typecode="d", default=None):
+        """Add a typed attribute column to the edges.
+
+        Each edge has an integer id (see :meth:`edge_id`) and the column is an `array` indexed by these ids. Column
+        values are independent of the attributes set by :meth:`__setitem__`. Ids and values set by
+        :meth:`set_edge_values` are restored by :meth:`rollback`, but adding or removing a column is not undone.
+
+        Args:
+            name(str): name of the column, not :const:`EDGE_ATTRIBUTE`.
+            typecode(str): typecode of the array (see :mod:`array`), floats by default.
+            default: value of the edges until set, nan for floats and 0 for integers if None.
+
+        Raises:
+            ValueError: if the column already exists.
+        """
+
+        if name == EDGE_ATTRIBUTE:
+            raise ValueError("Reserved name")
+
+        self._columns().add_column(name, typecode, default)
+
+    def remove_edge_column(self, name):
+        """Remove edge column *name*.
+
+        Raises:
+            ValueError: if *name* is not an edge column.
+        """
+
+        self._version += 1
+        self._columns().remove_column(name)
+
+    def edge_column(self, name):
+        """Edge column *name*, an `array` indexed by the edge ids (see :meth:`edge_id`).
+
+        The array must not be modified, use :meth:`set_edge_values`.
+
+        Raises:
+            ValueError: if *name* is not an edge column.
+        """
+
+        return self._columns().column(name)
+
+    def edge_id(self, x, y):
+        """Id of edge (x, y) in the edge columns, kept as long as the edge is in the graph.
+
+        Raises:
+            ValueError: if (x, y) is not an edge.
+        """
+
+        return self._columns().edge_id(self._edge_key(x, y))
+
+    def edge_values(self, name, edges):
+        """Values of *edges* in edge column *name*.
+
+        Args:
+            name(str): an edge column.
+            edges(iterable): pairs (x, y).
+
+        Raises:
+            ValueError: if *name* is not an edge column or if a pair is not an edge.
+
+        Returns(array): the values, in the order of *edges*.
+        """
+
+        return self._columns().get(name, [self._edge_key(x, y) for x, y in edges])
+
+    def set_edge_values(self, name, edges, values):
+        """Set the values of *edges* in edge column *name*.
+
+        Args:
+            name(str): an edge column.
+            edges(iterable): pairs (x, y).
+            values(iterable): one value per edge.
+
+        Raises:
+            ValueError: if *name* is not an edge column, if a pair is not an edge or if there are not as many values
+                as edges. No value is set.
+        """
+
+        self._version += 1
+        previous = self._columns().set(name, [self._edge_key(x, y) for x, y in edges], values)
+        if self._journal is not None:
+            self._journal.append((_EDGE_VALUES, name, previous))
+
+    def _edge_column_weight(self, name, default=None):
+        """Function (u, v) -> value of edge (u, v) in edge column *name*, for a traversal of the graph.
+
+        If *default* is not None, the function is defined on every pair: a directed edge (u, v) also gives the value
+        of (v, u) if it is not an edge, and the other pairs have value *default*. The values are read once.
+        """
+
+        column = self._columns().column(name)
+        edge_id = self._edge_columns.ids
+
+        if default is not None:
+            values = dict()
+            undirected = []
+            for key, i in edge_id.items():
+                if isinstance(key, frozenset):
+                    undirected.append((key, column[i]))
+                else:
+                    u, v = key
+                    values[u, v] = column[i]
+                    values.setdefault((v, u), column[i])
+            for key, value in undirected:
+                u, v = key
+                values[u, v] = values[v, u] = value
+
+            def weight(u, v):
+                return values.get((u, v), default)
+
+            return weight
+
+        undirected = self._undirected
+
+        def weight(u, v):
+            return column[edge_id[frozenset([u, v]) if v in undirected[u] else (u, v)]]
+
+        return weight
+
     def __call__(self, x, undirected=True, begin=True, end=False, closed=False):
         """Neighborhood of vertex x.
 
@@ -430,6 +919,59 @@ class MixedGraph(object):
 
         return frozenset(neighborhood)
 
+    def neighbors_view(self, x, undirected=True, begin=True, end=False, closed=False):
+        """Neighborhood of vertex x, without copy.
+
+        Args:
+            x: a vertex.
+            undirected(bool): if True add undirected edges containing *x*
+            begin(bool): if True add directed edges beginning with *x*
+            end(bool): if True add directed edges ending with *x*
+            closed(bool): if true adds *x* in the returns (closed neighborhood).
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+
+        Returns(NeighborhoodView):
+            A read-only view of the neighbors of *x* according to the boolean specifications.
+        """
+
+        if x not in self.vertices:
+            raise ValueError("Not a vertex")
+
+        parts = []
+        if closed:
+            parts.append((x,))
+        if undirected:
+            parts.append(self._undirected[x].keys())
+        if begin:
+            parts.append(self._directed[x].keys())
+        if end:
+            parts.append(self._directed_dual[x].keys())
+
+        return NeighborhoodView(tuple(parts))
+
+    def iter_neighbors(self, x, undirected=True, begin=True, end=False, closed=False):
+        """Iterator over the neighborhood of vertex x, without copy.
+
+        The graph must not be modified during the iteration.
+
+        Args:
+            x: a vertex.
+            undirected(bool): if True add undirected edges containing *x*
+            begin(bool): if True add directed edges beginning with *x*
+            end(bool): if True add directed edges ending with *x*
+            closed(bool): if true adds *x* in the returns (closed neighborhood).
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+
+        Returns(iterator):
+            the neighbors of *x* according to the boolean specifications.
+        """
+
+        return iter(self.neighbors_view(x, undirected=undirected, begin=begin, end=end, closed=closed))
+
     def isa_vertex(self, x):
         """Test if a vertex exists
 
@@ -495,52 +1037,103 @@ class MixedGraph(object):
         if new_name != y:
             self.remove(y)
 
-    def path(self, x, y, valuation=lambda u, v: 1, forbidden_vertices=frozenset()):
-        """A minimal path (according to f) from *x* to *y*.
+    def _cached_path_result(self, key, compute):
+        """Result stored under *key* for the current version of the graph, computed by *compute()* if missing."""
+
+        if self._path_cache_version != self._version:
+            self._path_cache = dict()
+            self._path_cache_version = self._version
+
+        if key not in self._path_cache:
+            self._path_cache[key] = compute()
+
+        return self._path_cache[key]
 
-        Bellman-ford algorithm.
+    def shortest_path_tree(self, sources, valuation=None, forbidden_vertices=frozenset(), negative_valuation=False):
+        """Shortest paths from *sources* to all the vertices.
+
+        The result is cached until the next modification of the graph. A function valuation is identified by the
+        function object: it must not change while the graph is not modified.
 
         Args:
-            u: vertex
-            v: vertex
-            valuation(u, v -> value): associates the edge u, v to a real number.
+            sources: a vertex or an iterable of vertices (a frozenset, a set, a list or a tuple). A frozenset or a
+                tuple which is a vertex is a single source.
+            valuation: None for unit weights, a function (u, v -> value), :const:`EDGE_ATTRIBUTE` or the name of an
+                edge column.
+            forbidden_vertices(iterable): set of vertices which are not in the paths (except for sources).
+            negative_valuation(bool): if True, the valuation may be negative.
+
+        Raises:
+            ValueError: if the valuation is negative and *negative_valuation* is False.
+            Exception: if there is an absorbent circuit (*negative_valuation* only).
+
+        Returns(ShortestPathTree): distances and paths to any target.
+        """
+
+        if not isinstance(sources, (frozenset, set, list, tuple)) or \
+                (isinstance(sources, (frozenset, tuple)) and sources in self):
+            sources = frozenset([sources])
+        else:
+            sources = frozenset(sources)
+        forbidden_vertices = frozenset(forbidden_vertices)
+
+        return self._cached_path_result(
+            ("tree", sources, valuation, forbidden_vertices, bool(negative_valuation)),
+            lambda: ShortestPathTree(self, sources, valuation, forbidden_vertices, negative_valuation))
+
+    def distance_matrix(self, valuation=None, negative_valuation=False, workers=1):
+        """Distances between all pairs of vertices (see :func:`all_pairs_distances`).
+
+        The result is cached until the next modification of the graph.
+
+        Args:
+            valuation: None for unit weights, a function (u, v -> value), :const:`EDGE_ATTRIBUTE` or the name of an
+                edge column.
+            negative_valuation(bool): if True, the valuation may be negative.
+            workers(int): number of processes. None for the number of CPUs.
+
+        Returns(DistanceMatrix): the distances, vertices in the order of :attr:`vertices`.
+        """
+
+        return self._cached_path_result(
+            ("matrix", valuation, bool(negative_valuation)),
+            lambda: all_pairs_distances(self, valuation, negative_valuation, workers))
+
+    def path(self, x, y, valuation=None, forbidden_vertices=frozenset(), negative_valuation=False):
+        """A minimal path (according to valuation) from *x* to *y*.
+
+        Breadth first search for unit weights, Dijkstra algorithm for non negative weights and Bellman-ford
+        algorithm if *negative_valuation* is True. The search stops as soon as *y* is reached (except for
+        Bellman-Ford). If :meth:`shortest_path_tree` has been computed from *x* with the same parameters since the
+        last modification of the graph, the path is read from it. For many targets from the same *x*, use
+        :meth:`shortest_path_tree`.
+
+        Args:
+            x: vertex
+            y: vertex
+            valuation: None for unit weights, a function (u, v -> value) that associates the edge u, v to a real
+                number, :const:`EDGE_ATTRIBUTE` to use the attributes of the edges or the name of an edge column (see
+                :meth:`add_edge_column`) to read the weights from the column.
             forbidden_vertices(iterable): set of vertices which are not in the path
+            negative_valuation(bool): if True, the valuation may be negative.
+
+        Raises:
+            ValueError: if the valuation is negative and *negative_valuation* is False.
+            Exception: if there is an absorbent circuit (*negative_valuation* only).
+
         Returns(list):
-            a minimal path from x to y.
+            a minimal path from x to y, empty if there is none (or if *x* is not a vertex).
        """
 
-        k = 0
-        n = len(self)
-
-        father = {x: x}
-        dist = {x: 0}
-        change = True
-
-        while k < n and change:
-            change = False
-            k += 1
-            for u in self:
-                for v in self(u):
-                    if v in forbidden_vertices:
-                        continue
-                    if u in dist and (v not in dist or dist[v] > dist[u] + valuation(u, v)):
-                        dist[v] = dist[u] + valuation(u, v)
-                        father[v] = u
-                        change = True
-
-        if change:
-            raise Exception("Absorbent circuit")
-
-        if y not in father:
-            return []
-
-        path = []
-        current = y
-
-        while current != x:
-            path.append(current)
-            current = father[current]
-        path.append(x)
-        path.reverse()
-
-        return path
+        if x not in self:
+            return [x] if x == y else []
+
+        if self._path_cache_version == self._version:
+            key = ("tree", frozenset([x]), valuation, frozenset(forbidden_vertices), bool(negative_valuation))
+            if key in self._path_cache:
+                return self._path_cache[key].path(y)
+
+        dist, father = shortest_path_forest(self, [x], valuation, target=y, forbidden_vertices=forbidden_vertices,
+                                            negative_valuation=negative_valuation)
+
+        return path_from_fathers(father, y)
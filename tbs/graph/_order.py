@@ -1,7 +1,9 @@
 import collections
+import heapq
+import itertools
 
-from ._directed_graph import DirectedGraph
 from ._mixed_graph import MixedGraph
+from ._reachability import ReachabilityMatrix
 
 
 def dfs(graph, key=None):
@@ -29,10 +31,10 @@ def dfs(graph, key=None):
             if v not in is_seen:
                 is_seen.add(v)
                 dfs_order.append(v)
-                neighbors = list(graph(v))
                 if key:
-                    neighbors.sort(key=key)
-                stack.extend(neighbors)
+                    stack.extend(sorted(graph.iter_neighbors(v), key=key))
+                else:
+                    stack.extend(graph.iter_neighbors(v))
 
     return dfs_order
 
@@ -77,9 +79,9 @@ def bfs(graph, key=None):
         while fifo:
             v = fifo.pop()
             bfs_order.append(v)
-            neighbors = list(graph(v))
+            neighbors = graph.iter_neighbors(v)
             if key:
-                neighbors.sort(key=key)
+                neighbors = sorted(neighbors, key=key)
 
             for w in neighbors:
                 if w not in is_seen:
@@ -105,87 +107,96 @@ def bfs_from_vertex(graph, vertex):
 def topological_sort(dag, key=None):
     """Topologigical sort.
 
+    Kahn algorithm: vertices with no remaining entering edge are output one at a time. Iterative, so it handles
+    arbitrarily long chains, in O(n + m) time (O(n log n + m) with *key*).
+
     Args:
         dag(DirectedGraph): a directed acyclic graph
-        key(x->order position): Used for sorting the examination order (equivalent to sort with parameter key=key)
+        key(x->order position): if set, the vertex of smallest key is chosen among the available ones (a heap
+            is used)
 
     Raises(TypeError): if *dag* is not acyclic.
 
     Returns(list): topological order.
     """
 
-    reverse_order = []
-    is_seen = set()
-    is_seen_local = set()
-
-    def visit(vertex):
-        if vertex in is_seen:
-            return
-        elif vertex in is_seen_local:
-            raise TypeError
-
-        is_seen_local.add(vertex)
-
-        visit_list = list(dag(vertex))
-        if key is not None:
-            visit_list.sort(key=key)
-            visit_list.reverse()
-        for neighbor in visit_list:
-            visit(neighbor)
-
-        is_seen.add(vertex)
-        is_seen_local.remove(vertex)
-        reverse_order.append(vertex)
-
-    elements = list(dag)
-    if key:
-        elements.sort(key=key)
-        elements.reverse()
-
-    for x in elements:
-        visit(x)
-
-    reverse_order.reverse()
-    return reverse_order
-
-
-def direct_acyclic_graph_to_direct_comparability_graph(dag):
+    in_degree = {x: 0 for x in dag}
+    for x in dag:
+        for y in dag.iter_neighbors(x):
+            in_degree[y] += 1
+
+    order = []
+    if key is None:
+        available = collections.deque(x for x, degree in in_degree.items() if degree == 0)
+        while available:
+            x = available.popleft()
+            order.append(x)
+            for y in dag.iter_neighbors(x):
+                in_degree[y] -= 1
+                if in_degree[y] == 0:
+                    available.append(y)
+    else:
+        counter = itertools.count()
+        available = [(key(x), next(counter), x) for x, degree in in_degree.items() if degree == 0]
+        heapq.heapify(available)
+        while available:
+            x = heapq.heappop(available)[2]
+            order.append(x)
+            for y in dag.iter_neighbors(x):
+                in_degree[y] -= 1
+                if in_degree[y] == 0:
+                    heapq.heappush(available, (key(y), next(counter), y))
+
+    if len(order) != len(in_degree):
+        raise TypeError("Not a directed acyclic graph")
+
+    return order
+
+
+def direct_acyclic_graph_to_direct_comparability_graph(dag, as_matrix=False):
     """ Comparability graph from a dag.
 
+    The transitive closure is computed on bitset rows (see :class:`ReachabilityMatrix`).
+
     Args:
         dag(DirectedGraph): a directed acyclic graph
+        as_matrix(bool): if True, return the :class:`ReachabilityMatrix` of the comparability graph.
+
+    Raises(TypeError): if *dag* is not acyclic.
 
     Returns(DirectedGraph):
         The direct comparability graph of *dag* with no loop (to preserve acyclicity).
     """
-    direct_comparability = DirectedGraph(vertices=dag.vertices)
 
-    for vertex in topological_sort(dag):
-        for cover in dag(vertex, begin=False, end=True):
-            direct_comparability.update([(cover, vertex)])
-            direct_comparability.update([(y, vertex) for y in direct_comparability(cover, begin=False, end=True)])
+    direct_comparability = ReachabilityMatrix.from_dag(dag).closure()
+    if as_matrix:
+        return direct_comparability
 
-    return direct_comparability
+    return direct_comparability.to_directed_graph()
 
 
-def direct_comparability_graph_to_hase_diagram(direct_comparability):
+def direct_comparability_graph_to_hase_diagram(direct_comparability, as_matrix=False):
     """ hase diagram from a directed comparability graph.
 
+    The transitive reduction is computed on bitset rows (see :class:`ReachabilityMatrix`), loops are ignored.
+
     Args:
-        direct_comparability(DirectedGraph): a directed comparability graph.
+        direct_comparability(DirectedGraph or ReachabilityMatrix): a directed comparability graph.
+        as_matrix(bool): if True, return the :class:`ReachabilityMatrix` of the hase diagram.
 
     No check whether dag is a comparability graph or not.
 
+    Raises(TypeError): if *direct_comparability* is not acyclic.
+
     Returns(DirectedGraph):
         The direct comparability graph of *dag*
     """
 
-    hase_diagram = DirectedGraph.from_graph(direct_comparability)
+    if not isinstance(direct_comparability, ReachabilityMatrix):
+        direct_comparability = ReachabilityMatrix.from_dag(direct_comparability)
 
-    hase_diagram.difference(((x, x) for x in direct_comparability))
+    hase_diagram = direct_comparability.reduction(closed=True)
+    if as_matrix:
+        return hase_diagram
 
-    for x, y in direct_comparability.edges:
-        if direct_comparability(x).intersection(direct_comparability(y, begin=False, end=True)):
-            hase_diagram.difference([(x, y)])
-            continue
-    return hase_diagram
+    return hase_diagram.to_directed_graph()
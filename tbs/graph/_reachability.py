@@ -0,0 +1,208 @@
+import collections
+
+from ._directed_graph import DirectedGraph
+
+
+def _bit_indices(bits):
+    """Indices of the set bits of *bits*, in increasing order."""
+
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class ReachabilityMatrix(object):
+    """Bit matrix of a directed acyclic graph.
+
+    Vertices are numbered in a topological order and the row of a vertex is a Python int whose bit *j* is set
+    if there is an edge from it to vertex number *j*. Set operations on whole rows are single integer
+    operations, which makes transitive closure and reduction fast on posets with thousands of elements.
+    """
+
+    def __init__(self, vertices, rows):
+        """A bit matrix.
+
+        Args:
+            vertices(iterable): the vertices in a topological order, each vertex must be *hashable*.
+            rows(iterable): row *i* is the int whose bit *j* is set if there is an edge from vertex *i* to
+                vertex *j*. Edges must go from a vertex to a vertex with a larger number.
+
+        Raises:
+            ValueError: if a vertex is given twice, if the numbers of vertices and rows differ or if an edge
+                does not follow the vertex order.
+        """
+
+        self._vertices = tuple(vertices)
+        self._rows = tuple(rows)
+        self._index = {x: i for i, x in enumerate(self._vertices)}
+
+        if len(self._index) != len(self._vertices):
+            raise ValueError("Already a vertex")
+        if len(self._rows) != len(self._vertices):
+            raise ValueError("One row per vertex")
+        if any(row & ((2 << i) - 1) or row >> len(self._rows) for i, row in enumerate(self._rows)):
+            raise ValueError("Edges must follow the vertex order")
+
+    @classmethod
+    def from_dag(cls, dag):
+        """Bit matrix of the directed edges of *dag*, loops are ignored.
+
+        Args:
+            dag(DirectedGraph): a directed acyclic graph.
+
+        Raises(TypeError): if *dag* is not acyclic.
+
+        Returns(ReachabilityMatrix): the matrix, vertices are sorted in a topological order of *dag*.
+        """
+
+        in_degree = {x: 0 for x in dag}
+        for x in dag:
+            for y in dag.iter_neighbors(x, undirected=False, begin=True, end=False):
+                if y != x:
+                    in_degree[y] += 1
+
+        order = []
+        sources = collections.deque(x for x, degree in in_degree.items() if degree == 0)
+        while sources:
+            x = sources.popleft()
+            order.append(x)
+            for y in dag.iter_neighbors(x, undirected=False, begin=True, end=False):
+                if y == x:
+                    continue
+                in_degree[y] -= 1
+                if in_degree[y] == 0:
+                    sources.append(y)
+
+        if len(order) != len(in_degree):
+            raise TypeError("Not a directed acyclic graph")
+
+        index = {x: i for i, x in enumerate(order)}
+        rows = []
+        for x in order:
+            row = 0
+            for y in dag.iter_neighbors(x, undirected=False, begin=True, end=False):
+                if y != x:
+                    row |= 1 << index[y]
+            rows.append(row)
+
+        return cls(order, rows)
+
+    @property
+    def vertices(self):
+        """The vertices, in the order of the rows (tuple)."""
+
+        return self._vertices
+
+    @property
+    def rows(self):
+        """The rows (tuple of int)."""
+
+        return self._rows
+
+    def __len__(self):
+        """Number of vertices."""
+
+        return len(self._vertices)
+
+    def __eq__(self, other):
+        return isinstance(other, ReachabilityMatrix) and set(self.edges()) == set(other.edges())\
+            and set(self._vertices) == set(other._vertices)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def index(self, x):
+        """Number of vertex *x*.
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+        """
+
+        if x not in self._index:
+            raise ValueError("Not a vertex")
+
+        return self._index[x]
+
+    def row(self, x):
+        """Row of vertex *x* (int)."""
+
+        return self._rows[self.index(x)]
+
+    def isa_edge(self, x, y):
+        """Test if (x, y) is an edge."""
+
+        return x in self._index and y in self._index and bool(self._rows[self._index[x]] >> self._index[y] & 1)
+
+    def successors(self, x):
+        """List of the vertices *y* such that (x, y) is an edge, in the order of the vertices."""
+
+        return [self._vertices[j] for j in _bit_indices(self.row(x))]
+
+    @property
+    def nb_edges(self):
+        """Number of edges."""
+
+        return sum(bin(row).count("1") for row in self._rows)
+
+    def edges(self):
+        """Iterator over the edges (x, y)."""
+
+        for i, row in enumerate(self._rows):
+            x = self._vertices[i]
+            for j in _bit_indices(row):
+                yield x, self._vertices[j]
+
+    def closure(self):
+        """Transitive closure.
+
+        Rows are computed from the last vertex to the first: the row of *x* is the union of the closed rows of
+        its successors, already computed since they come after *x*. Takes O(m * n / w) word operations for
+        words of w bits.
+
+        Returns(ReachabilityMatrix): the matrix of the comparability graph (with no loop).
+        """
+
+        closed = list(self._rows)
+        for i in reversed(range(len(closed))):
+            row = closed[i]
+            for j in _bit_indices(self._rows[i]):
+                row |= closed[j]
+            closed[i] = row
+
+        return ReachabilityMatrix(self._vertices, closed)
+
+    def reduction(self, closed=False):
+        """Transitive reduction.
+
+        In each row, the remaining vertices are examined by increasing number: the first one is a cover and the
+        vertices it reaches are removed from the remaining ones. A row thus costs one word operation per cover
+        and per word, instead of one per edge.
+
+        Args:
+            closed(bool): if True, the matrix is assumed to be transitively closed (as returned by
+                :meth:`closure`) and the closure is not computed.
+
+        Returns(ReachabilityMatrix): the matrix of the Hasse diagram.
+        """
+
+        rows = self._rows if closed else self.closure()._rows
+
+        covers = []
+        for row in rows:
+            cover = 0
+            while row:
+                low = row & -row
+                cover |= low
+                row &= ~(rows[low.bit_length() - 1] | low)
+            covers.append(cover)
+
+        return ReachabilityMatrix(self._vertices, covers)
+
+    def to_directed_graph(self):
+        """The matrix as a directed graph.
+
+        Returns(DirectedGraph): A new graph.
+        """
+
+        return DirectedGraph(self._vertices, self.edges())
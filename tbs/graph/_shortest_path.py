@@ -0,0 +1,347 @@
+import collections
+import heapq
+import itertools
+import multiprocessing
+from array import array
+
+EDGE_ATTRIBUTE = "EDGE_ATTRIBUTE"
+
+
+def _weight_function(graph, valuation):
+    """Weight of the edges as a function (u, v) -> value, None for unit weights."""
+
+    if valuation is None or callable(valuation):
+        return valuation
+    elif valuation == EDGE_ATTRIBUTE:
+        return lambda u, v: graph[u, v]
+    elif isinstance(valuation, str) and valuation in graph.edge_columns:
+        return graph._edge_column_weight(valuation)
+    else:
+        raise ValueError("Unknown valuation %s" % (str(valuation)))
+
+
+def _bfs(graph, sources, target, forbidden_vertices):
+    dist = {x: 0 for x in sources}
+    father = {x: x for x in sources}
+    if target in dist:
+        return dist, father
+
+    fifo = collections.deque(sources)
+    while fifo:
+        u = fifo.popleft()
+        for v in graph.iter_neighbors(u):
+            if v in dist or v in forbidden_vertices:
+                continue
+            dist[v] = dist[u] + 1
+            father[v] = u
+            if v == target:
+                return dist, father
+            fifo.append(v)
+
+    return dist, father
+
+
+def _dijkstra(graph, sources, weight, target, forbidden_vertices):
+    dist = {x: 0 for x in sources}
+    father = {x: x for x in sources}
+    done = set()
+
+    counter = itertools.count()
+    heap = [(0, next(counter), x) for x in dist]
+    while heap:
+        d, i, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        if u == target:
+            break
+
+        for v in graph.iter_neighbors(u):
+            if v in done or v in forbidden_vertices:
+                continue
+            w = weight(u, v)
+            if w < 0:
+                raise ValueError("Negative valuation, use negative_valuation=True")
+            if v not in dist or dist[v] > d + w:
+                dist[v] = d + w
+                father[v] = u
+                heapq.heappush(heap, (d + w, next(counter), v))
+
+    return dist, father
+
+
+def _bellman_ford(graph, sources, weight, forbidden_vertices):
+    dist = {x: 0 for x in sources}
+    father = {x: x for x in sources}
+
+    k = 0
+    n = len(graph)
+    change = True
+    while k < n and change:
+        change = False
+        k += 1
+        for u in graph:
+            if u not in dist:
+                continue
+            for v in graph.iter_neighbors(u):
+                if v in forbidden_vertices:
+                    continue
+                w = dist[u] + weight(u, v)
+                if v not in dist or dist[v] > w:
+                    dist[v] = w
+                    father[v] = u
+                    change = True
+
+    if change:
+        raise Exception("Absorbent circuit")
+
+    return dist, father
+
+
+def shortest_path_forest(graph, sources, valuation=None, target=None, forbidden_vertices=frozenset(),
+                         negative_valuation=False):
+    """Distances and fathers of shortest paths from *sources*.
+
+    The algorithm depends on the valuation: breadth first search for unit weights, Dijkstra (binary heap) for
+    non negative weights and Bellman-Ford if *negative_valuation* is True.
+
+    Args:
+        graph(MixedGraph): a graph, paths follow undirected edges and directed edges in their direction.
+        sources(iterable): vertices at distance 0.
+        valuation: None for unit weights, a function (u, v) -> value, :const:`EDGE_ATTRIBUTE` to use the
+            attributes of the edges or the name of an edge column (see :meth:`MixedGraph.add_edge_column`).
+        target: if set, the search stops once the distance to *target* is known (not for Bellman-Ford).
+        forbidden_vertices(iterable): set of vertices which are not in the paths (except for sources).
+        negative_valuation(bool): if True, weights can be negative.
+
+    Raises:
+        ValueError: if the valuation is unknown or if a weight is negative and *negative_valuation* is False.
+        Exception: if there is an absorbent circuit.
+
+    Returns:
+        (dist, father): dicts whose keys are the reached vertices. The father of a source is itself.
+    """
+
+    sources = list(sources)
+    weight = _weight_function(graph, valuation)
+
+    if negative_valuation:
+        return _bellman_ford(graph, sources, weight or (lambda u, v: 1), forbidden_vertices)
+    elif weight is None:
+        return _bfs(graph, sources, target, forbidden_vertices)
+    else:
+        return _dijkstra(graph, sources, weight, target, forbidden_vertices)
+
+
+def path_from_fathers(father, y):
+    """Path from a source to *y* in a shortest path forest.
+
+    Args:
+        father(dict): fathers of :func:`shortest_path_forest`.
+        y: a vertex.
+
+    Returns(list):
+        the path, empty if *y* is not reached.
+    """
+
+    if y not in father:
+        return []
+
+    path = [y]
+    while father[path[-1]] != path[-1]:
+        path.append(father[path[-1]])
+    path.reverse()
+
+    return path
+
+
+class ShortestPathTree(object):
+    """Shortest paths from a set of sources to all the vertices they reach.
+
+    Computed once, it answers the distance and path queries to any target.
+    """
+
+    def __init__(self, graph, sources, valuation=None, forbidden_vertices=frozenset(), negative_valuation=False):
+        """Shortest path forest of *graph* from *sources*.
+
+        Args:
+            graph(MixedGraph): a graph.
+            sources(iterable): vertices at distance 0.
+            valuation: as in :func:`shortest_path_forest`.
+            forbidden_vertices(iterable): set of vertices which are not in the paths (except for sources).
+            negative_valuation(bool): if True, weights can be negative.
+
+        Raises:
+            ValueError: if the valuation is unknown or if a weight is negative and *negative_valuation* is False.
+            Exception: if there is an absorbent circuit.
+        """
+
+        self._sources = frozenset(sources)
+        self._dist, self._father = shortest_path_forest(graph, self._sources, valuation,
+                                                        forbidden_vertices=forbidden_vertices,
+                                                        negative_valuation=negative_valuation)
+
+    @property
+    def sources(self):
+        """The sources (frozenset)."""
+
+        return self._sources
+
+    def __contains__(self, y):
+        """Test if *y* is reached from a source."""
+
+        return y in self._dist
+
+    def __iter__(self):
+        """Iteration over the reached vertices."""
+
+        return iter(self._dist)
+
+    def __len__(self):
+        """Number of reached vertices."""
+
+        return len(self._dist)
+
+    def distance(self, y):
+        """Distance from the sources to *y*, infinite if *y* is not reached."""
+
+        return self._dist.get(y, float("inf"))
+
+    def father(self, y):
+        """Vertex before *y* in its shortest path, *y* itself for a source.
+
+        Raises:
+            ValueError: if *y* is not reached.
+        """
+
+        if y not in self._father:
+            raise ValueError("Not reached")
+
+        return self._father[y]
+
+    def path(self, y):
+        """A minimal path from a source to *y* (list), empty if *y* is not reached."""
+
+        return path_from_fathers(self._father, y)
+
+
+class DistanceMatrix(object):
+    """Distances between all pairs of vertices.
+
+    The row of the vertex number *i* is an `array('d')` whose item *j* is the distance from it to the vertex number
+    *j*, infinite if there is no path.
+    """
+
+    def __init__(self, vertices, rows):
+        """A distance matrix.
+
+        Args:
+            vertices(iterable): the vertices, each vertex must be *hashable*.
+            rows(iterable): one row of distances per vertex.
+
+        Raises:
+            ValueError: if a vertex is given twice or if the matrix is not square.
+        """
+
+        self._vertices = tuple(vertices)
+        self._rows = tuple(array("d", row) for row in rows)
+        self._index = {x: i for i, x in enumerate(self._vertices)}
+
+        if len(self._index) != len(self._vertices):
+            raise ValueError("Already a vertex")
+        if len(self._rows) != len(self._vertices) or any(len(row) != len(self._vertices) for row in self._rows):
+            raise ValueError("Not a square matrix")
+
+    @property
+    def vertices(self):
+        """The vertices, in the order of the rows (tuple)."""
+
+        return self._vertices
+
+    @property
+    def rows(self):
+        """The rows (tuple of array('d'))."""
+
+        return self._rows
+
+    def __len__(self):
+        """Number of vertices."""
+
+        return len(self._vertices)
+
+    def index(self, x):
+        """Number of vertex *x*.
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+        """
+
+        if x not in self._index:
+            raise ValueError("Not a vertex")
+
+        return self._index[x]
+
+    def row(self, x):
+        """Distances from *x* (array('d'))."""
+
+        return self._rows[self.index(x)]
+
+    def distance(self, x, y):
+        """Distance from *x* to *y*, infinite if there is no path."""
+
+        return self._rows[self.index(x)][self.index(y)]
+
+
+_worker_state = None  # (graph, vertices, valuation, negative_valuation) of a worker process
+
+
+def _init_worker(graph, vertices, valuation, negative_valuation):
+    global _worker_state
+    _worker_state = (graph, vertices, valuation, negative_valuation)
+
+
+def _worker_distance_row(x):
+    return _distance_row(*_worker_state, x)
+
+
+def _distance_row(graph, vertices, valuation, negative_valuation, x):
+    """Distances from *x* to the vertices, in their order."""
+
+    dist, father = shortest_path_forest(graph, [x], valuation, negative_valuation=negative_valuation)
+    inf = float("inf")
+
+    return array("d", (dist.get(y, inf) for y in vertices))
+
+
+def all_pairs_distances(graph, valuation=None, negative_valuation=False, workers=1, chunksize=16):
+    """Distances between all pairs of vertices.
+
+    One shortest path search (see :func:`shortest_path_forest`) per source. With several *workers*, the sources are
+    split across processes, the graph being sent once to each of them.
+
+    Args:
+        graph(MixedGraph): a graph.
+        valuation: as in :func:`shortest_path_forest`. With several workers, it must be picklable (None,
+            :const:`EDGE_ATTRIBUTE` or a module level function, not a lambda).
+        negative_valuation(bool): if True, weights can be negative.
+        workers(int): number of processes. None for the number of CPUs, 1 to compute in the current process.
+        chunksize(int): number of sources sent to a worker at once.
+
+    Raises:
+        ValueError: if the valuation is unknown or if a weight is negative and *negative_valuation* is False.
+        Exception: if there is an absorbent circuit.
+
+    Returns(DistanceMatrix): the distances, vertices in the order of `graph.vertices`.
+    """
+
+    vertices = list(graph.vertices)
+
+    if workers == 1:
+        return DistanceMatrix(vertices, [_distance_row(graph, vertices, valuation, negative_valuation, x)
+                                         for x in vertices])
+
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(graph, vertices, valuation, negative_valuation)) as pool:
+        rows = pool.map(_worker_distance_row, vertices, chunksize)
+
+    return DistanceMatrix(vertices, rows)
@@ -0,0 +1,130 @@
+from ._order import topological_sort
+
+
+class IncrementalTopologicalOrder(object):
+    """Topological order of a directed acyclic graph kept valid under vertex and edge insertions.
+
+    Pearce and Kelly algorithm: inserting an edge (x, y) with *y* before *x* only reorders the vertices between
+    them in the order that are reachable from *y* or reach *x*, instead of sorting the whole graph again.
+    """
+
+    def __init__(self, dag=None):
+        """Order of *dag*.
+
+        Args:
+            dag(DirectedGraph): a directed acyclic graph, its vertices and edges are copied.
+
+        Raises(TypeError): if *dag* is not acyclic.
+        """
+
+        self._position = dict()
+        self._vertex = []
+        self._successors = dict()
+        self._predecessors = dict()
+
+        if dag is not None:
+            for x in topological_sort(dag):
+                self.add(x)
+            for x in dag:
+                for y in dag.iter_neighbors(x):
+                    self._successors[x].add(y)
+                    self._predecessors[y].add(x)
+
+    def __len__(self):
+        """Number of vertices."""
+
+        return len(self._vertex)
+
+    def __iter__(self):
+        """Iteration over the vertices in topological order."""
+
+        return iter(self._vertex)
+
+    def __contains__(self, x):
+        """is a vertex"""
+
+        return x in self._position
+
+    def order(self):
+        """The topological order (list)."""
+
+        return list(self._vertex)
+
+    def position(self, x):
+        """Position of vertex *x* in the order.
+
+        Raises:
+            ValueError: if *x* is not a vertex.
+        """
+
+        if x not in self._position:
+            raise ValueError("Not a vertex")
+
+        return self._position[x]
+
+    def add(self, x):
+        """Add vertex *x* at the end of the order.
+
+        Args:
+            x(hashable): new vertex to add.
+        Raises:
+            ValueError: if *x* is already a vertex.
+        """
+
+        if x in self._position:
+            raise ValueError("Already a vertex")
+
+        self._position[x] = len(self._vertex)
+        self._vertex.append(x)
+        self._successors[x] = set()
+        self._predecessors[x] = set()
+
+    def add_edge(self, x, y):
+        """Add edge (x, y) and update the order.
+
+        Args:
+            x: a vertex.
+            y: a vertex.
+        Raises:
+            ValueError: if *x* or *y* is not a vertex.
+            TypeError: if the edge creates a cycle. The edge is not added.
+        """
+
+        lower, upper = self.position(y), self.position(x)
+        if y in self._successors[x]:
+            return
+
+        if lower <= upper:
+            forward = self._reached(y, self._successors, lambda position: position <= upper)
+            if x in forward:
+                raise TypeError("Not a directed acyclic graph")
+            backward = self._reached(x, self._predecessors, lambda position: position >= lower)
+            self._reorder(backward, forward)
+
+        self._successors[x].add(y)
+        self._predecessors[y].add(x)
+
+    def _reached(self, x, neighbors, is_affected):
+        """Vertices reachable from *x* through *neighbors* whose position satisfies *is_affected*."""
+
+        reached = {x}
+        stack = [x]
+        while stack:
+            u = stack.pop()
+            for v in neighbors[u]:
+                if v not in reached and is_affected(self._position[v]):
+                    reached.add(v)
+                    stack.append(v)
+
+        return reached
+
+    def _reorder(self, backward, forward):
+        """Put *backward* before *forward* on the positions they occupy, keeping their relative orders."""
+
+        key = self._position.__getitem__
+        vertices = sorted(backward, key=key) + sorted(forward, key=key)
+        positions = sorted(self._position[v] for v in vertices)
+
+        for position, v in zip(positions, vertices):
+            self._position[v] = position
+            self._vertex[position] = v
@@ -1,7 +1,8 @@
+import random
 import unittest
 
 from tbs.binary_hypergraph._algo1_functions import random_subset, edge_choice_for_algo1
-from tbs.binary_hypergraph import BinaryMixedTree, BasicTreeConstruction, MixedGraph, DIRECTED_EDGE
+from tbs.binary_hypergraph import BinaryMixedTree, BasicTreeConstruction, MixedGraph, DIRECTED_EDGE, StratAlgo1, s_0
 
 
 class TestEdgeChoice1(unittest.TestCase):
@@ -61,3 +62,18 @@ class TestSubset(unittest.TestCase):
         s = {1, 3, 5, 23, 547}
         s2 = random_subset(s)
         self.assertTrue(s2.issubset(s))
+
+    def test_seeded(self):
+        s = set(range(100))
+
+        self.assertEqual(random_subset(s, random.Random(2)), random_subset(s, random.Random(2)))
+
+
+class TestStratAlgo1(unittest.TestCase):
+    def test_reproducible(self):
+        g = BinaryMixedTree(MixedGraph(range(8), [(0, 1), (1, 2), (2, 3), (1, 4), (4, 5), (4, 6), (6, 7)]))
+
+        sequences = [BasicTreeConstruction(g, s_0(g)).tree_sequence(StratAlgo1(rng=random.Random(5)))
+                     for i in range(2)]
+
+        self.assertEqual(sequences[0], sequences[1])
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from tbs.binary_hypergraph import s_0, BinaryMixedTree, MixedGraph, DIRECTED_EDGE, HyperGraph, \
@@ -130,3 +131,29 @@ class TestAlgo3(unittest.TestCase):
         expected_tree.add_directed(frozenset([3]), frozenset([4]))
 
         self.assertEqual(expected_tree, next_tree)
+
+    def test_tree_sequence_path(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2, 3}, [(0, 1), (1, 2), (2, 3)]))
+
+        value = BasicTreeConstruction(g, s_0(g)).tree_sequence(StratAlgo1())
+        last_tree, last_map = value[-1]
+
+        self.assertEqual(len(last_tree), 1)
+        self.assertEqual(value[0][0], BinaryMixedTree(MixedGraph({0, 1, 2, 3}, [(0, 1), (1, 2), (2, 3)])))
+        self.assertIn(frozenset([0, 1, 2, 3]), last_map)
+
+    def test_iter_tree_sequence_deltas(self):
+        g = BinaryMixedTree(MixedGraph(range(8), [(0, 1), (1, 2), (2, 3), (1, 4), (4, 5), (4, 6), (6, 7)]))
+
+        random.seed(0)
+        sequence = BasicTreeConstruction(g, s_0(g)).tree_sequence(StratAlgo1())
+        random.seed(0)
+        deltas = list(BasicTreeConstruction(g, s_0(g)).iter_tree_sequence(StratAlgo1(), deltas=True))
+
+        self.assertEqual(len(deltas), len(sequence) - 1)
+        tree, maps = g.copy(), s_0(g)
+        for delta, (expected_tree, expected_map) in zip(deltas, sequence[1:]):
+            delta.apply(tree, maps)
+            self.assertEqual(tree, expected_tree)
+            self.assertEqual(maps, expected_map)
+        self.assertEqual(len(g), 8)
@@ -0,0 +1,73 @@
+import unittest
+
+from tbs.binary_hypergraph import Bitset, GroundSet, BasicTreeConstruction, HyperGraph, BinaryMixedTree, \
+    MixedGraph, StratAlgo3, s_0
+
+
+class TestBitset(unittest.TestCase):
+    def test_set_operations(self):
+        x, y = Bitset(0b0011), Bitset(0b0110)
+
+        self.assertEqual(x.union(y), Bitset(0b0111))
+        self.assertEqual(x.intersection(y), Bitset(0b0010))
+        self.assertEqual(x.difference(y), Bitset(0b0001))
+        self.assertEqual(x - y, Bitset(0b0001))
+        self.assertIsInstance(x | y, Bitset)
+        self.assertTrue(Bitset(0b0010).issubset(x))
+        self.assertFalse(x.issubset(y))
+        self.assertTrue(x.issuperset([Bitset(0b0001), Bitset(0b0010)]))
+        self.assertTrue(x.isdisjoint(Bitset(0b1100)))
+
+    def test_elements(self):
+        x = Bitset(0b1010)
+
+        self.assertEqual(len(x), 2)
+        self.assertEqual(list(x), [Bitset(0b0010), Bitset(0b1000)])
+        self.assertIn(Bitset(0b1000), x)
+        self.assertNotIn(Bitset(0b0001), x)
+
+
+class TestGroundSet(unittest.TestCase):
+    def test_encode_decode(self):
+        ground_set = GroundSet("abc")
+
+        self.assertEqual(ground_set.singleton("b"), Bitset(0b010))
+        self.assertEqual(ground_set.encode({"a", "c"}), Bitset(0b101))
+        self.assertEqual(ground_set.decode(Bitset(0b101)), frozenset({"a", "c"}))
+
+    def test_errors(self):
+        ground_set = GroundSet("ab")
+
+        with self.assertRaises(ValueError):
+            ground_set.add("a")
+        with self.assertRaises(ValueError):
+            ground_set.encode({"c"})
+
+    def test_step_algo3(self):
+        g = HyperGraph(frozenset([frozenset([i]) for i in range(1, 7)]))
+        for i in range(1, 7):
+            g.add_edge(frozenset([frozenset([i])]))
+        g.add_edge(frozenset([frozenset([i]) for i in range(1, 7)]))
+        g.add_edge(frozenset([frozenset([1]), frozenset([2])]))
+        g.add_edge(frozenset([frozenset([4]), frozenset([5]), frozenset([6])]))
+        g.add_edge(frozenset([frozenset([3]), frozenset([4]), frozenset([5])]))
+        g.add_edge(frozenset([frozenset([1]), frozenset([2]), frozenset([3]), frozenset([4]), frozenset([5])]))
+
+        tree = MixedGraph({1, 2, 3, 4, 5, 6}, [(3, 6), (1, 5), (1, 3)])
+        ground_set = GroundSet(range(1, 7))
+
+        t = BinaryMixedTree(tree)
+        t.add_directed(frozenset([1]), frozenset([2]))
+        t.add_directed(frozenset([3]), frozenset([4]))
+
+        encoded_t = BinaryMixedTree(tree, ground_set)
+        encoded_t.add_directed(ground_set.singleton(1), ground_set.singleton(2))
+        encoded_t.add_directed(ground_set.singleton(3), ground_set.singleton(4))
+
+        next_tree, next_map = BasicTreeConstruction(t, s_0(t), g).step(StratAlgo3())
+        encoded_tree, encoded_map = BasicTreeConstruction(encoded_t, s_0(encoded_t),
+                                                          g.encoded(ground_set)).step(StratAlgo3())
+
+        self.assertEqual(encoded_tree.relabeled(ground_set.decode), next_tree)
+        self.assertEqual({ground_set.decode(x): {frozenset([i]) for i in ground_set.decode(image)}
+                          for x, image in encoded_map.items()}, next_map)
@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from tbs.binary_hypergraph import BasicTreeConstruction, BinaryMixedTree, ConstructionSequence, MixedGraph, \
+    StratAlgo1, s_0
+
+
+class TestConstructionSequence(unittest.TestCase):
+    def setUp(self):
+        self.g = BinaryMixedTree(MixedGraph(range(8), [(0, 1), (1, 2), (2, 3), (1, 4), (4, 5), (4, 6), (6, 7)]))
+
+        random.seed(1)
+        self.expected = BasicTreeConstruction(self.g, s_0(self.g)).tree_sequence(StratAlgo1())
+
+    def test_random_access(self):
+        for checkpoint_interval in (1, 3, None):
+            random.seed(1)
+            sequence = BasicTreeConstruction(self.g, s_0(self.g)).construction_sequence(StratAlgo1(),
+                                                                                       checkpoint_interval)
+
+            self.assertEqual(len(sequence), len(self.expected))
+            for i in reversed(range(len(sequence))):
+                self.assertEqual(sequence[i], self.expected[i])
+            self.assertEqual(sequence[-1], self.expected[-1])
+            self.assertEqual(list(sequence), self.expected)
+
+    def test_errors(self):
+        sequence = ConstructionSequence(self.g, s_0(self.g))
+
+        self.assertEqual(len(sequence), 1)
+        with self.assertRaises(IndexError):
+            sequence[1]
+        with self.assertRaises(ValueError):
+            ConstructionSequence(self.g, s_0(self.g), checkpoint_interval=0)
@@ -1,7 +1,8 @@
+import random
 import unittest
 
 from tbs.binary_hypergraph import HyperGraph
-from tbs.graph import MixedGraph, connected_parts
+from tbs.graph import MixedGraph, connected_parts, random_tree
 
 
 class TestHyperGraph(unittest.TestCase):
@@ -21,6 +22,40 @@ class TestHyperGraph(unittest.TestCase):
             frozenset([frozenset([3]), frozenset([4])])
         ]))
 
+    def test_add_vertices(self):
+        h = HyperGraph(frozenset([1]))
+        h.add_vertices([2, 3])
+
+        self.assertEqual(h.vertices, frozenset([1, 2, 3]))
+        with self.assertRaises(ValueError):
+            h.add_vertices([4, 3])
+        self.assertEqual(h.vertices, frozenset([1, 2, 3]))
+
+    def test_smallest_containing(self):
+        h = HyperGraph(frozenset([1, 2, 3, 4]), [frozenset([1, 2, 3, 4]), frozenset([1]), frozenset([1, 2])])
+        h.add_edge(frozenset([3, 4]))
+
+        self.assertEqual(h.smallest_containing({1}), frozenset([1]))
+        self.assertEqual(h.smallest_containing({2}), frozenset([1, 2]))
+        self.assertEqual(h.smallest_containing({4}), frozenset([3, 4]))
+        self.assertEqual(h.smallest_containing(set()), frozenset([1]))
+        self.assertEqual(h.supremum({1}, {3}), frozenset([1, 2, 3, 4]))
+        with self.assertRaises(ValueError):
+            h.smallest_containing({5})
+
+    def test_supremum_cache(self):
+        h = HyperGraph(frozenset([1, 2, 3]), [frozenset([1, 2, 3]), frozenset([1, 2])], supremum_cache_size=1)
+
+        self.assertEqual(h.supremum({1}, {2}), frozenset([1, 2]))
+        self.assertEqual(h.supremum({2}, {1}), frozenset([1, 2]))
+        self.assertEqual(h.supremum({1}, {3}), frozenset([1, 2, 3]))
+        self.assertEqual(h.supremum({1}, {2}), frozenset([1, 2]))
+        self.assertEqual(h.cache_info(), (1, 3, 1, 1))
+
+        h.add_edge(frozenset([1, 3]))
+        self.assertEqual(h.supremum({1}, {3}), frozenset([1, 3]))
+        self.assertEqual(h.cache_info().misses, 4)
+
     def test_restriction(self):
         h = HyperGraph(frozenset([1, 2, 3, 4, 5]))
         h.add_edge(frozenset(
@@ -85,3 +120,25 @@ class TestHyperGraph(unittest.TestCase):
 
         for x in g.hyper_edges:
             self.assertTrue(len(connected_parts(supp_tree, vertex_subset=x)) == 1)
+
+    def test_support_tree_random_hypertrees(self):
+        rng = random.Random(0)
+        for k in range(50):
+            n = rng.randint(2, 15)
+            tree = random_tree(list(range(n)))
+            g = HyperGraph(range(n), [frozenset(range(n))])
+            for i in range(rng.randint(1, 10)):
+                subtree = {rng.randrange(n)}
+                size = rng.randint(1, n)
+                for x in tree.vertices:
+                    for y in tree(x):
+                        if len(subtree) < size and x in subtree and y not in subtree:
+                            subtree.add(y)
+                if frozenset(subtree) not in g.hyper_edges:
+                    g.add_edge(frozenset(subtree))
+
+            supp_tree = g.support_tree()
+
+            self.assertEqual(supp_tree.nb_edges, n - 1)
+            for x in g.hyper_edges:
+                self.assertTrue(len(connected_parts(supp_tree, vertex_subset=x)) == 1)
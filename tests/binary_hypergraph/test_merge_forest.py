@@ -0,0 +1,165 @@
+import unittest
+
+import random
+
+from tbs.binary_hypergraph import MergeForest, BasicTreeConstruction, HyperGraph, BinaryMixedTree, MixedGraph, \
+    StratAlgo1, StratAlgo3, s_0, run_many
+
+
+class TestMergeForest(unittest.TestCase):
+    def test_merge(self):
+        forest = MergeForest("abc")
+        ab = forest.merge(forest.leaf("a"), forest.leaf("b"))
+        abc = forest.merge(ab, forest.leaf("c"))
+
+        self.assertEqual(len(forest), 5)
+        self.assertEqual(forest.elements(ab), frozenset("ab"))
+        self.assertEqual(forest.elements(abc), frozenset("abc"))
+        self.assertEqual(forest.parents(ab), [abc])
+        self.assertEqual(forest.parents(abc), [])
+        self.assertEqual(forest.children(abc), (ab, forest.leaf("c")))
+        self.assertTrue(forest.is_leaf(forest.leaf("a")))
+
+    def test_several_merges(self):
+        forest = MergeForest("abc")
+        ab = forest.merge(0, 1)
+        bc = forest.merge(1, 2)
+        abc = forest.merge(ab, bc)
+
+        self.assertEqual(forest.parents(1), [ab, bc])
+        self.assertEqual(forest.parents(2), [bc])
+        self.assertEqual(forest.elements(abc), frozenset("abc"))
+        self.assertEqual(sorted(forest.leaves(abc)), [0, 1, 2])
+
+    def test_errors(self):
+        forest = MergeForest("ab")
+        forest.merge(0, 1)
+
+        with self.assertRaises(ValueError):
+            forest.merge(0, 0)
+        with self.assertRaises(ValueError):
+            forest.merge(2, 3)
+        with self.assertRaises(ValueError):
+            forest.leaf("c")
+        with self.assertRaises(ValueError):
+            forest.add("a")
+
+    def test_copy_and_truncate(self):
+        forest = MergeForest("abc")
+        ab = forest.merge(0, 1)
+        forest.merge(ab, 2)
+        forest.merge(0, 2)
+
+        prefix = forest.copy(4)
+        self.assertEqual(len(prefix), 4)
+        self.assertEqual(prefix.parents(ab), [])
+        self.assertEqual(prefix.parents(0), [ab])
+        self.assertEqual(prefix.parents(2), [])
+        self.assertEqual(len(forest), 6)
+        self.assertEqual(forest.parents(2), [4, 5])
+
+        forest.truncate(3)
+        self.assertEqual(len(forest), 3)
+        self.assertEqual(forest.parents(0), [])
+        self.assertEqual(forest.merge(1, 2), 3)
+
+        forest.truncate(2)
+        with self.assertRaises(ValueError):
+            forest.leaf("c")
+        forest.add("c")
+
+    def test_add_union(self):
+        forest = MergeForest([1, 2])
+        g = BinaryMixedTree(MixedGraph({1, 2}, [(1, 2)]), merge_forest=forest)
+        v_xy = g.add_union(forest.leaf(1), forest.leaf(2))
+
+        self.assertEqual(v_xy, 2)
+        self.assertEqual(forest.elements(v_xy), frozenset([1, 2]))
+        expected = BinaryMixedTree(MixedGraph({1, 2}, [(1, 2)]))
+        expected.add_union(frozenset([1]), frozenset([2]))
+        self.assertEqual(g.relabeled(forest.elements), expected)
+
+    def test_step_algo3(self):
+        g = HyperGraph(frozenset([frozenset([i]) for i in range(1, 7)]))
+        for i in range(1, 7):
+            g.add_edge(frozenset([frozenset([i])]))
+        g.add_edge(frozenset([frozenset([i]) for i in range(1, 7)]))
+        g.add_edge(frozenset([frozenset([1]), frozenset([2])]))
+        g.add_edge(frozenset([frozenset([4]), frozenset([5]), frozenset([6])]))
+        g.add_edge(frozenset([frozenset([3]), frozenset([4]), frozenset([5])]))
+        g.add_edge(frozenset([frozenset([1]), frozenset([2]), frozenset([3]), frozenset([4]), frozenset([5])]))
+
+        tree = MixedGraph({1, 2, 3, 4, 5, 6}, [(3, 6), (1, 5), (1, 3)])
+        forest = MergeForest(range(1, 7))
+
+        t = BinaryMixedTree(tree)
+        t.add_directed(frozenset([1]), frozenset([2]))
+        t.add_directed(frozenset([3]), frozenset([4]))
+
+        id_t = BinaryMixedTree(tree, merge_forest=forest)
+        id_t.add_directed(forest.leaf(1), forest.leaf(2))
+        id_t.add_directed(forest.leaf(3), forest.leaf(4))
+
+        next_tree, next_map = BasicTreeConstruction(t, s_0(t), g).step(StratAlgo3())
+        id_tree, id_map = BasicTreeConstruction(id_t, s_0(id_t),
+                                                g.relabeled(lambda x: forest.leaf(*x))).step(StratAlgo3())
+
+        elements = id_tree.merge_forest.elements
+        self.assertEqual(id_tree.relabeled(elements), next_tree)
+        self.assertEqual({elements(x): {elements(i) for i in image} for x, image in id_map.items()}, next_map)
+
+
+class TestMergeForestTree(unittest.TestCase):
+    def setUp(self):
+        self.forest = MergeForest(range(5))
+        self.t = BinaryMixedTree(MixedGraph(range(5), [(0, 1), (1, 2), (2, 3), (2, 4)]), merge_forest=self.forest)
+
+    def test_several_sequences(self):
+        forests = []
+        for seed in range(3):
+            sequence = BasicTreeConstruction(self.t, s_0(self.t)).tree_sequence(StratAlgo1(rng=random.Random(seed)))
+            last_tree, last_map = sequence[-1]
+            root, = last_tree
+            self.assertEqual(last_tree.merge_forest.elements(root), frozenset(range(5)))
+            forests.append(last_tree.merge_forest)
+
+        self.assertIs(forests[0], self.forest)
+        self.assertEqual(len({id(forest) for forest in forests}), 3)
+        self.assertEqual(set(self.t), set(range(5)))
+
+    def test_sequence_shares_forest(self):
+        sequence = BasicTreeConstruction(self.t, s_0(self.t)).tree_sequence(StratAlgo1(rng=random.Random(0)))
+
+        self.assertTrue(all(tree.merge_forest is self.forest for tree, tree_map in sequence))
+        last_tree, last_map = sequence[-1]
+        root, = last_tree
+        self.assertEqual(self.forest.elements(root), frozenset(range(5)))
+
+    def test_construction_sequence(self):
+        sequence = BasicTreeConstruction(self.t, s_0(self.t)).construction_sequence(StratAlgo1(), 2)
+        expected = list(sequence)
+
+        self.assertEqual([sequence[i] for i in range(len(sequence))], expected)
+
+    def test_run_many(self):
+        distribution = run_many(self.t, StratAlgo1, 10, workers=1, seed=0)
+
+        self.assertEqual(sum(distribution.values()), 10)
+
+    def test_rollback(self):
+        self.t.begin()
+        self.t.add_union(0, 1)
+        self.t.rollback()
+
+        self.assertEqual(self.t.add_union(1, 2), 5)
+        self.assertEqual(self.forest.children(5), (1, 2))
+
+        copy = self.t.copy()
+        self.t.begin()
+        self.t.add_union(3, 4)
+        copy.add_union(3, 4)
+        self.t.rollback()
+
+        self.assertEqual(self.t.add_union(2, 3), 6)
+        self.assertEqual(copy.merge_forest.children(6), (3, 4))
+        self.assertEqual(self.t.merge_forest.children(6), (2, 3))
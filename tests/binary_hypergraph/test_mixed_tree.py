@@ -1,7 +1,8 @@
+import random
 import unittest
 
-from tbs.binary_hypergraph import BinaryMixedTree
-from tbs.graph import MixedGraph, DIRECTED_EDGE, Graph
+from tbs.binary_hypergraph import BinaryMixedTree, BasicTreeConstruction, StratAlgo1, s_0
+from tbs.graph import MixedGraph, DIRECTED_EDGE, Graph, random_tree
 
 
 class TestUnion(unittest.TestCase):
@@ -42,6 +43,7 @@ class TestRestriction(unittest.TestCase):
         h = g.restriction(frozenset([frozenset([0]), frozenset([1]), frozenset([2])]))
 
         self.assertEqual(h, BinaryMixedTree(MixedGraph({0, 1, 2}, [(0, 1), (1, 2)])))
+        self.assertEqual(g.restriction(g.vertices), g)
 
     def test_restrict_error(self):
         g = BinaryMixedTree(MixedGraph({0, 1, 2, 3}, [(0, 1), (1, 2)]))
@@ -87,6 +89,51 @@ class TestHomogeneousSubset(unittest.TestCase):
 
         self.assertEqual(value, expected)
 
+    def test_homogeneous_subset_chain(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2, 3, 4}, [(0, 1), (2, 3)]))
+        g.add_directed(frozenset([3]), frozenset([4]))
+        g.add_directed(frozenset([1]), frozenset([2]))
+
+        self.assertEqual(g.homogeneous_subset(), {frozenset([0]), frozenset([1])})
+
+    def test_homogeneous_subset_excludes_heads(self):
+        g = BinaryMixedTree(MixedGraph({1, 2, 3, 4, 5, 6}, [(1, 3), (3, 6), (1, 5)]))
+        g.add_directed(frozenset([1]), frozenset([2]))
+        g.add_directed(frozenset([3]), frozenset([4]))
+
+        value = g.homogeneous_subset()
+        expected = {frozenset([1]), frozenset([3]), frozenset([5]), frozenset([6])}
+
+        self.assertEqual(value, expected)
+
+    def test_homogeneous_subset_leaves_tree_unchanged(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2, 3, 4, 5}, [(0, 1), (1, 2), (3, 4), (4, 5)]))
+        g.add_directed(frozenset([2]), frozenset([3]))
+        expected = BinaryMixedTree(MixedGraph({0, 1, 2, 3, 4, 5}, [(0, 1), (1, 2), (3, 4), (4, 5)]))
+        expected.add_directed(frozenset([2]), frozenset([3]))
+
+        g.homogeneous_subset()
+
+        self.assertEqual(g, expected)
+
+    def test_homogeneous_subset_directed_cycle(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2, 3}, [(0, 1)]))
+        g.add_directed(frozenset([1]), frozenset([2]))
+        g.add_directed(frozenset([2]), frozenset([3]))
+        g.add_directed(frozenset([3]), frozenset([0]))
+
+        with self.assertRaises(ValueError):
+            g.homogeneous_subset()
+        with self.assertRaises(ValueError):
+            g.homogeneous_edges()
+
+    def test_homogeneous_edges(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2, 3, 4, 5}, [(0, 1), (1, 2), (3, 4), (4, 5)]))
+        g.add_directed(frozenset([2]), frozenset([3]))
+
+        self.assertEqual(set(g.homogeneous_edges()),
+                         {frozenset([frozenset([0]), frozenset([1])]), frozenset([frozenset([1]), frozenset([2])])})
+
 
 class TestMixedTree(unittest.TestCase):
     def test_undirected_tree(self):
@@ -97,3 +144,89 @@ class TestMixedTree(unittest.TestCase):
 
         self.assertEqual(h, Graph.from_edges(
             [(frozenset([0]), frozenset([1])), (frozenset([1]), frozenset([2])), (frozenset([2]), frozenset([3]))]))
+
+    def test_shortest_path_tree_from_vertex(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2}, [(0, 1), (1, 2)]))
+
+        tree = g.shortest_path_tree(frozenset([0]))
+        self.assertEqual(tree.distance(frozenset([2])), 2)
+        self.assertEqual(tree.path(frozenset([2])), g.path(frozenset([0]), frozenset([2])))
+        self.assertEqual(g.shortest_path_tree([frozenset([0]), frozenset([2])]).distance(frozenset([1])), 1)
+
+
+class TestFreeUndirectedEdges(unittest.TestCase):
+    @staticmethod
+    def free_edges(g):
+        undirected, directed = g.edges
+        return {edge for edge in undirected
+                if all(not g(x, undirected=False, begin=False, end=True) for x in edge)}
+
+    def test_maintained(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2, 3, 4}, [(0, 1), (1, 2), (2, 3), (3, 4)]))
+        self.assertEqual(set(g.free_undirected_edges), self.free_edges(g))
+
+        v = g.add_union(frozenset([1]), frozenset([2]))
+        self.assertEqual(set(g.free_undirected_edges), self.free_edges(g))
+
+        g.move_undirected_from_to(frozenset([2]), v)
+        h = g.copy()
+        g.remove(frozenset([1]))
+        self.assertEqual(set(g.free_undirected_edges), self.free_edges(g))
+        self.assertEqual(set(h.free_undirected_edges), self.free_edges(h))
+
+    def test_rollback(self):
+        g = BinaryMixedTree(MixedGraph({0, 1, 2}, [(0, 1), (1, 2)]))
+        g.begin()
+        g.add_directed(frozenset([0]), frozenset([1]))
+        g.rollback()
+
+        self.assertEqual(set(g.free_undirected_edges), self.free_edges(g))
+        self.assertEqual(len(g.free_undirected_edges), 2)
+
+
+class TestMaintainedIndexes(unittest.TestCase):
+    @staticmethod
+    def homogeneous_parts(g):
+        parts = set()
+        for x in g:
+            part = {x}
+            stack = [x]
+            while stack:
+                for y in g(stack.pop(), undirected=True, begin=False, end=False):
+                    if y not in part:
+                        part.add(y)
+                        stack.append(y)
+            if len(part) > 1 and all(not g(y, undirected=False, begin=False, end=True) for y in part):
+                parts.add(frozenset(part))
+        return parts
+
+    def check(self, g):
+        self.assertEqual(set(g.free_undirected_edges), TestFreeUndirectedEdges.free_edges(g))
+
+        parts = self.homogeneous_parts(g)
+        if parts:
+            self.assertIn(g.homogeneous_subset(), parts)
+            self.assertEqual({y for edge in g.homogeneous_edges() for y in edge}, g.homogeneous_subset())
+
+    def test_steps_copies_and_rollbacks(self):
+        rng = random.Random(0)
+        for n in range(2, 12):
+            g = BinaryMixedTree(random_tree(range(n), rng))
+            algo = BasicTreeConstruction(g, s_0(g))
+            strategy = StratAlgo1(rng=rng)
+            strategy.algo = algo
+            self.check(g)
+
+            while len(algo.mixed_tree) > 1:
+                tree = algo.mixed_tree
+                copy = tree.copy()
+                tree.begin()
+                algo.step_in_place(strategy)
+                self.check(tree)
+                if rng.random() < .3:
+                    tree.rollback()
+                    self.check(tree)
+                    self.assertEqual(tree, copy)
+                else:
+                    tree.commit()
+                self.check(copy)
@@ -0,0 +1,21 @@
+import unittest
+
+from tbs.binary_hypergraph import BinaryMixedTree, MixedGraph, StratAlgo1, run_many
+
+
+class TestRunMany(unittest.TestCase):
+    def setUp(self):
+        self.g = BinaryMixedTree(MixedGraph(range(5), [(0, 1), (1, 2), (2, 3), (2, 4)]))
+
+    def test_binary_set_systems(self):
+        distribution = run_many(self.g, StratAlgo1, 20, workers=1, seed=0)
+
+        self.assertEqual(sum(distribution.values()), 20)
+        for set_system in distribution:
+            self.assertIn(frozenset(frozenset([i]) for i in range(5)), set_system)
+            for i in range(5):
+                self.assertIn(frozenset([frozenset([i])]), set_system)
+
+    def test_independent_of_workers(self):
+        self.assertEqual(run_many(self.g, StratAlgo1, 20, workers=1, seed=0),
+                         run_many(self.g, StratAlgo1, 20, workers=2, seed=0))
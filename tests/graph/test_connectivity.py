@@ -0,0 +1,49 @@
+import unittest
+
+from tbs.graph import Connectivity, Graph, connected_parts
+
+
+class TestConnectivity(unittest.TestCase):
+    def test_components(self):
+        c = Connectivity(range(6), [(0, 1), (1, 2), (3, 4)])
+
+        self.assertEqual(c.components(), frozenset([frozenset([0, 1, 2]), frozenset([3, 4]), frozenset([5])]))
+        self.assertEqual(c.nb_components, 3)
+        self.assertEqual(len(c), 6)
+
+    def test_incremental(self):
+        c = Connectivity(range(4))
+
+        self.assertFalse(c.same_component(0, 3))
+        self.assertTrue(c.add_edge(0, 1))
+        self.assertTrue(c.add_edge(2, 3))
+        self.assertFalse(c.same_component(0, 3))
+        self.assertTrue(c.add_edge(1, 2))
+        self.assertFalse(c.add_edge(0, 3))
+        self.assertTrue(c.same_component(0, 3))
+
+        c.add(4)
+        self.assertEqual(c.nb_components, 2)
+
+    def test_errors(self):
+        c = Connectivity([0])
+
+        with self.assertRaises(ValueError):
+            c.add(0)
+        with self.assertRaises(ValueError):
+            c.add_edge(0, 1)
+        with self.assertRaises(ValueError):
+            c.find(1)
+
+    def test_long_path(self):
+        n = 10000
+        c = Connectivity(range(n), [(i, i + 1) for i in range(n - 1)])
+
+        self.assertTrue(c.same_component(0, n - 1))
+        self.assertEqual(c.nb_components, 1)
+
+    def test_connected_parts_subset(self):
+        g = Graph(range(5), [(0, 1), (1, 2), (3, 4)])
+
+        self.assertEqual(connected_parts(g, vertex_subset=[0, 2, 3, 4]),
+                         frozenset([frozenset([0]), frozenset([2]), frozenset([3, 4])]))
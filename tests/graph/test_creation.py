@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from tbs.graph import Graph, tree_from_prufer, prufer_from_tree, random_trees, connected_parts
+
+
+class TestPrufer(unittest.TestCase):
+    def test_tree_from_prufer(self):
+        tree = tree_from_prufer([3, 3, 3, 4], ["a", "b", "c", "d", "e", "f"])
+
+        self.assertEqual(tree, Graph("abcdef", [("a", "d"), ("b", "d"), ("c", "d"), ("d", "e"), ("e", "f")]))
+
+    def test_round_trip(self):
+        rng = random.Random(0)
+        for n in range(1, 40):
+            vertices = list(range(n))
+            rng.shuffle(vertices)
+            prufer = rng.choices(range(n), k=n - 2) if n > 2 else []
+
+            self.assertEqual(prufer_from_tree(tree_from_prufer(prufer, vertices), vertices), prufer)
+
+
+class TestRandomTrees(unittest.TestCase):
+    def test_graphs(self):
+        trees = list(random_trees(list(range(10)), 5, random.Random(0)))
+
+        self.assertEqual(len(trees), 5)
+        for tree in trees:
+            self.assertEqual(tree.nb_edges, 9)
+            self.assertEqual(len(connected_parts(tree)), 1)
+
+    def test_parent_arrays(self):
+        vertices = list(range(10))
+        for parent, tree in zip(random_trees(vertices, 5, random.Random(0), parent_arrays=True),
+                                random_trees(vertices, 5, random.Random(0))):
+            self.assertEqual(parent[9], -1)
+            self.assertEqual(Graph(vertices, [(i, parent[i]) for i in range(9)]), tree)
@@ -0,0 +1,170 @@
+import math
+import unittest
+
+from tbs.graph import MixedGraph, Graph, UNDIRECTED_EDGE, DIRECTED_EDGE, EDGE_ATTRIBUTE, mst_from_set
+
+
+class TestEdgeColumns(unittest.TestCase):
+    def setUp(self):
+        self.g = MixedGraph(range(4), undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3), (0, 3)])
+        self.g.add_edge_column("weight")
+        self.edges = [(0, 1), (1, 2), (2, 3), (0, 3)]
+
+    def test_ids(self):
+        ids = [self.g.edge_id(x, y) for x, y in self.edges]
+        self.assertEqual(sorted(ids), [0, 1, 2, 3])
+        self.assertEqual(self.g.edge_id(1, 0), self.g.edge_id(0, 1))
+        with self.assertRaises(ValueError):
+            self.g.edge_id(3, 2)
+
+        self.g.update(UNDIRECTED_EDGE, [(0, 2)])
+        self.g.difference([(1, 2)])
+        self.assertEqual([self.g.edge_id(x, y) for x, y in [(0, 1), (2, 3), (0, 3)]], [ids[0], ids[2], ids[3]])
+        self.assertEqual(self.g.edge_id(0, 2), 4)
+
+    def test_values(self):
+        self.assertEqual(self.g.edge_columns, ("weight",))
+        self.assertTrue(all(math.isnan(value) for value in self.g.edge_values("weight", self.edges)))
+
+        self.g.set_edge_values("weight", self.edges, [1, 2, 3, 4])
+        self.assertEqual(list(self.g.edge_values("weight", [(2, 1), (0, 3)])), [2, 4])
+        self.assertEqual(self.g.edge_column("weight")[self.g.edge_id(2, 3)], 3)
+
+        self.g.add_edge_column("count", "i")
+        self.assertEqual(list(self.g.edge_values("count", self.edges)), [0, 0, 0, 0])
+
+        with self.assertRaises(ValueError):
+            self.g.set_edge_values("weight", self.edges, [1])
+        with self.assertRaises(ValueError):
+            self.g.edge_values("unknown", self.edges)
+        with self.assertRaises(ValueError):
+            self.g.add_edge_column("weight")
+        with self.assertRaises(ValueError):
+            self.g.add_edge_column(EDGE_ATTRIBUTE)
+
+        self.g.remove_edge_column("count")
+        self.assertEqual(self.g.edge_columns, ("weight",))
+
+    def test_removed_edges(self):
+        self.g.set_edge_values("weight", self.edges, [1, 2, 3, 4])
+        self.g.remove(2)
+        self.g.update(DIRECTED_EDGE, [(1, 3)])
+
+        self.assertTrue(math.isnan(self.g.edge_values("weight", [(1, 3)])[0]))
+        self.assertEqual(list(self.g.edge_values("weight", [(0, 1), (0, 3)])), [1, 4])
+
+    def test_transaction(self):
+        self.g.set_edge_values("weight", self.edges, [1, 2, 3, 4])
+        ids = [self.g.edge_id(x, y) for x, y in self.edges]
+
+        self.g.begin()
+        self.g.remove(2)
+        self.g.update(UNDIRECTED_EDGE, [(1, 3), (0, 3)])
+        self.g.rollback()
+
+        self.assertEqual([self.g.edge_id(x, y) for x, y in self.edges], ids)
+        self.assertEqual(list(self.g.edge_values("weight", self.edges)), [1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            self.g.edge_id(1, 3)
+
+        self.g.begin()
+        self.g.difference([(0, 1)])
+        self.g.update(UNDIRECTED_EDGE, [(0, 1)])
+        self.g.set_edge_values("weight", [(0, 1)], [10])
+        self.g.rollback()
+
+        self.assertEqual(self.g.edge_id(0, 1), ids[0])
+        self.assertEqual(list(self.g.edge_values("weight", self.edges)), [1, 2, 3, 4])
+        self.assertEqual(len(self.g.edge_column("weight")), 6)
+
+        self.g.begin()
+        self.g.difference([(0, 1)])
+        self.g.update(UNDIRECTED_EDGE, [(0, 1)])
+        self.g.set_edge_values("weight", [(0, 1)], [10])
+        self.g.begin()
+        self.g.difference([(0, 1)])
+        self.g.rollback()
+        self.assertEqual(list(self.g.edge_values("weight", [(0, 1)])), [10])
+        self.g.rollback()
+
+        self.assertEqual(self.g.edge_id(0, 1), ids[0])
+        self.assertEqual(list(self.g.edge_values("weight", self.edges)), [1, 2, 3, 4])
+        self.assertEqual(len(self.g.edge_column("weight")), 6)
+
+        self.g.begin()
+        self.g.set_edge_values("weight", self.edges[1:], [5, 6, 7])
+        self.g.rollback()
+        self.assertEqual(list(self.g.edge_values("weight", self.edges)), [1, 2, 3, 4])
+
+        self.g.begin()
+        self.g.remove(2)
+        self.g.commit()
+        self.assertEqual(len(self.g.edge_column("weight")), 6)
+        self.g.update(UNDIRECTED_EDGE, [(1, 3), (0, 2), (2, 3)])
+        self.assertEqual(len(self.g.edge_column("weight")), 6)
+
+    def test_columns_created_in_transaction(self):
+        g = MixedGraph(range(3), undirected_edges=[(0, 1)])
+        g.begin()
+        g.update(UNDIRECTED_EDGE, [(1, 2)])
+        g.begin()
+        g.update(UNDIRECTED_EDGE, [(0, 2)])
+        g.add_edge_column("weight")
+        g.difference([(0, 1)])
+        g.rollback()
+
+        self.assertEqual(len({g.edge_id(x, y) for x, y in [(0, 1), (1, 2)]}), 2)
+        with self.assertRaises(ValueError):
+            g.edge_id(0, 2)
+
+        g.rollback()
+        g.update(UNDIRECTED_EDGE, [(0, 2)])
+        self.assertEqual(len({g.edge_id(x, y) for x, y in [(0, 1), (0, 2)]}), 2)
+        self.assertEqual(len(g.edge_column("weight")), 3)
+        with self.assertRaises(ValueError):
+            g.edge_id(1, 2)
+
+    def test_copy(self):
+        g = self.g.copy()
+        g.set_edge_values("weight", [(0, 1)], [7])
+
+        self.assertEqual(g.edge_values("weight", [(0, 1)])[0], 7)
+        self.assertTrue(math.isnan(self.g.edge_values("weight", [(0, 1)])[0]))
+
+    def test_path(self):
+        self.g.set_edge_values("weight", self.edges, [1, 1, 1, 5])
+        self.assertEqual(self.g.path(0, 3, "weight"), [0, 1, 2, 3])
+
+        self.g.set_edge_values("weight", [(0, 3)], [2])
+        self.assertEqual(self.g.path(0, 3, "weight"), [0, 3])
+        self.assertEqual(self.g.shortest_path_tree(0, "weight").distance(2), 2)
+
+        with self.assertRaises(ValueError):
+            self.g.path(0, 3, "unknown")
+
+    def test_mst(self):
+        g = Graph(range(4), [(0, 1), (1, 2), (2, 3), (0, 3), (0, 2)])
+        g.add_edge_column("weight")
+        g.set_edge_values("weight", [(0, 1), (1, 2), (2, 3), (0, 3), (0, 2)], [1, 5, 1, 1, 2])
+
+        mst = mst_from_set(list(g), "weight", graph=g)
+        self.assertEqual(mst.edges, {frozenset(edge) for edge in [(0, 1), (2, 3), (0, 3)]})
+
+        g = MixedGraph(range(3), [(0, 1), (1, 2)], [(2, 0)])
+        g.add_edge_column("weight")
+        g.set_edge_values("weight", [(0, 1), (1, 2), (2, 0)], [5, 1, 2])
+
+        mst = mst_from_set([0, 1, 2, 3], "weight", root=0, graph=g)
+        self.assertEqual(mst.edges, {frozenset(edge) for edge in [(0, 2), (1, 2), (0, 3)]})
+
+        with self.assertRaises(ValueError):
+            mst_from_set([0, 1, 2], "weight")
+
+    def test_from_dissimilarity(self):
+        elements = [0, 1, 5]
+        dissimilarity = type("Dissimilarity", (object,), {"__iter__": lambda self: iter(elements),
+                                                           "__call__": lambda self, x, y: abs(x - y)})()
+
+        g = Graph.from_dissimilarity(dissimilarity, threshold=4, column="dissimilarity")
+        self.assertEqual(list(g.edge_values("dissimilarity", [(0, 1), (1, 5)])), [1, 4])
+        self.assertEqual(g[1, 5], 4)
@@ -0,0 +1,81 @@
+import unittest
+
+from tbs.graph import MixedGraph, DirectedGraph, Graph, UNDIRECTED_EDGE, DIRECTED_EDGE, dfs, bfs, topological_sort, \
+    direct_acyclic_graph_to_direct_comparability_graph
+
+
+class TestFrozenMixedGraph(unittest.TestCase):
+    def setUp(self):
+        self.g = MixedGraph({0, 1, 2, 3, 4}, undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3), (4, 3)])
+        self.frozen = self.g.freeze()
+
+    def test_same_graph(self):
+        self.assertEqual(self.frozen.vertices, self.g.vertices)
+        self.assertEqual(self.frozen.edges, tuple(self.g.edges))
+        self.assertEqual(len(self.frozen), len(self.g))
+        self.assertEqual(self.frozen.nb_edges, self.g.nb_edges)
+        self.assertEqual(set(self.frozen), set(self.g))
+
+    def test_neighborhood(self):
+        for x in self.g:
+            for undirected in (True, False):
+                for begin in (True, False):
+                    for end in (True, False):
+                        self.assertEqual(self.frozen(x, undirected=undirected, begin=begin, end=end),
+                                         self.g(x, undirected=undirected, begin=begin, end=end))
+            self.assertEqual(self.frozen(x, closed=True), self.g(x, closed=True))
+            self.assertEqual(self.frozen.degree(x), self.g.degree(x))
+
+    def test_neighbors_view(self):
+        for x in self.g:
+            for undirected in (True, False):
+                for begin in (True, False):
+                    for end in (True, False):
+                        for closed in (True, False):
+                            view = self.frozen.neighbors_view(x, undirected=undirected, begin=begin, end=end,
+                                                              closed=closed)
+                            expected = self.g(x, undirected=undirected, begin=begin, end=end, closed=closed)
+                            self.assertEqual(view, expected)
+                            self.assertEqual(len(view), len(expected))
+                            self.assertEqual(len(list(view)), len(expected))
+                            for y in self.g:
+                                self.assertEqual(y in view, y in expected)
+        self.assertNotIn("not a vertex", self.frozen.neighbors_view(1))
+
+    def test_isa_edge(self):
+        for x in self.g:
+            for y in self.g:
+                self.assertEqual(self.frozen.isa_edge(x, y), self.g.isa_edge(x, y))
+                self.assertEqual(self.frozen.isa_edge(x, y, UNDIRECTED_EDGE), self.g.isa_edge(x, y, UNDIRECTED_EDGE))
+                self.assertEqual(self.frozen.isa_edge(x, y, DIRECTED_EDGE), self.g.isa_edge(x, y, DIRECTED_EDGE))
+
+    def test_not_a_vertex(self):
+        with self.assertRaises(ValueError):
+            self.frozen(5)
+
+    def test_csr(self):
+        indptr, indices = self.frozen.csr(DIRECTED_EDGE, dual=True)
+        i = self.frozen.vertex_id(3)
+        self.assertEqual({self.frozen.vertex(j) for j in indices[indptr[i]:indptr[i + 1]]}, {2, 4})
+
+    def test_frozen_is_independent(self):
+        self.g.update(UNDIRECTED_EDGE, [(3, 4)])
+        self.assertFalse(self.frozen.isa_edge(3, 4))
+
+    def test_traversals(self):
+        g = Graph(range(6), [(0, 1), (1, 2), (3, 4)])
+        frozen = g.freeze()
+        key = lambda x: x
+
+        self.assertEqual(dfs(frozen, key=key), dfs(g, key=key))
+        self.assertEqual(bfs(frozen, key=key), bfs(g, key=key))
+
+    def test_dag(self):
+        dag = DirectedGraph(range(4), [(0, 1), (1, 2), (0, 3)])
+        frozen = dag.freeze()
+        order = topological_sort(frozen)
+        for x, y in dag.edges:
+            self.assertLess(order.index(x), order.index(y))
+
+        self.assertEqual(direct_acyclic_graph_to_direct_comparability_graph(frozen),
+                         direct_acyclic_graph_to_direct_comparability_graph(dag))
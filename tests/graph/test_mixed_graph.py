@@ -0,0 +1,176 @@
+import unittest
+
+from tbs.graph import MixedGraph, UNDIRECTED_EDGE, DIRECTED_EDGE
+
+
+class TestEdgesCache(unittest.TestCase):
+    def test_edges_cached(self):
+        g = MixedGraph({0, 1, 2}, undirected_edges=[(0, 1)], directed_edges=[(1, 2)])
+
+        self.assertIs(g.edges, g.edges)
+        self.assertEqual(g.edges, (frozenset([frozenset([0, 1])]), frozenset([(1, 2)])))
+
+    def test_edges_invalidated(self):
+        g = MixedGraph({0, 1, 2}, undirected_edges=[(0, 1)])
+        undirected, directed = g.edges
+
+        version = g.version
+        g.update(DIRECTED_EDGE, [(1, 2)])
+        self.assertGreater(g.version, version)
+        self.assertEqual(g.edges, (undirected, frozenset([(1, 2)])))
+
+        g.difference([(0, 1)])
+        self.assertEqual(g.edges, (frozenset(), frozenset([(1, 2)])))
+
+        g.update(UNDIRECTED_EDGE, [(1, 2)])
+        self.assertEqual(g.edges, (frozenset([frozenset([1, 2])]), frozenset()))
+
+        g.remove(2)
+        g.add(3)
+        self.assertEqual(g.edges, (frozenset(), frozenset()))
+
+
+class TestCopy(unittest.TestCase):
+    def test_copy_is_equal(self):
+        g = MixedGraph({0, 1, 2, 3}, undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3)])
+
+        self.assertEqual(g.copy(), g)
+
+    def test_copy_is_independent(self):
+        g = MixedGraph({0, 1, 2, 3}, undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3)])
+        h = g.copy()
+
+        h.update(DIRECTED_EDGE, [(0, 3)])
+        h.remove(1)
+        h[2, 3] = "attribute"
+        self.assertEqual(g, MixedGraph({0, 1, 2, 3}, undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3)]))
+        self.assertIsNone(g[2, 3])
+
+        g.difference([(0, 1)])
+        g.update(UNDIRECTED_EDGE, [(0, 3)])
+        self.assertEqual(h, MixedGraph({0, 2, 3}, directed_edges=[(2, 3), (0, 3)]))
+        self.assertEqual(h[2, 3], "attribute")
+
+
+class TestTransaction(unittest.TestCase):
+    def setUp(self):
+        self.g = MixedGraph({0, 1, 2, 3}, undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3)])
+        self.g[0, 1] = "attribute"
+        self.expected = MixedGraph({0, 1, 2, 3}, undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3)])
+
+    def test_rollback(self):
+        self.g.begin()
+        self.g.update(DIRECTED_EDGE, [(1, 2), (0, 4)])
+        self.g.update(UNDIRECTED_EDGE, [(2, 3)])
+        self.g[0, 1] = "other"
+        self.g.remove(1)
+        self.g.add(5)
+        self.g.difference([(0, 4)])
+        self.g.rollback()
+
+        self.assertEqual(self.g, self.expected)
+        self.assertEqual(self.g[0, 1], "attribute")
+        self.assertEqual(self.g(2, undirected=False, begin=False, end=True), frozenset())
+        self.assertEqual(self.g(3, undirected=False, begin=False, end=True), frozenset([2]))
+
+    def test_commit(self):
+        self.g.begin()
+        self.g.remove(3)
+        self.g.commit()
+
+        self.assertEqual(self.g, MixedGraph({0, 1, 2}, undirected_edges=[(0, 1), (1, 2)]))
+
+    def test_nested(self):
+        self.g.begin()
+        self.g.remove(3)
+        self.g.begin()
+        self.g.remove(0)
+        self.g.rollback()
+
+        self.assertEqual(self.g, MixedGraph({0, 1, 2}, undirected_edges=[(0, 1), (1, 2)]))
+        self.g.rollback()
+        self.assertEqual(self.g, self.expected)
+
+    def test_rollback_copy(self):
+        h = self.g.copy()
+        self.g.begin()
+        self.g.remove(1)
+        self.g.rollback()
+        self.g.remove(2)
+
+        self.assertEqual(h, self.expected)
+
+    def test_no_transaction(self):
+        with self.assertRaises(ValueError):
+            self.g.rollback()
+        with self.assertRaises(ValueError):
+            self.g.commit()
+
+
+class TestNeighborhoodView(unittest.TestCase):
+    def setUp(self):
+        self.g = MixedGraph({0, 1, 2, 3}, undirected_edges=[(0, 1)], directed_edges=[(0, 2), (2, 0), (3, 0)])
+
+    def test_same_as_call(self):
+        for undirected in (True, False):
+            for begin in (True, False):
+                for end in (True, False):
+                    for closed in (True, False):
+                        expected = self.g(0, undirected=undirected, begin=begin, end=end, closed=closed)
+                        view = self.g.neighbors_view(0, undirected=undirected, begin=begin, end=end, closed=closed)
+                        iterated = list(self.g.iter_neighbors(0, undirected=undirected, begin=begin, end=end,
+                                                              closed=closed))
+
+                        self.assertEqual(view, expected)
+                        self.assertEqual(len(view), len(expected))
+                        self.assertEqual(sorted(iterated), sorted(expected))
+
+    def test_view_is_live(self):
+        view = self.g.neighbors_view(1)
+        self.g.update(UNDIRECTED_EDGE, [(1, 3)])
+
+        self.assertIn(3, view)
+        self.assertEqual(view & {0, 2}, frozenset([0]))
+
+    def test_not_a_vertex(self):
+        with self.assertRaises(ValueError):
+            self.g.iter_neighbors(4)
+
+    def test_frozen(self):
+        frozen = self.g.freeze()
+        for x in self.g:
+            self.assertEqual(sorted(frozen.iter_neighbors(x, end=True, closed=True)),
+                             sorted(self.g.iter_neighbors(x, end=True, closed=True)))
+
+
+class TestVertices(unittest.TestCase):
+    def test_add_vertices(self):
+        g = MixedGraph({0})
+        g.add_vertices([1, 2, 3])
+
+        self.assertEqual(g.vertices, frozenset([0, 1, 2, 3]))
+
+    def test_add_vertices_error(self):
+        g = MixedGraph({0})
+        with self.assertRaises(ValueError):
+            g.add_vertices([1, 0])
+        with self.assertRaises(ValueError):
+            g.add_vertices([1, 1])
+
+        self.assertEqual(g.vertices, frozenset([0]))
+
+    def test_remove_vertices(self):
+        g = MixedGraph({0, 1, 2, 3}, undirected_edges=[(0, 1), (1, 2)], directed_edges=[(2, 3)])
+        g.remove_vertices([1, 3])
+
+        self.assertEqual(g, MixedGraph({0, 2}))
+        with self.assertRaises(ValueError):
+            g.remove_vertices([0, 1])
+        self.assertEqual(g.vertices, frozenset([0, 2]))
+
+    def test_vertices_view(self):
+        g = MixedGraph({0})
+        vertices = g.vertices
+        g.add(1)
+
+        self.assertEqual(vertices, frozenset([0, 1]))
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from tbs.graph import DirectedGraph, ReachabilityMatrix, direct_acyclic_graph_to_direct_comparability_graph, \
+    direct_comparability_graph_to_hase_diagram
+
+
+class TestReachabilityMatrix(unittest.TestCase):
+    def setUp(self):
+        self.dag = DirectedGraph(range(5), [(0, 1), (1, 2), (0, 3), (3, 2), (4, 2)])
+
+    def test_from_dag(self):
+        matrix = ReachabilityMatrix.from_dag(self.dag)
+
+        self.assertEqual(set(matrix.edges()), set(self.dag.edges))
+        self.assertEqual(matrix.nb_edges, 5)
+        for x, y in matrix.edges():
+            self.assertLess(matrix.index(x), matrix.index(y))
+        self.assertEqual(matrix.to_directed_graph(), self.dag)
+
+    def test_closure(self):
+        closure = ReachabilityMatrix.from_dag(self.dag).closure()
+
+        self.assertEqual(set(closure.edges()), {(0, 1), (0, 2), (0, 3), (1, 2), (3, 2), (4, 2)})
+        self.assertTrue(closure.isa_edge(0, 2))
+        self.assertFalse(closure.isa_edge(2, 0))
+        self.assertEqual(closure.successors(4), [2])
+
+    def test_reduction(self):
+        dag = DirectedGraph(range(5), [(0, 1), (1, 2), (0, 2), (0, 3), (3, 4), (0, 4), (1, 4)])
+        matrix = ReachabilityMatrix.from_dag(dag)
+
+        expected = {(0, 1), (1, 2), (0, 3), (3, 4), (1, 4)}
+        self.assertEqual(set(matrix.reduction().edges()), expected)
+        self.assertEqual(set(matrix.closure().reduction(closed=True).edges()), expected)
+
+    def test_cycle(self):
+        with self.assertRaises(TypeError):
+            ReachabilityMatrix.from_dag(DirectedGraph(range(2), [(0, 1), (1, 0)]))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ReachabilityMatrix([0, 1], [0b01, 0])
+        with self.assertRaises(ValueError):
+            ReachabilityMatrix([0, 0], [0, 0])
+        with self.assertRaises(ValueError):
+            ReachabilityMatrix([0, 1], [0b100, 0])
+
+
+class TestComparability(unittest.TestCase):
+    def test_random_dag(self):
+        rng = random.Random(0)
+        n = 30
+        dag = DirectedGraph(range(n), [(i, j) for i in range(n) for j in range(i + 1, n) if rng.random() < 0.1])
+
+        expected = set()
+        for x in dag:
+            stack = list(dag(x))
+            while stack:
+                y = stack.pop()
+                if (x, y) not in expected:
+                    expected.add((x, y))
+                    stack.extend(dag(y))
+
+        self.assertEqual(set(direct_acyclic_graph_to_direct_comparability_graph(dag).edges), expected)
+        self.assertEqual(set(direct_acyclic_graph_to_direct_comparability_graph(dag, as_matrix=True).edges()),
+                         expected)
+
+    def test_long_chain(self):
+        n = 3000
+        dag = DirectedGraph(range(n), [(i, i + 1) for i in range(n - 1)])
+
+        closure = direct_acyclic_graph_to_direct_comparability_graph(dag, as_matrix=True)
+        self.assertEqual(closure.nb_edges, n * (n - 1) // 2)
+
+
+class TestHaseDiagram(unittest.TestCase):
+    def test_random_poset(self):
+        rng = random.Random(1)
+        n = 30
+        dag = DirectedGraph(range(n), [(i, j) for i in range(n) for j in range(i + 1, n) if rng.random() < 0.2])
+        comparability = direct_acyclic_graph_to_direct_comparability_graph(dag)
+
+        expected = {(x, y) for x, y in comparability.edges
+                    if comparability(x).isdisjoint(comparability(y, begin=False, end=True))}
+
+        self.assertEqual(set(direct_comparability_graph_to_hase_diagram(comparability).edges), expected)
+        self.assertEqual(set(direct_comparability_graph_to_hase_diagram(
+            direct_acyclic_graph_to_direct_comparability_graph(dag, as_matrix=True), as_matrix=True).edges()),
+            expected)
+
+    def test_loops(self):
+        comparability = DirectedGraph(range(3), [(0, 0), (0, 1), (1, 2), (0, 2), (2, 2)])
+
+        self.assertEqual(direct_comparability_graph_to_hase_diagram(comparability),
+                         DirectedGraph(range(3), [(0, 1), (1, 2)]))
@@ -0,0 +1,136 @@
+import random
+import unittest
+
+from tbs.graph import MixedGraph, Graph, DirectedGraph, EDGE_ATTRIBUTE, DIRECTED_EDGE, shortest_path_forest, \
+    all_pairs_distances
+
+
+class TestPath(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        n = 30
+        self.g = MixedGraph(range(n), undirected_edges=[(rng.randrange(n), rng.randrange(n)) for i in range(30)],
+                            directed_edges=[(rng.randrange(n), rng.randrange(n)) for i in range(30)])
+        self.g.difference([(x, x) for x in range(n)])
+        self.weights = {edge: rng.randint(0, 10) for edge in
+                        [(u, v) for u in self.g for v in self.g.iter_neighbors(u)]}
+        self.valuation = lambda u, v: self.weights[u, v] if (u, v) in self.weights else self.weights[v, u]
+
+    def length(self, path, valuation):
+        return sum(valuation(u, v) for u, v in zip(path, path[1:]))
+
+    def test_algorithms_agree(self):
+        for y in self.g:
+            unit = self.g.path(0, y)
+            bellman_ford = self.g.path(0, y, lambda u, v: 1, negative_valuation=True)
+            self.assertEqual(len(unit), len(bellman_ford))
+
+            dijkstra = self.g.path(0, y, self.valuation)
+            bellman_ford = self.g.path(0, y, self.valuation, negative_valuation=True)
+            self.assertEqual(self.length(dijkstra, self.valuation), self.length(bellman_ford, self.valuation))
+            self.assertEqual(bool(dijkstra), bool(unit))
+            if dijkstra:
+                self.assertEqual((dijkstra[0], dijkstra[-1]), (0, y))
+                for u, v in zip(dijkstra, dijkstra[1:]):
+                    self.assertIn(v, self.g(u))
+
+    def test_edge_attribute(self):
+        g = Graph(range(4), [(0, 1), (1, 2), (0, 3), (3, 2)])
+        g[0, 1], g[1, 2], g[0, 3], g[3, 2] = 1, 1, 1, 5
+
+        self.assertEqual(g.path(0, 2, EDGE_ATTRIBUTE), [0, 1, 2])
+        self.assertEqual(g.path(0, 2, EDGE_ATTRIBUTE, forbidden_vertices={1}), [0, 3, 2])
+        self.assertEqual(g.path(0, 2, EDGE_ATTRIBUTE, forbidden_vertices={1, 3}), [])
+        self.assertEqual(g.path(0, 0), [0])
+
+    def test_not_a_vertex(self):
+        g = Graph(range(3), [(0, 1), (1, 2)])
+
+        self.assertEqual(g.path(5, 1), [])
+        self.assertEqual(g.path(5, 1, EDGE_ATTRIBUTE), [])
+        self.assertEqual(g.path(0, 5), [])
+        self.assertEqual(g.path(5, 5), [5])
+
+    def test_negative(self):
+        g = DirectedGraph(range(3), [(0, 1), (1, 2), (0, 2)])
+        valuation = lambda u, v: -3 if (u, v) == (1, 2) else 1
+
+        with self.assertRaises(ValueError):
+            g.path(0, 2, valuation)
+        self.assertEqual(g.path(0, 2, valuation, negative_valuation=True), [0, 1, 2])
+
+        g.update([(2, 0)])
+        with self.assertRaises(Exception):
+            g.path(0, 2, valuation, negative_valuation=True)
+
+    def test_multi_source(self):
+        g = Graph(range(5), [(0, 1), (1, 2), (2, 3), (3, 4)])
+        dist, father = shortest_path_forest(g, [0, 4])
+
+        self.assertEqual(dist, {0: 0, 1: 1, 2: 2, 3: 1, 4: 0})
+
+
+def _weight(u, v):
+    return abs(u - v)
+
+
+class TestShortestPathTree(unittest.TestCase):
+    def setUp(self):
+        self.g = MixedGraph(range(6), undirected_edges=[(0, 1), (1, 2), (3, 4)], directed_edges=[(2, 5), (0, 5)])
+
+    def test_tree(self):
+        tree = self.g.shortest_path_tree(0)
+
+        self.assertEqual(tree.sources, frozenset([0]))
+        self.assertEqual(set(tree), {0, 1, 2, 5})
+        self.assertEqual(tree.distance(2), 2)
+        self.assertEqual(tree.distance(3), float("inf"))
+        self.assertEqual(tree.path(5), [0, 5])
+        self.assertEqual(tree.path(3), [])
+        self.assertEqual(tree.father(0), 0)
+        with self.assertRaises(ValueError):
+            tree.father(3)
+
+        self.assertEqual(self.g.shortest_path_tree([0, 3]).distance(4), 1)
+
+    def test_cache(self):
+        tree = self.g.shortest_path_tree(0, _weight)
+        self.assertIs(self.g.shortest_path_tree(0, _weight), tree)
+        self.assertEqual(self.g.path(0, 5, _weight), [0, 5])
+
+        self.g.update(DIRECTED_EDGE, [(1, 5)])
+        self.assertIsNot(self.g.shortest_path_tree(0, _weight), tree)
+        self.assertEqual(self.g.shortest_path_tree(0).path(5), [0, 5])
+        self.assertEqual(self.g.path(2, 5), [2, 5])
+
+        copy = self.g.copy()
+        self.assertIsNot(copy.shortest_path_tree(0, _weight), self.g.shortest_path_tree(0, _weight))
+
+    def test_distance_matrix(self):
+        matrix = self.g.distance_matrix(_weight)
+        self.assertIs(self.g.distance_matrix(_weight), matrix)
+
+        for x in self.g:
+            tree = self.g.shortest_path_tree(x, _weight)
+            self.assertEqual(list(matrix.row(x)), [tree.distance(y) for y in matrix.vertices])
+        self.assertEqual(matrix.distance(5, 0), float("inf"))
+
+        self.g.remove(5)
+        self.assertEqual(len(self.g.distance_matrix(_weight)), 5)
+
+    def test_in_process_keeps_no_state(self):
+        from tbs.graph import _shortest_path
+
+        inner = []
+        weight = lambda u, v: inner.append(all_pairs_distances(Graph(range(2), [(0, 1)]))) or 1
+        matrix = all_pairs_distances(self.g, weight)
+
+        self.assertEqual(matrix.rows, all_pairs_distances(self.g).rows)
+        self.assertEqual(len(inner[0]), 2)
+        self.assertIsNone(_shortest_path._worker_state)
+
+    def test_parallel(self):
+        self.g.shortest_path_tree(0, lambda u, v: 1)
+        parallel = all_pairs_distances(self.g, _weight, workers=2, chunksize=2)
+
+        self.assertEqual(parallel.rows, all_pairs_distances(self.g, _weight).rows)
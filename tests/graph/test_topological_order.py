@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from tbs.graph import DirectedGraph, topological_sort, IncrementalTopologicalOrder
+
+
+class TestTopologicalSort(unittest.TestCase):
+    def test_order(self):
+        dag = DirectedGraph(range(5), [(0, 1), (1, 2), (0, 3), (3, 2), (4, 2)])
+        order = topological_sort(dag)
+
+        self.assertEqual(sorted(order), list(range(5)))
+        for x, y in dag.edges:
+            self.assertLess(order.index(x), order.index(y))
+
+    def test_key(self):
+        dag = DirectedGraph(range(5), [(0, 1), (1, 2), (0, 3), (3, 2), (4, 2)])
+
+        self.assertEqual(topological_sort(dag, key=lambda x: -x), [4, 0, 3, 1, 2])
+
+    def test_long_chain(self):
+        n = 20000
+        dag = DirectedGraph(range(n), [(i + 1, i) for i in range(n - 1)])
+
+        self.assertEqual(topological_sort(dag), list(reversed(range(n))))
+
+    def test_cycle(self):
+        with self.assertRaises(TypeError):
+            topological_sort(DirectedGraph(range(3), [(0, 1), (1, 2), (2, 0)]))
+
+
+class TestIncrementalTopologicalOrder(unittest.TestCase):
+    def assert_valid(self, order, edges):
+        for x, y in edges:
+            self.assertLess(order.position(x), order.position(y))
+        self.assertEqual([order.position(x) for x in order], list(range(len(order))))
+
+    def test_random_insertions(self):
+        rng = random.Random(0)
+        n = 40
+        order = IncrementalTopologicalOrder()
+        for x in range(n):
+            order.add(x)
+
+        edges = []
+        for i in range(300):
+            x, y = rng.sample(range(n), 2)
+            try:
+                order.add_edge(x, y)
+            except TypeError:
+                continue
+            edges.append((x, y))
+
+        self.assert_valid(order, edges)
+
+    def test_cycle(self):
+        order = IncrementalTopologicalOrder(DirectedGraph(range(3), [(0, 1), (1, 2)]))
+
+        with self.assertRaises(TypeError):
+            order.add_edge(2, 0)
+        with self.assertRaises(TypeError):
+            order.add_edge(1, 1)
+        order.add_edge(0, 2)
+        self.assert_valid(order, [(0, 1), (1, 2), (0, 2)])